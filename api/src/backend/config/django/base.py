@@ -249,6 +249,8 @@ X_FRAME_OPTIONS = "DENY"
 SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 
 DJANGO_DELETION_BATCH_SIZE = env.int("DJANGO_DELETION_BATCH_SIZE", 5000)
+# Number of findings stored by the scans with each bulk query
+DJANGO_SCAN_BATCH_SIZE = env.int("DJANGO_SCAN_BATCH_SIZE", 1000)
 
 # SAML requirement
 CSRF_COOKIE_SECURE = True
@@ -4,6 +4,7 @@ from copy import deepcopy
 from datetime import datetime, timezone
 
 from celery.utils.log import get_task_logger
+from config.django.base import DJANGO_SCAN_BATCH_SIZE
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
 from django.db import IntegrityError, OperationalError
 from django.db.models import Case, Count, IntegerField, Sum, When
@@ -19,8 +20,10 @@ from api.models import (
     Finding,
     Provider,
     Resource,
+    ResourceFindingMapping,
     ResourceScanSummary,
     ResourceTag,
+    ResourceTagMapping,
     Scan,
     ScanSummary,
     StateChoices,
@@ -100,6 +103,246 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _get_last_findings_status(
+    tenant_id: str, finding_uids: list[str]
+) -> dict[str, tuple[str | None, datetime | None]]:
+    """
+    Get the status and first seen date of the most recent finding of each of the given finding UIDs, in a single query.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the findings.
+        finding_uids (list[str]): The UIDs of the findings.
+
+    Returns:
+        dict: The (status, first_seen_at) tuple of each finding UID, (None, None) for the UIDs without previous findings.
+    """
+    last_findings_status = dict.fromkeys(finding_uids, (None, None))
+    with rls_transaction(tenant_id):
+        most_recent_findings = (
+            Finding.all_objects.filter(tenant_id=tenant_id, uid__in=finding_uids)
+            .order_by("uid", "-inserted_at")
+            .distinct("uid")
+            .values("uid", "status", "first_seen_at")
+        )
+        for most_recent_finding in most_recent_findings:
+            last_findings_status[most_recent_finding["uid"]] = (
+                most_recent_finding["status"],
+                most_recent_finding["first_seen_at"],
+            )
+    return last_findings_status
+
+
+def _store_resources_in_bulk(
+    findings: list[ProwlerFinding],
+    tenant_id: str,
+    provider_instance: Provider,
+    resource_cache: dict[str, Resource],
+    tag_cache: dict[tuple[str, str], ResourceTag],
+) -> list[Resource]:
+    """
+    Store the resources of a batch of findings, including their tags, in the database with bulk queries.
+
+    The resources and tags not in the caches are fetched or created in bulk, then the fields of all the
+    resources are updated with the values of their last finding, and the tags are mapped to them.
+
+    Args:
+        findings (list[ProwlerFinding]): The findings of the batch.
+        tenant_id (str): The ID of the tenant owning the resources.
+        provider_instance (Provider): The provider instance associated with the resources.
+        resource_cache (dict[str, Resource]): The resources of the scan by UID, updated with the new resources.
+        tag_cache (dict[tuple[str, str], ResourceTag]): The tags of the scan by key and value, updated with the new tags.
+
+    Returns:
+        list[Resource]: The resource of each finding, in the same order as the findings.
+    """
+    new_resource_uids = {
+        finding.resource_uid
+        for finding in findings
+        if finding.resource_uid not in resource_cache
+    }
+    new_tags = {
+        (key, value)
+        for finding in findings
+        for key, value in finding.resource_tags.items()
+        if (key, value) not in tag_cache
+    }
+
+    with rls_transaction(tenant_id):
+        if new_resource_uids:
+            for resource_instance in Resource.objects.filter(
+                tenant_id=tenant_id,
+                provider=provider_instance,
+                uid__in=new_resource_uids,
+            ):
+                resource_cache[resource_instance.uid] = resource_instance
+            missing_resources = {}
+            for finding in findings:
+                if (
+                    finding.resource_uid not in resource_cache
+                    and finding.resource_uid not in missing_resources
+                ):
+                    missing_resources[finding.resource_uid] = Resource(
+                        tenant_id=tenant_id,
+                        provider=provider_instance,
+                        uid=finding.resource_uid,
+                        region=finding.region,
+                        service=finding.service_name,
+                        type=finding.resource_type,
+                        name=finding.resource_name,
+                    )
+            if missing_resources:
+                Resource.objects.bulk_create(
+                    missing_resources.values(), ignore_conflicts=True
+                )
+                # The resources created meanwhile by another scan are not created, so they are read back
+                for resource_instance in Resource.objects.filter(
+                    tenant_id=tenant_id,
+                    provider=provider_instance,
+                    uid__in=missing_resources.keys(),
+                ):
+                    resource_cache[resource_instance.uid] = resource_instance
+
+        if new_tags:
+            ResourceTag.objects.bulk_create(
+                [
+                    ResourceTag(tenant_id=tenant_id, key=key, value=value)
+                    for key, value in new_tags
+                ],
+                ignore_conflicts=True,
+            )
+            for tag_instance in ResourceTag.objects.filter(
+                tenant_id=tenant_id,
+                key__in={key for key, _ in new_tags},
+                value__in={value for _, value in new_tags},
+            ):
+                tag_key = (tag_instance.key, tag_instance.value)
+                if tag_key in new_tags:
+                    tag_cache[tag_key] = tag_instance
+
+    # Update resource fields, the last finding of each resource prevails
+    resource_instances = []
+    updated_resources = {}
+    tag_mappings = {}
+    for finding in findings:
+        resource_instance = resource_cache[finding.resource_uid]
+        if finding.region:
+            resource_instance.region = finding.region
+        resource_instance.service = finding.service_name
+        resource_instance.type = finding.resource_type
+        resource_instance.metadata = json.dumps(
+            finding.resource_metadata, cls=CustomEncoder
+        )
+        resource_instance.details = finding.resource_details
+        resource_instance.partition = finding.partition
+        resource_instance.updated_at = datetime.now(tz=timezone.utc)
+        updated_resources[resource_instance.uid] = resource_instance
+        for key, value in finding.resource_tags.items():
+            tag_instance = tag_cache[(key, value)]
+            tag_mappings[(resource_instance.id, tag_instance.id)] = ResourceTagMapping(
+                tenant_id=tenant_id, resource=resource_instance, tag=tag_instance
+            )
+        resource_instances.append(resource_instance)
+
+    with rls_transaction(tenant_id):
+        # Sorted, so concurrent scans lock the shared resources in the same order
+        Resource.all_objects.bulk_update(
+            sorted(updated_resources.values(), key=lambda resource: resource.uid),
+            fields=[
+                "region",
+                "service",
+                "type",
+                "metadata",
+                "details",
+                "partition",
+                "updated_at",
+            ],
+        )
+        if tag_mappings:
+            ResourceTagMapping.objects.bulk_create(
+                tag_mappings.values(), ignore_conflicts=True
+            )
+
+    return resource_instances
+
+
+def _store_findings_in_bulk(
+    findings: list[ProwlerFinding],
+    resource_instances: list[Resource],
+    tenant_id: str,
+    scan_instance: Scan,
+    last_status_cache: dict[str, tuple[str | None, datetime | None]],
+) -> list[Finding]:
+    """
+    Store a batch of findings and their resource mappings in the database with bulk queries.
+
+    Args:
+        findings (list[ProwlerFinding]): The findings of the batch.
+        resource_instances (list[Resource]): The resource of each finding, in the same order as the findings.
+        tenant_id (str): The ID of the tenant owning the findings.
+        scan_instance (Scan): The scan instance the findings belong to.
+        last_status_cache (dict): The (status, first_seen_at) of the most recent finding of each finding UID,
+            updated with the UIDs of the batch.
+
+    Returns:
+        list[Finding]: The findings created.
+    """
+    new_finding_uids = list(
+        {finding.uid for finding in findings if finding.uid not in last_status_cache}
+    )
+    if new_finding_uids:
+        last_status_cache.update(_get_last_findings_status(tenant_id, new_finding_uids))
+
+    finding_instances = []
+    resource_finding_mappings = []
+    for finding, resource_instance in zip(findings, resource_instances):
+        last_status, last_first_seen_at = last_status_cache[finding.uid]
+        status = FindingStatus[finding.status]
+        delta = _create_finding_delta(last_status, status)
+        # For the findings prior to the change, when a first finding is found with delta!="new" it will be
+        # assigned a current date as first_seen_at and the successive findings with the same UID will
+        # always get the date of the previous finding.
+        # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
+        # attribute will be assigned the current date, the following findings will get that date.
+        if not last_first_seen_at:
+            last_first_seen_at = datetime.now(tz=timezone.utc)
+
+        finding_instance = Finding(
+            tenant_id=tenant_id,
+            uid=finding.uid,
+            delta=delta,
+            check_metadata=finding.get_metadata(),
+            status=status,
+            status_extended=finding.status_extended,
+            severity=finding.severity,
+            impact=finding.severity,
+            raw_result=finding.raw,
+            check_id=finding.check_id,
+            scan=scan_instance,
+            first_seen_at=last_first_seen_at,
+            muted=finding.muted,
+            compliance=finding.compliance,
+            # Denormalized resource data, as Finding.add_resources does
+            resource_regions=[resource_instance.region],
+            resource_services=[resource_instance.service],
+            resource_types=[resource_instance.type],
+        )
+        finding_instances.append(finding_instance)
+        resource_finding_mappings.append(
+            ResourceFindingMapping(
+                tenant_id=tenant_id,
+                resource=resource_instance,
+                finding=finding_instance,
+            )
+        )
+
+    with rls_transaction(tenant_id):
+        Finding.objects.bulk_create(finding_instances)
+        ResourceFindingMapping.objects.bulk_create(
+            resource_finding_mappings, ignore_conflicts=True
+        )
+    return finding_instances
+
+
 def perform_prowler_scan(
     tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str] = None
 ):
@@ -161,147 +404,58 @@ def perform_prowler_scan(
         last_status_cache = {}
 
         for progress, findings in prowler_scan.scan():
+            check_findings = []
             for finding in findings:
                 if finding is None:
                     logger.error(f"None finding detected on scan {scan_id}.")
                     continue
+                check_findings.append(finding)
+
+            # The findings of each check are stored in batches, with a few bulk queries per batch
+            for index in range(0, len(check_findings), DJANGO_SCAN_BATCH_SIZE):
+                findings_batch = check_findings[index : index + DJANGO_SCAN_BATCH_SIZE]
                 for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
                     try:
-                        with rls_transaction(tenant_id):
-                            # Process resource
-                            resource_uid = finding.resource_uid
-                            if resource_uid not in resource_cache:
-                                # Get or create the resource
-                                resource_instance, _ = Resource.objects.get_or_create(
-                                    tenant_id=tenant_id,
-                                    provider=provider_instance,
-                                    uid=resource_uid,
-                                    defaults={
-                                        "region": finding.region,
-                                        "service": finding.service_name,
-                                        "type": finding.resource_type,
-                                        "name": finding.resource_name,
-                                    },
-                                )
-                                resource_cache[resource_uid] = resource_instance
-                            else:
-                                resource_instance = resource_cache[resource_uid]
-
-                        # Update resource fields if necessary
-                        updated_fields = []
-                        if (
-                            finding.region
-                            and resource_instance.region != finding.region
-                        ):
-                            resource_instance.region = finding.region
-                            updated_fields.append("region")
-                        if resource_instance.service != finding.service_name:
-                            resource_instance.service = finding.service_name
-                            updated_fields.append("service")
-                        if resource_instance.type != finding.resource_type:
-                            resource_instance.type = finding.resource_type
-                            updated_fields.append("type")
-                        if resource_instance.metadata != finding.resource_metadata:
-                            resource_instance.metadata = json.dumps(
-                                finding.resource_metadata, cls=CustomEncoder
-                            )
-                            updated_fields.append("metadata")
-                        if resource_instance.details != finding.resource_details:
-                            resource_instance.details = finding.resource_details
-                            updated_fields.append("details")
-                        if resource_instance.partition != finding.partition:
-                            resource_instance.partition = finding.partition
-                            updated_fields.append("partition")
-                        if updated_fields:
-                            with rls_transaction(tenant_id):
-                                resource_instance.save(update_fields=updated_fields)
+                        resource_instances = _store_resources_in_bulk(
+                            findings_batch,
+                            tenant_id,
+                            provider_instance,
+                            resource_cache,
+                            tag_cache,
+                        )
+                        break
                     except (OperationalError, IntegrityError) as db_err:
                         if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
                             logger.warning(
                                 f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
-                                f"detected when processing resource {resource_uid} on scan {scan_id}. Retrying..."
+                                f"detected when processing {len(findings_batch)} resources on scan {scan_id}. Retrying..."
                             )
                             time.sleep(0.1 * (2**attempt))
                             continue
                         else:
                             raise db_err
 
-                # Update tags
-                tags = []
-                with rls_transaction(tenant_id):
-                    for key, value in finding.resource_tags.items():
-                        tag_key = (key, value)
-                        if tag_key not in tag_cache:
-                            tag_instance, _ = ResourceTag.objects.get_or_create(
-                                tenant_id=tenant_id, key=key, value=value
-                            )
-                            tag_cache[tag_key] = tag_instance
-                        else:
-                            tag_instance = tag_cache[tag_key]
-                        tags.append(tag_instance)
-                    resource_instance.upsert_or_delete_tags(tags=tags)
-
-                unique_resources.add((resource_instance.uid, resource_instance.region))
-
-                # Process finding
-                with rls_transaction(tenant_id):
-                    finding_uid = finding.uid
-                    last_first_seen_at = None
-                    if finding_uid not in last_status_cache:
-                        most_recent_finding = (
-                            Finding.all_objects.filter(
-                                tenant_id=tenant_id, uid=finding_uid
-                            )
-                            .order_by("-inserted_at")
-                            .values("status", "first_seen_at")
-                            .first()
-                        )
-                        last_status = None
-                        if most_recent_finding:
-                            last_status = most_recent_finding["status"]
-                            last_first_seen_at = most_recent_finding["first_seen_at"]
-                        last_status_cache[finding_uid] = last_status, last_first_seen_at
-                    else:
-                        last_status, last_first_seen_at = last_status_cache[finding_uid]
-
-                    status = FindingStatus[finding.status]
-                    delta = _create_finding_delta(last_status, status)
-                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
-                    # assigned a current date as first_seen_at and the successive findings with the same UID will
-                    # always get the date of the previous finding.
-                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
-                    # attribute will be assigned the current date, the following findings will get that date.
-                    if not last_first_seen_at:
-                        last_first_seen_at = datetime.now(tz=timezone.utc)
-
-                    # Create the finding
-                    finding_instance = Finding.objects.create(
-                        tenant_id=tenant_id,
-                        uid=finding_uid,
-                        delta=delta,
-                        check_metadata=finding.get_metadata(),
-                        status=status,
-                        status_extended=finding.status_extended,
-                        severity=finding.severity,
-                        impact=finding.severity,
-                        raw_result=finding.raw,
-                        check_id=finding.check_id,
-                        scan=scan_instance,
-                        first_seen_at=last_first_seen_at,
-                        muted=finding.muted,
-                        compliance=finding.compliance,
+                _store_findings_in_bulk(
+                    findings_batch,
+                    resource_instances,
+                    tenant_id,
+                    scan_instance,
+                    last_status_cache,
+                )
+
+                for resource_instance in resource_instances:
+                    unique_resources.add(
+                        (resource_instance.uid, resource_instance.region)
                     )
-                    finding_instance.add_resources([resource_instance])
-
-                # Update scan resource summaries
-                scan_resource_cache.add(
-                    (
-                        str(resource_instance.id),
-                        resource_instance.service,
-                        resource_instance.region,
-                        resource_instance.type,
+                    # Update scan resource summaries
+                    scan_resource_cache.add(
+                        (
+                            str(resource_instance.id),
+                            resource_instance.service,
+                            resource_instance.region,
+                            resource_instance.type,
+                        )
                     )
-                )
 
             # Update scan progress
             with rls_transaction(tenant_id):
@@ -17,6 +17,7 @@ from api.models import (
     Finding,
     Provider,
     Resource,
+    ResourceTag,
     Severity,
     StateChoices,
     StatusChoices,
@@ -383,6 +384,112 @@ class TestPerformScan:
         assert resource == resource_instance
         assert resource_uid_tuple == (resource_instance.uid, resource_instance.region)
 
+    def test_perform_prowler_scan_bulk(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+        findings_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[1]
+        provider = providers_fixture[0]
+        previous_finding = findings_fixture[0]
+        previous_finding.refresh_from_db()
+        existing_resource = previous_finding.resources.first()
+
+        def build_finding(uid, resource_uid, status, resource_tags):
+            finding = MagicMock()
+            finding.uid = uid
+            finding.status = status
+            finding.status_extended = "test status extended"
+            finding.severity = Severity.medium
+            finding.check_id = "check1"
+            finding.get_metadata.return_value = {"key": "value"}
+            finding.resource_uid = resource_uid
+            finding.resource_name = "resource_name"
+            finding.region = "eu-west-1"
+            finding.service_name = "ec2"
+            finding.resource_type = "instance"
+            finding.resource_tags = resource_tags
+            finding.muted = False
+            finding.raw = {}
+            finding.resource_metadata = {"test": "metadata"}
+            finding.resource_details = "details"
+            finding.partition = "aws"
+            finding.compliance = {}
+            return finding
+
+        findings = [
+            build_finding(
+                previous_finding.uid,
+                existing_resource.uid,
+                StatusChoices.PASS,
+                {"key": "value"},
+            ),
+            build_finding(
+                "new_finding_uid_1",
+                "new_resource_uid",
+                StatusChoices.FAIL,
+                {"key": "value", "new_key": "new_value"},
+            ),
+            build_finding(
+                "new_finding_uid_2",
+                "new_resource_uid",
+                StatusChoices.PASS,
+                {"new_key": "new_value"},
+            ),
+        ]
+
+        with (
+            patch("tasks.jobs.scan.DJANGO_SCAN_BATCH_SIZE", 2),
+            patch("tasks.jobs.scan.initialize_prowler_provider"),
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+        ):
+            mock_prowler_scan_class.return_value.scan.return_value = [
+                (50, [findings[0], None]),
+                (100, findings[1:]),
+            ]
+
+            perform_prowler_scan(str(tenant.id), str(scan.id), str(provider.id))
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        assert scan.unique_resource_count == 2
+
+        scan_findings = {
+            finding.uid: finding for finding in Finding.objects.filter(scan=scan)
+        }
+        assert len(scan_findings) == 3
+
+        # The previous finding status and first seen date are prefetched
+        updated_finding = scan_findings[previous_finding.uid]
+        assert updated_finding.delta == Finding.DeltaChoices.CHANGED
+        assert updated_finding.first_seen_at == previous_finding.first_seen_at
+        assert list(updated_finding.resources.all()) == [existing_resource]
+        assert updated_finding.resource_regions == ["eu-west-1"]
+
+        assert scan_findings["new_finding_uid_1"].delta == Finding.DeltaChoices.NEW
+        assert scan_findings["new_finding_uid_2"].delta == Finding.DeltaChoices.NEW
+
+        # The resource of both findings is created once, across batches
+        new_resource = Resource.objects.get(provider=provider, uid="new_resource_uid")
+        assert new_resource.name == "resource_name"
+        assert new_resource.region == "eu-west-1"
+        assert new_resource.partition == "aws"
+        for finding_uid in ["new_finding_uid_1", "new_finding_uid_2"]:
+            assert list(scan_findings[finding_uid].resources.all()) == [new_resource]
+        assert {(tag.key, tag.value) for tag in new_resource.tags.all()} == {
+            ("key", "value"),
+            ("new_key", "new_value"),
+        }
+
+        # The existing resource and tag are reused
+        existing_resource.refresh_from_db()
+        assert existing_resource.region == "eu-west-1"
+        assert existing_resource.service == "ec2"
+        assert ResourceTag.objects.filter(key="key", value="value").count() == 1
+
 
 # TODO Add tests for aggregations
 
@@ -5,8 +5,10 @@ import re
 import shutil
 import sys
 import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -15,9 +17,11 @@ import prowler
 from prowler.config.config import orange_color
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
 from prowler.lib.check.models import Check
+from prowler.lib.check.prefetch import ServicePrefetcher
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.scan.snapshot import ScanSnapshot
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
@@ -298,6 +302,67 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
+def run_checks(
+    checks_to_execute: list,
+    check_runner: Callable[[str], Any],
+    max_workers: int = 1,
+) -> Generator[tuple[str, Future], None, None]:
+    """
+    run_checks calls check_runner for every check and yields a (check_name, future) tuple per check,
+    always in the same order as checks_to_execute regardless of which check finishes first.
+
+    With max_workers <= 1 every check runs in the calling thread only when the generator is advanced,
+    which is the default sequential behaviour. With max_workers > 1 the checks run concurrently in a
+    thread pool, keeping at most max_workers * 2 checks in flight so the findings of the checks that
+    are already completed but not yet consumed stay bounded. A thread pool is used instead of a process
+    pool because the checks read the service clients already loaded in memory by the provider.
+
+    Args:
+        checks_to_execute (list): The ordered list of check names to run.
+        check_runner (Callable[[str], Any]): Function that receives the check name and returns its result.
+        max_workers (int): The maximum number of checks running at the same time.
+
+    Yields:
+        tuple[str, Future]: The check name and a completed future holding the result or the exception raised by check_runner.
+
+    Example:
+        for check_name, future in run_checks(["s3_bucket_public_access"], runner, max_workers=4):
+            findings = future.result()
+    """
+    if not max_workers or max_workers <= 1:
+        for check_name in checks_to_execute:
+            future = Future()
+            try:
+                future.set_result(check_runner(check_name))
+            except Exception as error:
+                future.set_exception(error)
+            yield check_name, future
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="prowler-check"
+    ) as executor:
+        pending_checks = iter(checks_to_execute)
+        in_flight = deque()
+
+        def submit_next() -> bool:
+            check_name = next(pending_checks, None)
+            if check_name is None:
+                return False
+            in_flight.append((check_name, executor.submit(check_runner, check_name)))
+            return True
+
+        for _ in range(max_workers * 2):
+            if not submit_next():
+                break
+        while in_flight:
+            check_name, future = in_flight.popleft()
+            # Wait for the oldest check to keep the output order stable
+            future.exception()
+            submit_next()
+            yield check_name, future
+
+
 def run_fixer(check_findings: list) -> int:
     """
     Run the fixer for the check if it exists and there are any FAIL findings
@@ -389,7 +454,28 @@ def execute_checks(
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    max_workers: int = 1,
+    service_workers: int = None,
+    subscribers: list[Callable[[list], None]] = None,
+    snapshot_file: str = None,
 ) -> list:
+    """
+    Execute the given checks and report their findings
+
+    Args:
+        checks_to_execute (list): ordered list of checks to execute
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        config_file (str): path to the configuration file, shown in the execution summary
+        output_options (Any): output options, depending on the provider
+        max_workers (int): number of checks to execute concurrently, 1 by default
+        service_workers (int): number of services to load concurrently before executing the checks, disabled by default
+        subscribers (list): functions called with the findings of each check as soon as it finishes, in the same order as checks_to_execute, e.g. to write the outputs
+        snapshot_file (str): snapshot of the previous scan, to reuse the findings of the checks whose resources did not change, disabled by default
+
+    Returns:
+        list: list of findings from all the checks, in the same order as checks_to_execute. Empty if there are subscribers, since the findings are passed to them instead of kept
+    """
     # List to store all the check's findings
     all_findings = []
     # Services and checks executed for the Audit Status
@@ -431,53 +517,105 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
-    # Execution with the --only-logs flag
-    if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
-                if verbose:
-                    print(
-                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                    )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
+    # Services needed by the checks to prefetch them concurrently
+    service_checks_to_execute = {}
+    for check_name in checks_to_execute:
+        service_checks_to_execute.setdefault(check_name.split("_")[0], set()).add(
+            check_name
+        )
+    prefetcher = ServicePrefetcher(
+        global_provider.type, service_checks_to_execute, service_workers
+    )
+
+    # Reuse the findings of the checks whose input did not change since the previous scan, if enabled
+    snapshot = None
+    if snapshot_file:
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot_context = (
+            global_provider.type,
+            getattr(global_provider, "identity", None),
+            getattr(getattr(global_provider, "mutelist", None), "mutelist", None),
+            custom_checks_metadata,
+            getattr(output_options, "status", None),
+        )
+
+    def check_runner(check_name: str) -> tuple:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        # Wait until the services used by the check are loaded, if prefetched
+        prefetcher.wait_for_check(check_name)
+        try:
+            # Import check module
+            check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+            lib = import_check(check_module_path)
+            # Recover functions from check
+            check_to_execute = getattr(lib, check_name)
+            check = check_to_execute()
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+            )
+            return None, []
+
+        def execute_check() -> list:
+            return execute(
+                check,
+                global_provider,
+                custom_checks_metadata,
+                output_options,
+            )
+
+        # Execute the check, or reuse its previous findings if its input did not change
+        if snapshot:
+            return check, snapshot.run_check(
+                check_name, lib, (snapshot_context, check), execute_check
+            )
+        return check, execute_check()
+
+    def process_check_result(check_name: str, future: Future):
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        try:
+            check, check_findings = future.result()
+            if check is None:
+                return
+            if verbose:
+                print(
+                    f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
                 )
-                report(check_findings, global_provider, output_options)
+            report(check_findings, global_provider, output_options)
+            if subscribers:
+                for subscriber in subscribers:
+                    subscriber(check_findings)
+            else:
                 all_findings.extend(check_findings)
 
-                # Update Audit Status
-                services_executed.add(service)
-                checks_executed.add(check_name)
-                global_provider.audit_metadata = update_audit_metadata(
-                    global_provider.audit_metadata, services_executed, checks_executed
-                )
+            # Update Audit Status
+            services_executed.add(service)
+            checks_executed.add(check_name)
+            global_provider.audit_metadata = update_audit_metadata(
+                global_provider.audit_metadata, services_executed, checks_executed
+            )
 
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        # If check does not exists in the provider or is from another provider
+        except ModuleNotFoundError:
+            # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+            )
+        except Exception as error:
+            # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    # Execution with the --only-logs flag
+    if output_options.only_logs:
+        with prefetcher:
+            for check_name, future in run_checks(
+                checks_to_execute, check_runner, max_workers
+            ):
+                process_check_result(check_name, future)
     else:
         # Prepare your messages
         messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
@@ -489,6 +627,18 @@ def execute_checks(
             messages.append(
                 f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
             )
+        if max_workers and max_workers > 1:
+            messages.append(
+                f"Parallel check workers: {Fore.YELLOW}{max_workers}{Style.RESET_ALL}"
+            )
+        if service_workers:
+            messages.append(
+                f"Prefetched service workers: {Fore.YELLOW}{service_workers}{Style.RESET_ALL}"
+            )
+        if snapshot_file:
+            messages.append(
+                f"Scan snapshot: {Fore.YELLOW}{snapshot_file}{Style.RESET_ALL}"
+            )
         report_title = (
             f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
         )
@@ -502,69 +652,35 @@ def execute_checks(
         print(
             f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}"
         )
-        with alive_bar(
-            total=len(checks_to_execute),
-            ctrl_c=False,
-            bar="blocks",
-            spinner="classic",
-            stats=False,
-            enrich_print=False,
-        ) as bar:
-            for check_name in checks_to_execute:
+        with (
+            prefetcher,
+            alive_bar(
+                total=len(checks_to_execute),
+                ctrl_c=False,
+                bar="blocks",
+                spinner="classic",
+                stats=False,
+                enrich_print=False,
+            ) as bar,
+        ):
+            for check_name, future in run_checks(
+                checks_to_execute, check_runner, max_workers
+            ):
                 # Recover service from check name
                 service = check_name.split("_")[0]
                 bar.title = (
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
-                try:
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                        )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                        )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                process_check_result(check_name, future)
                 bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
+    if snapshot:
+        snapshot.save()
+        logger.info(
+            f"Scan snapshot {snapshot_file}: reused the findings of {snapshot.reused} checks and executed {snapshot.executed} checks"
+        )
+
     return all_findings
 
 
@@ -635,11 +751,9 @@ def execute(
                 is_finding_muted_args["account_name"] = (
                     global_provider.identity.account_name
                 )
-            for finding in check_findings:
-                is_finding_muted_args["finding"] = finding
-                finding.muted = global_provider.mutelist.is_finding_muted(
-                    **is_finding_muted_args
-                )
+            global_provider.mutelist.mute_findings(
+                check_findings, **is_finding_muted_args
+            )
 
     except ModuleNotFoundError:
         logger.error(
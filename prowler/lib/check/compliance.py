@@ -20,22 +20,18 @@ def update_checks_metadata_with_compliance(
         for check in bulk_checks_metadata:
             check_compliance = []
             for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
+                # Get the requirements including the check from the framework index
+                for requirement in framework.get_check_requirements(check):
+                    # Create the Compliance, the framework and its requirements are already validated
+                    compliance = Compliance.construct(
+                        Framework=framework.Framework,
+                        Provider=framework.Provider,
+                        Version=framework.Version,
+                        Description=framework.Description,
+                        Requirements=[requirement],
+                    )
+                    # Include the compliance framework for the check
+                    check_compliance.append(compliance)
             # Save it into the check's metadata
             bulk_checks_metadata[check].Compliance = check_compliance
         return bulk_checks_metadata
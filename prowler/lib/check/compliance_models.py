@@ -3,8 +3,9 @@ import sys
 from enum import Enum
 from typing import Optional, Union
 
-from pydantic.v1 import BaseModel, ValidationError, root_validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, root_validator
 
+from prowler.lib.check.parsed_cache import ParsedFileCache
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
 
@@ -236,6 +237,10 @@ class Compliance(BaseModel):
             Compliance_Requirement,
         ]
     ]
+    # Indexes of the requirements, built the first time they are needed
+    _requirements_by_check: Optional[dict] = PrivateAttr(default=None)
+    _requirement_positions: Optional[dict] = PrivateAttr(default=None)
+    _requirements_by_ids: dict = PrivateAttr(default_factory=dict)
 
     @root_validator(pre=True)
     # noqa: F841 - since vulture raises unused variable 'cls'
@@ -248,6 +253,72 @@ class Compliance(BaseModel):
             raise ValueError("Framework or Provider must not be empty")
         return values
 
+    def get_check_requirements(
+        self, check_id: str
+    ) -> list[Union[Mitre_Requirement, Compliance_Requirement]]:
+        """
+        Returns the requirements of the framework that include the given check, in the framework order.
+
+        Args:
+            check_id (str): The check ID
+
+        Returns:
+            list: The requirements that include the check
+        """
+        if self._requirements_by_check is None:
+            requirements_by_check = {}
+            for requirement in self.Requirements:
+                for check in dict.fromkeys(requirement.Checks):
+                    requirements_by_check.setdefault(check, []).append(requirement)
+            self._requirements_by_check = requirements_by_check
+        return self._requirements_by_check.get(check_id, [])
+
+    def get_requirements(
+        self, requirement_ids: list[str]
+    ) -> list[Union[Mitre_Requirement, Compliance_Requirement]]:
+        """
+        Returns the requirements of the framework with the given IDs, in the framework order.
+
+        The requirements are memoized by their IDs, so the findings of the same check, which share their
+        requirement IDs, do not walk the requirements of the framework again.
+
+        Args:
+            requirement_ids (list[str]): The requirement IDs, e.g. the ones of a finding for the framework
+
+        Returns:
+            list: The requirements with the given IDs
+        """
+        key = (
+            requirement_ids
+            if isinstance(requirement_ids, str)
+            else tuple(requirement_ids)
+        )
+        requirements = self._requirements_by_ids.get(key)
+        if requirements is None and isinstance(key, str):
+            # A single requirement given as a string keeps matching as a substring
+            requirements = [
+                requirement
+                for requirement in self.Requirements
+                if requirement.Id in key
+            ]
+            self._requirements_by_ids[key] = requirements
+        elif requirements is None:
+            if self._requirement_positions is None:
+                requirement_positions = {}
+                for position, requirement in enumerate(self.Requirements):
+                    requirement_positions.setdefault(requirement.Id, []).append(
+                        position
+                    )
+                self._requirement_positions = requirement_positions
+            positions = set()
+            for requirement_id in key:
+                positions.update(self._requirement_positions.get(requirement_id, []))
+            requirements = [
+                self.Requirements[position] for position in sorted(positions)
+            ]
+            self._requirements_by_ids[key] = requirements
+        return requirements
+
     @staticmethod
     def list(bulk_compliance_frameworks: dict, provider: str = None) -> list[str]:
         """
@@ -366,19 +437,26 @@ class Compliance(BaseModel):
                             bulk_compliance_frameworks[compliance_framework_name] = (
                                 load_compliance_framework(file_path)
                             )
+            compliance_framework_cache.save()
         except Exception as e:
             logger.error(f"{e.__class__.__name__}[{e.__traceback__.tb_lineno}] -- {e}")
 
         return bulk_compliance_frameworks
 
 
+# Cache of the parsed compliance framework specifications
+compliance_framework_cache = ParsedFileCache("compliance_frameworks", Compliance)
+
+
 # Testing Pending
 def load_compliance_framework(
     compliance_specification_file: str,
 ) -> Compliance:
     """load_compliance_framework loads and parse a Compliance Framework Specification"""
     try:
-        compliance_framework = Compliance.parse_file(compliance_specification_file)
+        compliance_framework = compliance_framework_cache.parse_file(
+            compliance_specification_file
+        )
     except ValidationError as error:
         logger.critical(
             f"Compliance Framework Specification from {compliance_specification_file} is not valid: {error}"
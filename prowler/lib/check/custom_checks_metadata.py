@@ -123,6 +123,8 @@ def update_check_metadata(check_metadata, custom_metadata):
                             attribute,
                             remediation_attribute,
                         )
+                    # Assigned again so a Check serializes its metadata with the new remediation
+                    setattr(check_metadata, attribute, check_metadata.Remediation)
                 else:
                     try:
                         setattr(check_metadata, attribute, custom_metadata[attribute])
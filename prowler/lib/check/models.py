@@ -8,10 +8,11 @@ from enum import Enum
 from typing import Any, Dict, Optional, Set
 
 from checkov.common.output.record import Record
-from pydantic.v1 import BaseModel, ValidationError, validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, validator
 
 from prowler.config.config import Provider
 from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.parsed_cache import ParsedFileCache
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 
@@ -121,6 +122,8 @@ class CheckMetadata(BaseModel):
     # We set the compliance to None to
     # store the compliance later if supplied
     Compliance: Optional[list[Any]] = []
+    # Requirements of the compliance frameworks by provider, with the Compliance list they were built from
+    _compliance_requirements: dict = PrivateAttr(default_factory=dict)
 
     @validator("Categories", each_item=True, pre=True, always=True)
     def valid_category(value):
@@ -174,6 +177,7 @@ class CheckMetadata(BaseModel):
             # Load metadata
             check_metadata = load_check_metadata(metadata_file)
             bulk_check_metadata[check_metadata.CheckID] = check_metadata
+        check_metadata_cache.save()
 
         return bulk_check_metadata
 
@@ -386,9 +390,15 @@ class CheckMetadata(BaseModel):
         return checks
 
 
+# Cache of the parsed metadata files of the checks
+check_metadata_cache = ParsedFileCache("check_metadata", CheckMetadata)
+
+
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
+    _metadata_json: Optional[str] = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -397,29 +407,55 @@ class Check(ABC, CheckMetadata):
             + ".metadata.json"
         )
         # Store it to validate them with Pydantic
-        data = CheckMetadata.parse_file(metadata_file).dict()
+        data = check_metadata_cache.parse_file(metadata_file).dict()
         # Calls parents init function
         super().__init__(**data)
         # TODO: verify that the CheckID is the same as the filename and classname
         # to mimic the test done at test_<provider>_checks_metadata_is_valid
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # The metadata changed, so it is serialized again
+        if name not in self.__private_attributes__:
+            object.__setattr__(self, "_metadata_json", None)
+
+    def metadata(self) -> str:
+        """Return the JSON representation of the check's metadata, serialized once until a field of the check changes"""
+        if self._metadata_json is None:
+            self._metadata_json = self.json()
+        return self._metadata_json
 
     @abstractmethod
     def execute(self) -> list:
         """Execute the check's logic"""
 
 
+@functools.lru_cache(maxsize=1024)
+def get_shared_check_metadata(metadata: str) -> CheckMetadata:
+    """
+    get_shared_check_metadata returns the CheckMetadata of the given JSON metadata, parsed once for all the reports of the check.
+
+    The returned instance is shared, so it must not be modified.
+
+    Args:
+        metadata (str): The JSON representation of the check's metadata.
+
+    Returns:
+        CheckMetadata: The shared metadata of the check.
+    """
+    return CheckMetadata.parse_raw(metadata)
+
+
 @dataclass
 class Check_Report:
-    """Contains the Check's finding information."""
+    """Contains the Check's finding information.
+
+    The resource is converted to a dict when it is first read, see the resource property.
+    """
 
     status: str
     status_extended: str
     check_metadata: CheckMetadata
-    resource: dict
     resource_details: str
     resource_tags: list
     muted: bool
@@ -433,27 +469,44 @@ class Check_Report:
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
-        if isinstance(resource, dict):
-            self.resource = resource
-        elif hasattr(resource, "dict"):
-            self.resource = resource.dict()
-        elif hasattr(resource, "to_dict"):
-            self.resource = resource.to_dict()
-        elif is_dataclass(resource):
-            self.resource = asdict(resource)
-        elif hasattr(resource, "__dict__"):
-            self.resource = resource.__dict__
-        else:
-            logger.error(
-                f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
-            )
-            self.resource = {}
+        # The copy shares the values of the metadata parsed once for the check, so changing a field of the
+        # report, like the Severity, does not change the other reports
+        self.check_metadata = get_shared_check_metadata(metadata).copy()
+        self._resource = resource
+        self._resource_dict = None
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = getattr(resource, "tags", []) if resource else []
         self.muted = False
 
+    @property
+    def resource(self) -> dict:
+        """The resource of the finding as a dict, converted on first read"""
+        if self._resource_dict is None:
+            resource = self._resource
+            if isinstance(resource, dict):
+                self._resource_dict = resource
+            elif hasattr(resource, "dict"):
+                self._resource_dict = resource.dict()
+            elif hasattr(resource, "to_dict"):
+                self._resource_dict = resource.to_dict()
+            elif is_dataclass(resource):
+                self._resource_dict = asdict(resource)
+            elif hasattr(resource, "__dict__"):
+                self._resource_dict = resource.__dict__
+            else:
+                logger.error(
+                    f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
+                )
+                self._resource_dict = {}
+            self._resource = None
+        return self._resource_dict
+
+    @resource.setter
+    def resource(self, resource: dict) -> None:
+        self._resource_dict = resource
+        self._resource = None
+
 
 @dataclass
 class Check_Report_AWS(Check_Report):
@@ -679,7 +732,7 @@ def load_check_metadata(metadata_file: str) -> CheckMetadata:
     """
 
     try:
-        check_metadata = CheckMetadata.parse_file(metadata_file)
+        check_metadata = check_metadata_cache.parse_file(metadata_file)
     except ValidationError as error:
         logger.critical(f"Metadata from {metadata_file} is not valid: {error}")
         raise error
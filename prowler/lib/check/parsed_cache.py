@@ -0,0 +1,152 @@
+import atexit
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from threading import Lock
+from typing import Optional, Type
+
+from pydantic.v1 import VERSION as PYDANTIC_VERSION
+from pydantic.v1 import BaseModel
+
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import write_pickle_file
+
+# Default directory of the caches of the parsed check metadata and compliance frameworks
+DEFAULT_PARSED_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser("~"), ".prowler", "cache"
+)
+# Version of the format of the cache files, increase it when the format changes
+PARSED_CACHE_VERSION = 1
+
+
+class ParsedFileCache:
+    """
+    ParsedFileCache is an on-disk cache of the pydantic models parsed from JSON files, e.g. the metadata of the checks.
+
+    The parsed models are pickled and keyed by the path of their file together with the hash of its content,
+    so a file is parsed and validated again only when it changes. The cache file is discarded when it was
+    written by another version of Prowler, pydantic or Python, or when the module of the model changed, and
+    it is only an optimization: if it cannot be read or written the files are parsed as before.
+
+    Attributes:
+        path (str): The path of the cache file.
+        model (Type[BaseModel]): The pydantic model parsed from the files.
+        hits (int): The number of files served from the cache.
+        misses (int): The number of files parsed.
+
+    Example:
+        check_metadata_cache = ParsedFileCache("check_metadata", CheckMetadata)
+        check_metadata = check_metadata_cache.parse_file(metadata_file)
+        check_metadata_cache.save()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: Type[BaseModel],
+        directory: str = DEFAULT_PARSED_CACHE_DIRECTORY,
+    ):
+        self.path = os.path.join(directory, f"{name}.pickle")
+        self.model = model
+        self.hits = 0
+        self.misses = 0
+        self._version = (
+            PARSED_CACHE_VERSION,
+            prowler_version,
+            PYDANTIC_VERSION,
+            sys.version_info[:2],
+            _get_module_digest(model),
+        )
+        self._entries: Optional[dict] = None
+        self._dirty = False
+        self._save_registered = False
+        self._lock = Lock()
+
+    def parse_file(self, file_path: str) -> BaseModel:
+        """
+        parse_file returns the model parsed from the given JSON file, from the cache if the file did not change.
+
+        Every call returns a new model, so the callers can modify it.
+
+        Args:
+            file_path (str): The path of the JSON file.
+
+        Returns:
+            BaseModel: The parsed model.
+
+        Raises:
+            ValidationError: If the file is not valid.
+        """
+        with open(file_path, "rb") as file:
+            content = file.read()
+        key = os.path.abspath(file_path)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry[0] == digest:
+            try:
+                parsed = pickle.loads(entry[1])
+                self.hits += 1
+                return parsed
+            except Exception as error:
+                logger.debug(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        parsed = self.model.parse_raw(content)
+        with self._lock:
+            self._entries[key] = (
+                digest,
+                pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+            self.misses += 1
+            self._dirty = True
+            if not self._save_registered:
+                # Save the cache at exit if it is not saved before
+                atexit.register(self.save)
+                self._save_registered = True
+        return parsed
+
+    def save(self) -> None:
+        """save writes the cache file if any file was parsed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                write_pickle_file(
+                    self.path,
+                    {"version": self._version, "entries": self._entries},
+                    prefix=".parsed_cache_",
+                )
+                self._dirty = False
+            except Exception as error:
+                logger.debug(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+    def _load(self) -> dict:
+        """_load reads the cache file the first time it is needed, discarding it if it is not valid."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if os.path.isfile(self.path):
+                    with open(self.path, "rb") as file:
+                        cache = pickle.load(file)
+                    if cache.get("version") == self._version:
+                        self._entries = cache["entries"]
+            except Exception as error:
+                logger.debug(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return self._entries
+
+
+def _get_module_digest(model: Type[BaseModel]) -> Optional[str]:
+    """_get_module_digest returns the hash of the source file of the model module, so the cache follows its changes."""
+    try:
+        with open(inspect.getfile(model), "rb") as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    except Exception:
+        return None
@@ -0,0 +1,173 @@
+import ast
+import importlib
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from prowler.lib.logger import logger
+
+
+def get_check_module_path(provider: str, check_name: str) -> str:
+    """
+    get_check_module_path returns the import path of the given check.
+
+    Example:
+        get_check_module_path("aws", "ec2_ami_public") -> "prowler.providers.aws.services.ec2.ec2_ami_public.ec2_ami_public"
+    """
+    service = check_name.split("_")[0]
+    return f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+
+
+def get_imported_modules(module_path: str, suffix: str) -> set[str]:
+    """
+    get_imported_modules returns the prowler.providers modules ending with the given suffix imported by the
+    given module, reading its source code so the module itself is not imported.
+
+    Args:
+        module_path (str): The module to inspect, e.g. "prowler.providers.aws.services.ec2.ec2_ami_public.ec2_ami_public".
+        suffix (str): The suffix of the imported modules to return, e.g. "_client".
+
+    Returns:
+        set[str]: The imported modules, e.g. {"prowler.providers.aws.services.ec2.ec2_client"}.
+    """
+    imported_modules = set()
+    try:
+        spec = importlib.util.find_spec(module_path)
+        if not spec or not spec.origin:
+            return imported_modules
+        with open(spec.origin, "r", encoding="utf-8") as module_file:
+            tree = ast.parse(module_file.read())
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module
+                and node.module.startswith("prowler.providers.")
+                and node.module.endswith(suffix)
+            ):
+                imported_modules.add(node.module)
+    except Exception as error:
+        logger.error(
+            f"{module_path} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return imported_modules
+
+
+def get_check_client_modules(provider: str, check_name: str) -> set[str]:
+    """
+    get_check_client_modules returns the service client modules imported by the given check
+    without importing the check, so no service is loaded.
+
+    Example:
+        get_check_client_modules("aws", "ec2_ami_public") -> {"prowler.providers.aws.services.ec2.ec2_client"}
+    """
+    return get_imported_modules(get_check_module_path(provider, check_name), "_client")
+
+
+class ServicePrefetcher:
+    """
+    ServicePrefetcher loads the services needed by the checks to execute concurrently and up front.
+
+    Each *_client.py module builds its service at import time, so without prefetching the services are
+    loaded one after another as the first check of each service is imported. The prefetcher imports all the
+    client modules needed by the checks in a thread pool, so the API calls of the different services overlap,
+    and lets each check wait only for the services it uses.
+
+    If a service fails to be prefetched the error is logged and the check imports it again as usual.
+    With max_workers set to 0 or None the prefetcher does nothing and the services are loaded lazily.
+
+    Attributes:
+        provider (str): The provider type.
+        max_workers (int): The maximum number of services loaded at the same time, 0 or None to disable it.
+
+    Example:
+        with ServicePrefetcher("aws", service_checks_to_execute, max_workers=8) as prefetcher:
+            for check_name in checks_to_execute:
+                prefetcher.wait_for_check(check_name)
+                # import and execute the check
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        service_checks_to_execute: dict[str, set[str]],
+        max_workers: int = None,
+    ):
+        self.provider = provider
+        self.max_workers = max_workers or 0
+        self._check_client_modules: dict[str, set[str]] = {}
+        self._client_futures: dict[str, Future] = {}
+        self._executor = None
+
+        if self.max_workers > 0:
+            # Sort the services and checks so the services are requested in a deterministic order
+            for service in sorted(service_checks_to_execute):
+                for check_name in sorted(service_checks_to_execute[service]):
+                    self._check_client_modules[check_name] = get_check_client_modules(
+                        provider, check_name
+                    )
+
+    @property
+    def client_modules(self) -> list[str]:
+        """client_modules returns all the client modules to prefetch, keeping the order they were first requested"""
+        client_modules = {}
+        for modules in self._check_client_modules.values():
+            for module in sorted(modules):
+                client_modules[module] = None
+        return list(client_modules)
+
+    def start(self) -> "ServicePrefetcher":
+        """start submits the import of every client module needed by the checks to the thread pool"""
+        client_modules = self.client_modules
+        if not client_modules:
+            return self
+        logger.info(
+            f"Prefetching {len(client_modules)} services with {self.max_workers} workers..."
+        )
+        # The service modules are imported first in the calling thread, they do not call any API,
+        # so the threads only build the service objects and cannot deadlock importing shared modules
+        for client_module in client_modules:
+            for service_module in get_imported_modules(client_module, "_service"):
+                try:
+                    importlib.import_module(service_module)
+                except Exception as error:
+                    logger.error(
+                        f"{service_module} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prowler-service"
+        )
+        for client_module in client_modules:
+            self._client_futures[client_module] = self._executor.submit(
+                self._load_client, client_module
+            )
+        return self
+
+    def wait_for_check(self, check_name: str) -> None:
+        """wait_for_check blocks until all the services used by the given check are loaded or failed"""
+        futures = [
+            self._client_futures[client_module]
+            for client_module in self._check_client_modules.get(check_name, set())
+            if client_module in self._client_futures
+        ]
+        if futures:
+            wait(futures)
+
+    def shutdown(self) -> None:
+        """shutdown waits for the pending services and releases the thread pool"""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ServicePrefetcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    @staticmethod
+    def _load_client(client_module: str) -> None:
+        try:
+            importlib.import_module(client_module)
+        except Exception as error:
+            logger.error(
+                f"{client_module} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
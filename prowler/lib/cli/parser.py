@@ -66,6 +66,7 @@ Detailed documentation at https://docs.prowler.com
         self.__init_outputs_parser__()
         self.__init_logging_parser__()
         self.__init_checks_parser__()
+        self.__init_execution_parser__()
         self.__init_exclude_checks_parser__()
         self.__init_list_checks_parser__()
         self.__init_mutelist_parser__()
@@ -296,6 +297,33 @@ Detailed documentation at https://docs.prowler.com
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
 
+    def __init_execution_parser__(self):
+        # Checks execution options
+        execution_parser = self.common_providers_parser.add_argument_group(
+            "Checks execution"
+        )
+        execution_parser.add_argument(
+            "--check-workers",
+            nargs="?",
+            type=validate_workers,
+            default=1,
+            help="Number of checks to execute concurrently once the services are loaded. Findings are reported in the same order as the sequential execution (Default: 1)",
+        )
+        execution_parser.add_argument(
+            "--service-workers",
+            nargs="?",
+            type=validate_workers,
+            default=None,
+            help="Number of services to load concurrently before executing the checks, each check starts as soon as its services are loaded. By default the services are loaded one by one when the first check using them is executed",
+        )
+        execution_parser.add_argument(
+            "--scan-snapshot",
+            nargs="?",
+            default=None,
+            metavar="SNAPSHOT_FILE",
+            help="File with the snapshot of the previous scan, the checks whose resources did not change reuse their previous findings instead of being executed again. The file is created if it does not exist and updated at the end of the scan",
+        )
+
     def __init_list_checks_parser__(self):
         # List checks options
         list_checks_parser = self.common_providers_parser.add_argument_group(
@@ -393,3 +421,14 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Send a summary of the execution with a Slack APP in your channel. Environment variables SLACK_API_TOKEN and SLACK_CHANNEL_NAME are required (see more in https://docs.prowler.cloud/en/latest/tutorials/integrations/#slack).",
         )
+
+
+def validate_workers(workers: str) -> int:
+    """validate_workers validates that the input number of workers is a positive integer"""
+    try:
+        workers = int(workers)
+    except ValueError:
+        raise argparse.ArgumentTypeError("The number of workers must be an integer")
+    if workers < 1:
+        raise argparse.ArgumentTypeError("The number of workers must be at least 1")
+    return workers
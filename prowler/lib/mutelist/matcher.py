@@ -0,0 +1,332 @@
+import re
+from functools import lru_cache
+
+from prowler.lib.logger import logger
+
+# Back-references are numbered by group, so patterns using them cannot be joined in a single regex
+BACK_REFERENCE_PATTERN = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=None)
+def compile_mutelist_pattern(item: str) -> re.Pattern:
+    """
+    compile_mutelist_pattern returns the compiled regex of a Mutelist item, where "*" matches anything.
+
+    Example:
+        compile_mutelist_pattern("ec2_*") -> re.compile("ec2_.*")
+    """
+    return re.compile(item.replace("*", ".*") if "*" in item else item)
+
+
+@lru_cache(maxsize=None)
+def get_mutelist_check_name(muted_check: str) -> str:
+    """get_mutelist_check_name maps the Mutelist check name to the Prowler check name, e.g. lambda_* -> awslambda_*"""
+    return re.sub("^lambda", "awslambda", muted_check)
+
+
+class MutelistPatterns:
+    """
+    MutelistPatterns is a list of Mutelist items compiled once, matched as Mutelist.is_item_matched does.
+
+    The items are searched (not fully matched) in the value, so when all of them are valid regexes they are
+    joined in a single regex, and matching any of them is a single search. With cache set, the results are
+    kept per value, which is useful for the fields with few different values like the regions.
+
+    Attributes:
+        items (list): The Mutelist items.
+    """
+
+    def __init__(self, items, cache: bool = False):
+        self.items = items
+        self._patterns = None
+        self._combined_pattern = None
+        self._cache = {} if cache else None
+
+    def _compile(self) -> None:
+        # The patterns are compiled on first use, so the entries never evaluated are not compiled
+        patterns = []
+        is_valid = True
+        for item in self.items:
+            try:
+                patterns.append(compile_mutelist_pattern(item))
+            except Exception:
+                # The pattern raises when reached, as in Mutelist.is_item_matched
+                patterns.append(None)
+                is_valid = False
+        if (
+            is_valid
+            and len(patterns) > 1
+            and not any(
+                BACK_REFERENCE_PATTERN.search(pattern.pattern) for pattern in patterns
+            )
+        ):
+            try:
+                self._combined_pattern = re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in patterns)
+                )
+            except re.error:
+                self._combined_pattern = None
+        self._patterns = patterns
+
+    def match_any(self, value) -> bool:
+        """match_any returns True if any of the items is found in the value"""
+        if self._cache is not None:
+            try:
+                return self._cache[value]
+            except KeyError:
+                result = self._cache[value] = self._match_any(value)
+                return result
+            except TypeError:
+                # Unhashable values are not cached
+                pass
+        return self._match_any(value)
+
+    def match_all(self, value) -> bool:
+        """match_all returns True if all the items are found in the value"""
+        if not self.items or not (value or value == ""):
+            return False
+        if self._patterns is None:
+            self._compile()
+        try:
+            for pattern in self._patterns:
+                if pattern is None or not pattern.search(value):
+                    return False
+            return True
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+
+    def _match_any(self, value) -> bool:
+        if not self.items or not (value or value == ""):
+            return False
+        if self._patterns is None:
+            self._compile()
+        try:
+            if self._combined_pattern:
+                return bool(self._combined_pattern.search(value))
+            for pattern in self._patterns:
+                if pattern is None:
+                    return False
+                if pattern.search(value):
+                    return True
+            return False
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+
+
+class MutelistEntry:
+    """
+    MutelistEntry is a check entry of an account of the Mutelist, with its items compiled.
+
+    Attributes:
+        check (str): The muted check name, which can be a regex.
+        regions (MutelistPatterns): The muted regions.
+        resources (MutelistPatterns): The muted resources.
+        tags (MutelistPatterns): The muted tags, all of them have to be present in the finding.
+        exceptions (dict): The excepted accounts, regions, resources and tags.
+    """
+
+    def __init__(self, muted_check: str, muted_check_info: dict):
+        self.check = get_mutelist_check_name(muted_check)
+        self.check_pattern = MutelistPatterns([self.check])
+        self.regions = MutelistPatterns(muted_check_info.get("Regions"), cache=True)
+        self.resources = MutelistPatterns(muted_check_info.get("Resources"))
+        # We need to set the muted_tags if None, "" or [], so the falsy helps
+        self.tags = MutelistPatterns(muted_check_info.get("Tags", "*") or "*")
+        self.exceptions = None
+        exceptions = muted_check_info.get("Exceptions")
+        if exceptions:
+            self.exceptions = {
+                "Accounts": MutelistPatterns(
+                    exceptions.get("Accounts", []), cache=True
+                ),
+                "Regions": MutelistPatterns(exceptions.get("Regions", []), cache=True),
+                "Resources": MutelistPatterns(exceptions.get("Resources", [])),
+                "Tags": MutelistPatterns(exceptions.get("Tags", [])),
+            }
+
+    def is_check_matched(self, check: str) -> bool:
+        """is_check_matched returns True if the entry applies to the given check"""
+        return (
+            "*" == self.check
+            or check == self.check
+            or self.check_pattern.match_any(check)
+        )
+
+    def is_excepted(self, audited_account, region, resource, tags) -> bool:
+        """is_excepted returns True if the finding is excepted, as Mutelist.is_excepted does"""
+        if not self.exceptions:
+            return False
+        accounts = self.exceptions["Accounts"]
+        regions = self.exceptions["Regions"]
+        resources = self.exceptions["Resources"]
+        exception_tags = self.exceptions["Tags"]
+        is_account_excepted = accounts.match_any(audited_account)
+        is_region_excepted = regions.match_any(region)
+        is_resource_excepted = resources.match_any(resource)
+        is_tag_excepted = exception_tags.match_all(tags)
+        if not (
+            is_account_excepted
+            or is_region_excepted
+            or is_resource_excepted
+            or is_tag_excepted
+        ):
+            return False
+        return (
+            (is_account_excepted or not accounts.items)
+            and (is_region_excepted or not regions.items)
+            and (is_resource_excepted or not resources.items)
+            and (is_tag_excepted or not exception_tags.items)
+        )
+
+
+class MutelistMatcher:
+    """
+    MutelistMatcher is the Mutelist compiled once into an indexed matcher, returning the same results as
+    Mutelist.is_muted without walking all the accounts and checks for every finding.
+
+    - The accounts are indexed by name, so only the audited account and "*" are evaluated.
+    - The entries of each account are indexed by check name, and the check names of the Mutelist
+      matching each check are computed once, so only the entries applying to the check are evaluated.
+    - The entries applying to each account, check and region are computed once, so the findings sharing
+      them are only matched against the resources and tags.
+    - The items of every entry are compiled once, and joined in a single regex where possible.
+
+    Attributes:
+        mutelist (dict): The Mutelist the matcher was compiled from.
+
+    Example:
+        matcher = MutelistMatcher(mutelist)
+        matcher.is_muted("123456789012", "ec2_ami_public", "eu-west-1", "ami-1234", "")
+    """
+
+    def __init__(self, mutelist: dict):
+        self.mutelist = mutelist
+        # Entries of each account, by the check name of the entry, keeping their position in the account
+        self._accounts: dict[str, dict[str, list[tuple[int, MutelistEntry]]]] = {}
+        # An entry for each check name of the Mutelist, used to match the checks
+        self._check_names: dict[str, MutelistEntry] = {}
+        self._matched_check_names: dict[str, list[str]] = {}
+        self._check_entries: dict[tuple[str, str], list[MutelistEntry]] = {}
+        self._region_entries: dict[
+            tuple[str, str, str], list[list[tuple[MutelistEntry, bool]]]
+        ] = {}
+        for account, account_info in (mutelist or {}).get("Accounts", {}).items():
+            account_entries = {}
+            for position, (muted_check, muted_check_info) in enumerate(
+                account_info["Checks"].items()
+            ):
+                entry = MutelistEntry(muted_check, muted_check_info)
+                account_entries.setdefault(entry.check, []).append((position, entry))
+                self._check_names.setdefault(entry.check, entry)
+            self._accounts[account] = account_entries
+
+    def is_muted(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """is_muted returns True if the finding is muted, see Mutelist.is_muted"""
+        return self.is_muted_in_entries(
+            self.get_entries(audited_account, check, finding_region),
+            audited_account,
+            finding_region,
+            finding_resource,
+            finding_tags,
+        )
+
+    def get_entries(
+        self, audited_account: str, check: str, region: str
+    ) -> list[list[tuple[MutelistEntry, bool]]]:
+        """
+        get_entries returns the entries that can mute or except the findings of the given account, check and region.
+
+        The entries are computed once for each account, check and region, so all the findings sharing them
+        are only evaluated against their resources and tags.
+
+        Returns:
+            list: A list for the audited account and another for "*", if present in the Mutelist, with the
+                (entry, is_region_muted) tuples of the entries applying to the check, in the Mutelist order.
+        """
+        key = (audited_account, check, region)
+        entries = self._region_entries.get(key)
+        if entries is None:
+            entries = []
+            accounts = (
+                [audited_account] if audited_account == "*" else [audited_account, "*"]
+            )
+            for account in accounts:
+                if account not in self._accounts:
+                    continue
+                account_entries = []
+                for entry in self._get_check_entries(account, check):
+                    is_region_muted = entry.regions.match_any(region)
+                    # An entry not muting the region and without exceptions cannot change the result
+                    if is_region_muted or entry.exceptions:
+                        account_entries.append((entry, is_region_muted))
+                if account_entries:
+                    entries.append(account_entries)
+            self._region_entries[key] = entries
+        return entries
+
+    @staticmethod
+    def is_muted_in_entries(
+        entries: list[list[tuple[MutelistEntry, bool]]],
+        audited_account: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """is_muted_in_entries returns True if the finding is muted by the entries returned by get_entries"""
+        for account_entries in entries:
+            for entry, is_region_muted in account_entries:
+                # The first entry excepting the finding stops the evaluation of the account
+                if entry.is_excepted(
+                    audited_account, finding_region, finding_resource, finding_tags
+                ):
+                    break
+                if (
+                    is_region_muted
+                    and entry.resources.match_any(finding_resource)
+                    and entry.tags.match_all(finding_tags)
+                ):
+                    return True
+        return False
+
+    def _get_check_entries(self, account: str, check: str) -> list[MutelistEntry]:
+        key = (account, check)
+        entries = self._check_entries.get(key)
+        if entries is None:
+            account_entries = self._accounts[account]
+            entries = [
+                entry
+                for _, entry in sorted(
+                    (
+                        position_entry
+                        for check_name in self._get_matched_check_names(check)
+                        for position_entry in account_entries.get(check_name, [])
+                    ),
+                    key=lambda position_entry: position_entry[0],
+                )
+            ]
+            self._check_entries[key] = entries
+        return entries
+
+    def _get_matched_check_names(self, check: str) -> list[str]:
+        check_names = self._matched_check_names.get(check)
+        if check_names is None:
+            check_names = [
+                check_name
+                for check_name, entry in self._check_names.items()
+                if entry.is_check_matched(check)
+            ]
+            self._matched_check_names[check] = check_names
+        return check_names
@@ -1,10 +1,14 @@
-import re
 from abc import ABC, abstractmethod
 
 import yaml
 from jsonschema import validate
 
 from prowler.lib.logger import logger
+from prowler.lib.mutelist.matcher import (
+    MutelistMatcher,
+    compile_mutelist_pattern,
+    get_mutelist_check_name,
+)
 from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
@@ -97,7 +101,10 @@ class Mutelist(ABC):
         mutelist: Property that returns the mutelist dictionary.
         mutelist_file_path: Property that returns the mutelist file path.
         is_finding_muted: Abstract method to check if a finding is muted.
+        get_finding_fields: Returns the audited account, check, region and resource of a check finding.
+        mute_findings: Sets the muted field of a list of check findings, evaluating them in groups.
         get_mutelist_file_from_local_file: Retrieves the mutelist file from a local file.
+        matcher: Property that returns the Mutelist compiled into a MutelistMatcher.
         is_muted: Checks if a finding is muted for the audited account, check, region, resource, and tags.
         is_muted_in_check: Checks if a check is muted.
         is_excepted: Checks if the account, region, resource, and tags are excepted based on the exceptions.
@@ -105,6 +112,7 @@ class Mutelist(ABC):
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    _matcher: MutelistMatcher = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -128,10 +136,92 @@ class Mutelist(ABC):
     def mutelist_file_path(self) -> dict:
         return self._mutelist_file_path
 
+    @property
+    def matcher(self) -> MutelistMatcher:
+        """
+        Returns the Mutelist compiled into a MutelistMatcher, compiling it again if the Mutelist was replaced.
+
+        Returns:
+            MutelistMatcher: The indexed matcher used by is_muted.
+        """
+        if self._matcher is None or self._matcher.mutelist is not self._mutelist:
+            self._matcher = MutelistMatcher(self._mutelist)
+        return self._matcher
+
     @abstractmethod
     def is_finding_muted(self) -> bool:
         raise NotImplementedError
 
+    def get_finding_fields(self, finding, **kwargs) -> tuple:
+        """
+        Returns the fields of the check finding evaluated by the Mutelist, implemented by each provider Mutelist.
+
+        Args:
+            finding (Check_Report): The check finding.
+            kwargs: The same provider specific arguments of is_finding_muted, like the AWS account ID.
+
+        Returns:
+            tuple: The (audited_account, check, region, resource) of the finding.
+        """
+        raise NotImplementedError
+
+    def mute_findings(self, findings: list, **kwargs) -> list:
+        """
+        Sets the muted field of the given check findings, with the same result as calling is_finding_muted for each finding.
+
+        The findings are grouped by account, check and region, and each group is evaluated once against the
+        Mutelist entries that apply to it, so the findings of the group are only matched against the resources
+        and tags of those entries. The tags of a finding are only unrolled if some entry applies to its group.
+
+        Args:
+            findings (list): The check findings to evaluate, usually all the findings of a check.
+            kwargs: The same provider specific arguments of is_finding_muted, like the AWS account ID.
+
+        Returns:
+            list: The same findings, with the muted field set.
+
+        Example:
+            mutelist.mute_findings(check_findings, aws_account_id="123456789012")
+        """
+        try:
+            groups = {}
+            for finding in findings:
+                audited_account, check, region, resource = self.get_finding_fields(
+                    finding, **kwargs
+                )
+                groups.setdefault((audited_account, check, region), []).append(
+                    (finding, resource)
+                )
+        except NotImplementedError:
+            # Mutelists without get_finding_fields evaluate the findings one by one
+            for finding in findings:
+                finding.muted = self.is_finding_muted(finding=finding, **kwargs)
+            return findings
+
+        for (audited_account, check, region), group in groups.items():
+            try:
+                entries = self.matcher.get_entries(audited_account, check, region)
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+                )
+                entries = []
+            for finding, resource in group:
+                try:
+                    finding.muted = bool(entries) and self.matcher.is_muted_in_entries(
+                        entries,
+                        audited_account,
+                        region,
+                        resource,
+                        unroll_dict(unroll_tags(finding.resource_tags)),
+                    )
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+                    )
+                    finding.muted = False
+        return findings
+
     def get_mutelist_file_from_local_file(self, mutelist_path: str):
         try:
             with open(mutelist_path) as f:
@@ -184,25 +274,16 @@ class Mutelist(ABC):
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
-            # By default is not muted
-            is_finding_muted = False
-
-            # We always check all the accounts present in the mutelist
-            # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
-
-            return is_finding_muted
+            # The Mutelist is compiled once into an indexed matcher, which evaluates only the audited
+            # account and "*", and only the checks matching the finding, with the same results
+            # as calling is_muted_in_check for every account present in the mutelist
+            return self.matcher.is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -238,7 +319,7 @@ class Mutelist(ABC):
 
             for muted_check, muted_check_info in muted_checks.items():
                 # map lambda to awslambda
-                muted_check = re.sub("^lambda", "awslambda", muted_check)
+                muted_check = get_mutelist_check_name(muted_check)
 
                 check_match = (
                     "*" == muted_check
@@ -421,14 +502,14 @@ class Mutelist(ABC):
                 if tag:
                     is_item_matched = True
                 for item in matched_items:
-                    if "*" in item:
-                        item = item.replace("*", ".*")
+                    # The patterns are compiled once and cached
+                    pattern = compile_mutelist_pattern(item)
                     if tag:
-                        if not re.search(item, finding_items):
+                        if not pattern.search(finding_items):
                             is_item_matched = False
                             break
                     else:
-                        if re.search(item, finding_items):
+                        if pattern.search(finding_items):
                             is_item_matched = True
                             break
             return is_item_matched
@@ -1,6 +1,5 @@
-from json import dump
-from os import SEEK_SET
-from typing import Optional
+from json import dumps
+from typing import List, Optional
 
 from pydantic.v1 import BaseModel, validator
 
@@ -31,6 +30,17 @@ class ASFF(Output):
         - AWS Security Finding Format Syntax: https://docs.aws.amazon.com/securityhub/latest/userguide/securityhub-findings-format-syntax.html
     """
 
+    def __init__(
+        self,
+        findings: List[Finding],
+        file_path: str = None,
+        file_extension: str = "",
+        from_cli: bool = True,
+    ) -> None:
+        # Number of findings written to the file, to know if the JSON array needs a separator
+        self._written_findings = 0
+        super().__init__(findings, file_path, file_extension, from_cli)
+
     def transform(self, findings: list[Finding]) -> None:
         """
         Transforms a list of findings into AWS Security Finding Format (ASFF).
@@ -126,7 +136,7 @@ class ASFF(Output):
         """
         Writes the findings data to a file in JSON ASFF format.
 
-        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
+        This method writes the findings stored in the '_data' attribute to the file descriptor '_file_descriptor' as a JSON array, dumping each finding with an indent of 4 spaces. The array is opened with the first finding written, so the findings can be written in batches, and it is closed with ']' along with the file descriptor.
 
         Returns:
             None
@@ -135,31 +145,19 @@ class ASFF(Output):
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
             ):
-                # Write JSON opening/header [
-                self._file_descriptor.write("[")
-
-                # Write findings
+                # Write findings, opening the JSON array with the first one
                 for finding in self._data:
-                    dump(
-                        finding.dict(exclude_none=True),
-                        self._file_descriptor,
-                        indent=4,
+                    self._file_descriptor.write("," if self._written_findings else "[")
+                    self._file_descriptor.write(
+                        dumps(finding.dict(exclude_none=True), indent=4)
                     )
-                    self._file_descriptor.write(",")
-
-                # Write footer/closing ]
-                if self._file_descriptor.tell() > 0:
-                    if self._file_descriptor.tell() != 1:
-                        self._file_descriptor.seek(
-                            self._file_descriptor.tell() - 1, SEEK_SET
-                        )
-                    self._file_descriptor.truncate()
-                    self._file_descriptor.write("]")
-
-                # Close file descriptor
-                self._file_descriptor.close()
+                    self._written_findings += 1
+
+                # Write footer/closing ] and close file descriptor
+                if self.close_file or self._from_cli:
+                    self._file_descriptor.write("]" if self._written_findings else "[]")
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -125,22 +125,53 @@ def get_check_compliance(
         check_compliance = {}
         # We have to retrieve all the check's compliance requirements
         if finding.check_metadata.CheckID in bulk_checks_metadata:
-            for compliance in bulk_checks_metadata[
-                finding.check_metadata.CheckID
-            ].Compliance:
-                compliance_fw = compliance.Framework
-                if compliance.Version:
-                    compliance_fw = f"{compliance_fw}-{compliance.Version}"
-                # compliance.Provider == "Azure" or "Kubernetes"
-                # provider_type == "azure" or "kubernetes"
-                if compliance.Provider.upper() == provider_type.upper():
-                    if compliance_fw not in check_compliance:
-                        check_compliance[compliance_fw] = []
-                    for requirement in compliance.Requirements:
-                        check_compliance[compliance_fw].append(requirement.Id)
+            check_metadata = bulk_checks_metadata[finding.check_metadata.CheckID]
+            # The map is built once per check and provider until the check's compliance changes
+            compliance_requirements = check_metadata._compliance_requirements.get(
+                provider_type.upper()
+            )
+            if (
+                compliance_requirements is None
+                or compliance_requirements[0] is not check_metadata.Compliance
+            ):
+                compliance_requirements = (
+                    check_metadata.Compliance,
+                    build_check_compliance(check_metadata.Compliance, provider_type),
+                )
+                check_metadata._compliance_requirements[provider_type.upper()] = (
+                    compliance_requirements
+                )
+            # Every finding gets its own copy of the map
+            for compliance_fw, requirements in compliance_requirements[1].items():
+                check_compliance[compliance_fw] = requirements.copy()
         return check_compliance
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
         )
         return {}
+
+
+def build_check_compliance(compliance_frameworks: list, provider_type: str) -> dict:
+    """build_check_compliance returns a map with the compliance framework as key and the check's requirements of the given provider.
+
+    Args:
+        compliance_frameworks (list): The check's Compliance list, from its metadata
+        provider_type (str): The provider type
+
+    Returns:
+        dict: The compliance framework as key and the requirements where the check is present.
+    """
+    check_compliance = {}
+    for compliance in compliance_frameworks:
+        compliance_fw = compliance.Framework
+        if compliance.Version:
+            compliance_fw = f"{compliance_fw}-{compliance.Version}"
+        # compliance.Provider == "Azure" or "Kubernetes"
+        # provider_type == "azure" or "kubernetes"
+        if compliance.Provider.upper() == provider_type.upper():
+            if compliance_fw not in check_compliance:
+                check_compliance[compliance_fw] = []
+            for requirement in compliance.Requirements:
+                check_compliance[compliance_fw].append(requirement.Id)
+    return check_compliance
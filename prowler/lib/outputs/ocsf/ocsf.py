@@ -1,4 +1,3 @@
-import os
 from datetime import datetime
 from typing import List
 
@@ -32,6 +31,7 @@ class OCSF(Output):
     Attributes:
         - _data: A list to store the transformed findings.
         - _file_descriptor: A file descriptor to write the findings to a file.
+        - json_lines: Whether to write one finding per line (NDJSON) instead of a JSON array.
 
     Methods:
         - transform(findings: List[Finding]) -> None: Transforms the findings into the OCSF Detection Finding format.
@@ -44,6 +44,19 @@ class OCSF(Output):
         - PY-OCSF-Model: https://github.com/prowler-cloud/py-ocsf-models
     """
 
+    def __init__(
+        self,
+        findings: List[Finding],
+        file_path: str = None,
+        file_extension: str = "",
+        from_cli: bool = True,
+        json_lines: bool = False,
+    ) -> None:
+        self.json_lines = json_lines
+        # Number of findings written to the file, to know if the JSON array needs a separator
+        self._written_findings = 0
+        super().__init__(findings, file_path, file_extension, from_cli)
+
     def transform(self, findings: List[Finding]) -> None:
         """Transforms the findings into the OCSF format.
 
@@ -192,32 +205,39 @@ class OCSF(Output):
             )
 
     def batch_write_data_to_file(self) -> None:
-        """Writes the findings to a file using the OCSF format using the `Output._file_descriptor`."""
+        """Writes the findings to a file using the OCSF format using the `Output._file_descriptor`.
+
+        The findings are streamed to the file as compact JSON, without indentation, so every batch is
+        appended to the file. With `json_lines` there is one finding per line (NDJSON), otherwise the
+        findings are written in a JSON array that is closed along with the file.
+        """
         try:
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
             ):
-                if self._file_descriptor.tell() == 0:
-                    self._file_descriptor.write("[")
                 for finding in self._data:
                     try:
-                        self._file_descriptor.write(
-                            finding.json(exclude_none=True, indent=4)
+                        serialized_finding = finding.json(
+                            exclude_none=True, separators=(",", ":")
                         )
-                        self._file_descriptor.write(",")
                     except Exception as error:
                         logger.error(
                             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
+                        continue
+                    if self.json_lines:
+                        self._file_descriptor.write(f"{serialized_finding}\n")
+                    elif self._written_findings:
+                        self._file_descriptor.write(f",{serialized_finding}")
+                    else:
+                        self._file_descriptor.write(f"[{serialized_finding}")
+                    self._written_findings += 1
                 if self.close_file or self._from_cli:
-                    if self._file_descriptor.tell() != 1:
-                        self._file_descriptor.seek(
-                            self._file_descriptor.tell() - 1, os.SEEK_SET
+                    if not self.json_lines:
+                        self._file_descriptor.write(
+                            "]" if self._written_findings else "[]"
                         )
-                    self._file_descriptor.truncate()
-                    self._file_descriptor.write("]")
                     self._file_descriptor.close()
         except Exception as error:
             logger.error(
@@ -6,6 +6,9 @@ from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.finding import Finding
 
+# Value of each Severity, also found by the str value since they have the same hash
+SEVERITIES = {severity: severity.value for severity in Severity}
+
 
 def stdout_report(finding, color, verbose, status, fix):
     if finding.check_metadata.Provider == "aws":
@@ -112,81 +115,76 @@ def extract_findings_statistics(findings: list[Finding]) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    muted_pass = 0
-    muted_fail = 0
-    resources = set()
-    findings_count = 0
-    all_fails_are_muted = True
-    critical_severity_pass = 0
-    critical_severity_fail = 0
-    high_severity_pass = 0
-    high_severity_fail = 0
-    medium_severity_pass = 0
-    medium_severity_fail = 0
-    low_severity_pass = 0
-    low_severity_fail = 0
-    informational_severity_pass = 0
-    informational_severity_fail = 0
-
-    for finding in findings:
-        resources.add(finding.resource_uid)
-
-        if finding.status == Status.PASS:
-            findings_count += 1
-            total_pass += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_pass += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_pass += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_pass += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_pass += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_pass += 1
+    findings_statistics = FindingsStatistics()
+    findings_statistics.update(findings)
+    return findings_statistics.stats
 
-            if finding.muted is True:
-                muted_pass += 1
-
-        if finding.status == Status.FAIL:
-            findings_count += 1
-            total_fail += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_fail += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_fail += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_fail += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_fail += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_fail += 1
 
+class FindingsStatistics:
+    """
+    FindingsStatistics aggregates the statistics returned by extract_findings_statistics incrementally.
+
+    The findings can be added in batches while they are reported, e.g. check by check, so the statistics
+    are available at the end of the scan without keeping all the findings.
+
+    Example:
+        findings_statistics = FindingsStatistics()
+        findings_statistics.update(check_finding_outputs)
+        stats = findings_statistics.stats
+    """
+
+    def __init__(self):
+        self._counts = {
+            "total_pass": 0,
+            "total_muted_pass": 0,
+            "total_fail": 0,
+            "total_muted_fail": 0,
+            "findings_count": 0,
+        }
+        for severity in Severity:
+            self._counts[f"total_{severity.value}_severity_fail"] = 0
+            self._counts[f"total_{severity.value}_severity_pass"] = 0
+        self._resources = set()
+        self._all_fails_are_muted = True
+
+    def update(self, findings: list[Finding]) -> None:
+        """update adds the given findings to the statistics"""
+        counts = self._counts
+        for finding in findings:
+            self._resources.add(finding.resource_uid)
+
+            if finding.status == Status.PASS:
+                status = "pass"
+            elif finding.status == Status.FAIL:
+                status = "fail"
+                if not finding.muted:
+                    self._all_fails_are_muted = False
+            else:
+                continue
+
+            counts["findings_count"] += 1
+            counts[f"total_{status}"] += 1
+            severity = SEVERITIES.get(finding.metadata.Severity)
+            if severity:
+                counts[f"total_{severity}_severity_{status}"] += 1
             if finding.muted is True:
-                muted_fail += 1
-
-            if not finding.muted and all_fails_are_muted:
-                all_fails_are_muted = False
-
-    stats["total_pass"] = total_pass
-    stats["total_muted_pass"] = muted_pass
-    stats["total_fail"] = total_fail
-    stats["total_muted_fail"] = muted_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-    stats["total_critical_severity_fail"] = critical_severity_fail
-    stats["total_critical_severity_pass"] = critical_severity_pass
-    stats["total_high_severity_fail"] = high_severity_fail
-    stats["total_high_severity_pass"] = high_severity_pass
-    stats["total_medium_severity_fail"] = medium_severity_fail
-    stats["total_medium_severity_pass"] = medium_severity_pass
-    stats["total_low_severity_fail"] = low_severity_fail
-    stats["total_low_severity_pass"] = low_severity_pass
-    stats["total_informational_severity_pass"] = informational_severity_pass
-    stats["total_informational_severity_fail"] = informational_severity_fail
-    stats["all_fails_are_muted"] = all_fails_are_muted
-
-    return stats
+                counts[f"total_muted_{status}"] += 1
+
+    @property
+    def stats(self) -> dict:
+        """stats returns the statistics of the findings added, in the format of extract_findings_statistics"""
+        counts = self._counts
+        stats = {
+            "total_pass": counts["total_pass"],
+            "total_muted_pass": counts["total_muted_pass"],
+            "total_fail": counts["total_fail"],
+            "total_muted_fail": counts["total_muted_fail"],
+            "resources_count": len(self._resources),
+            "findings_count": counts["findings_count"],
+        }
+        for severity in Severity:
+            for status in ("fail", "pass"):
+                key = f"total_{severity.value}_severity_{status}"
+                stats[key] = counts[key]
+        stats["all_fails_are_muted"] = self._all_fails_are_muted
+        return stats
@@ -0,0 +1,366 @@
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Any
+
+from prowler.config.config import (
+    csv_file_suffix,
+    encoding_format_utf_8,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
+)
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+    KubernetesISO27001,
+)
+from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+    ProwlerThreatScoreAWS,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+    ProwlerThreatScoreAzure,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+    ProwlerThreatScoreGCP,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+    ProwlerThreatScoreM365,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.output import Output
+from prowler.lib.outputs.outputs import FindingsStatistics
+
+# Output class, file suffix and extra arguments of each output format
+OUTPUT_FORMATS = {
+    "csv": (CSV, csv_file_suffix, {}),
+    "json-asff": (ASFF, json_asff_file_suffix, {}),
+    "json-ocsf": (OCSF, json_ocsf_file_suffix, {}),
+    "ndjson-ocsf": (OCSF, ndjson_ocsf_file_suffix, {"json_lines": True}),
+    "html": (HTML, html_file_suffix, {}),
+}
+
+# Compliance output class of the frameworks of each provider, GenericCompliance if none matches
+COMPLIANCE_OUTPUT_CLASSES = {
+    "aws": [
+        (lambda name: name.startswith("cis_"), AWSCIS),
+        (lambda name: name == "mitre_attack_aws", AWSMitreAttack),
+        (lambda name: name.startswith("ens_"), AWSENS),
+        (
+            lambda name: name.startswith("aws_well_architected_framework"),
+            AWSWellArchitected,
+        ),
+        (lambda name: name.startswith("iso27001_"), AWSISO27001),
+        (lambda name: name.startswith("kisa"), AWSKISAISMSP),
+        (lambda name: name == "prowler_threatscore_aws", ProwlerThreatScoreAWS),
+    ],
+    "azure": [
+        (lambda name: name.startswith("cis_"), AzureCIS),
+        (lambda name: name == "mitre_attack_azure", AzureMitreAttack),
+        (lambda name: name.startswith("ens_"), AzureENS),
+        (lambda name: name.startswith("iso27001_"), AzureISO27001),
+        (lambda name: name == "prowler_threatscore_azure", ProwlerThreatScoreAzure),
+    ],
+    "gcp": [
+        (lambda name: name.startswith("cis_"), GCPCIS),
+        (lambda name: name == "mitre_attack_gcp", GCPMitreAttack),
+        (lambda name: name.startswith("ens_"), GCPENS),
+        (lambda name: name.startswith("iso27001_"), GCPISO27001),
+        (lambda name: name == "prowler_threatscore_gcp", ProwlerThreatScoreGCP),
+    ],
+    "kubernetes": [
+        (lambda name: name.startswith("cis_"), KubernetesCIS),
+        (lambda name: name.startswith("iso27001_"), KubernetesISO27001),
+    ],
+    "m365": [
+        (lambda name: name.startswith("cis_"), M365CIS),
+        (lambda name: name == "prowler_threatscore_m365", ProwlerThreatScoreM365),
+        (lambda name: name.startswith("iso27001_"), M365ISO27001),
+    ],
+    "nhn": [
+        (lambda name: name.startswith("iso27001_"), NHNISO27001),
+    ],
+    "github": [
+        (lambda name: name.startswith("cis_"), GithubCIS),
+    ],
+}
+
+
+def get_compliance_output_class(provider: str, compliance_name: str) -> type:
+    """get_compliance_output_class returns the ComplianceOutput class of the given provider and framework"""
+    for condition, compliance_class in COMPLIANCE_OUTPUT_CLASSES.get(provider, []):
+        if condition(compliance_name):
+            return compliance_class
+    return GenericCompliance
+
+
+class ReportedFinding:
+    """
+    ReportedFinding keeps the fields of a check finding used by the summary and compliance tables.
+
+    Attributes:
+        check_metadata (CheckMetadata): The metadata of the check, shared by all the findings of the check.
+        status (str): The status of the finding.
+        muted (bool): Whether the finding is muted.
+    """
+
+    __slots__ = ("check_metadata", "status", "muted")
+
+    def __init__(self, check_metadata, status: str, muted: bool):
+        self.check_metadata = check_metadata
+        self.status = status
+        self.muted = muted
+
+
+class OutputPipeline:
+    """
+    OutputPipeline writes the outputs of a scan incrementally, as the findings of each check are reported.
+
+    The pipeline is subscribed to the check execution, so every output format and compliance framework
+    is written check by check, and the findings and their transformed copies are released as soon as
+    they are written. Only the statistics and a ReportedFinding for each finding, for the summary and
+    compliance tables, are kept until the end of the scan. The HTML rows are spooled to a temporary
+    file, since its header shows the statistics of the whole scan.
+
+    Attributes:
+        provider (Provider): The provider of the scan.
+        output_options (ProviderOutputOptions): The output options of the scan.
+        generated_outputs (dict): The regular and compliance outputs, as expected by S3.send_to_bucket.
+        findings (list): A ReportedFinding for each finding written.
+        asff_findings (list): The ASFF findings written, only kept with keep_asff_findings for Security Hub.
+
+    Example:
+        output_pipeline = OutputPipeline(provider, output_options, ["csv"], {})
+        execute_checks(..., subscribers=[output_pipeline.write_findings])
+        output_pipeline.close()
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        output_options: Any,
+        output_formats: list,
+        compliance_frameworks: dict[str, Compliance],
+        keep_asff_findings: bool = False,
+    ):
+        """
+        Args:
+            provider (Provider): The provider of the scan.
+            output_options (ProviderOutputOptions): The output options of the scan.
+            output_formats (list): The output formats to write, e.g. ["csv", "json-ocsf"].
+            compliance_frameworks (dict): The compliance frameworks to write, by name.
+            keep_asff_findings (bool): Whether to keep the ASFF findings to send them to Security Hub.
+        """
+        self.provider = provider
+        self.output_options = output_options
+        self.generated_outputs = {"regular": [], "compliance": []}
+        self.findings = []
+        self.asff_findings = []
+        self._keep_asff_findings = keep_asff_findings
+        self._statistics = FindingsStatistics()
+        self._check_metadata = {}
+        self._writers = []
+        self._html_output = None
+        self._html_rows = None
+        self._compliance_writers = []
+
+        filename = f"{output_options.output_directory}/{output_options.output_filename}"
+        for output_format in output_formats:
+            if output_format not in OUTPUT_FORMATS:
+                continue
+            output_class, suffix, kwargs = OUTPUT_FORMATS[output_format]
+            writer = output_class(
+                findings=[],
+                file_path=f"{filename}{suffix}",
+                from_cli=False,
+                **kwargs,
+            )
+            self.generated_outputs["regular"].append(writer)
+            if output_class is HTML:
+                self._html_output = writer
+            else:
+                self._writers.append(writer)
+
+        for compliance_name, compliance in compliance_frameworks.items():
+            compliance_class = get_compliance_output_class(
+                provider.type, compliance_name
+            )
+            writer = compliance_class(
+                findings=[],
+                compliance=compliance,
+                file_path=(
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                ),
+                from_cli=False,
+            )
+            # The name of the framework in the compliance of the findings
+            framework_name = (
+                f"{compliance.Framework}-{compliance.Version}"
+                if compliance.Version
+                else compliance.Framework
+            )
+            # The transform of the compliance outputs appends the rows of the manual requirements, which are only written once at the end
+            writer.transform([], compliance, framework_name)
+            manual_rows = list(writer.data)
+            writer.data.clear()
+            self._compliance_writers.append(
+                (writer, compliance, framework_name, manual_rows)
+            )
+            self.generated_outputs["compliance"].append(writer)
+
+    @property
+    def stats(self) -> dict:
+        """stats returns the statistics of the findings written, as extract_findings_statistics"""
+        return self._statistics.stats
+
+    def write_findings(self, check_findings: list) -> None:
+        """
+        write_findings writes the given check findings to all the outputs.
+
+        Args:
+            check_findings (list): The findings reported by a check.
+        """
+        finding_outputs = []
+        for finding in check_findings:
+            self.findings.append(
+                ReportedFinding(
+                    self._check_metadata.setdefault(
+                        finding.check_metadata.CheckID, finding.check_metadata
+                    ),
+                    finding.status,
+                    finding.muted,
+                )
+            )
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(self.provider, finding, self.output_options)
+                )
+            except Exception:
+                continue
+        if not finding_outputs:
+            return
+        self._statistics.update(finding_outputs)
+
+        for writer in self._writers:
+            self._write(writer, finding_outputs)
+            if self._keep_asff_findings and isinstance(writer, ASFF):
+                self.asff_findings.extend(writer.data)
+            writer.data.clear()
+
+        if self._html_output:
+            try:
+                if self._html_rows is None:
+                    self._html_rows = TemporaryFile(
+                        mode="w+", encoding=encoding_format_utf_8
+                    )
+                self._html_output.transform(finding_outputs)
+                self._html_rows.writelines(self._html_output.data)
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            self._html_output.data.clear()
+
+        for (
+            writer,
+            compliance,
+            framework_name,
+            manual_rows,
+        ) in self._compliance_writers:
+            self._write(
+                writer,
+                finding_outputs,
+                compliance,
+                framework_name,
+                manual_rows=len(manual_rows),
+            )
+            writer.data.clear()
+
+    def close(self) -> None:
+        """close writes the end of the outputs, like the manual requirements or the HTML header, and closes their files"""
+        for writer in self._writers:
+            self._close(writer)
+
+        if self._html_output and self._html_rows is not None:
+            try:
+                self._html_output.create_file_descriptor(self._html_output.file_path)
+                HTML.write_header(
+                    self._html_output.file_descriptor, self.provider, self.stats
+                )
+                self._html_rows.seek(0)
+                copyfileobj(self._html_rows, self._html_output.file_descriptor)
+                HTML.write_footer(self._html_output.file_descriptor)
+                self._html_output.file_descriptor.close()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            finally:
+                self._html_rows.close()
+                self._html_rows = None
+
+        for writer, _, _, manual_rows in self._compliance_writers:
+            # The manual requirements are written after the findings, if there were any
+            if writer.file_descriptor:
+                writer.data.extend(manual_rows)
+            self._close(writer)
+
+    @staticmethod
+    def _write(
+        writer: Output, finding_outputs: list, *transform_args, manual_rows: int = 0
+    ) -> None:
+        try:
+            writer.transform(finding_outputs, *transform_args)
+            if manual_rows:
+                del writer.data[-manual_rows:]
+            if writer.data:
+                if not writer.file_descriptor:
+                    writer.create_file_descriptor(writer.file_path)
+                writer.batch_write_data_to_file()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @staticmethod
+    def _close(writer: Output) -> None:
+        try:
+            if writer.file_descriptor and not writer.file_descriptor.closed:
+                writer.close_file = True
+                writer.batch_write_data_to_file()
+                if not writer.file_descriptor.closed:
+                    writer.file_descriptor.close()
+            writer.data.clear()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
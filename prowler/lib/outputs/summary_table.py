@@ -8,6 +8,7 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
     orange_color,
 )
 from prowler.lib.logger import logger
@@ -149,6 +150,10 @@ def display_summary_table(
                 print(
                     f" - JSON-OCSF: {output_directory}/{output_filename}{json_ocsf_file_suffix}"
                 )
+            if "ndjson-ocsf" in output_options.output_modes:
+                print(
+                    f" - NDJSON-OCSF: {output_directory}/{output_filename}{ndjson_ocsf_file_suffix}"
+                )
             if "csv" in output_options.output_modes:
                 print(f" - CSV: {output_directory}/{output_filename}{csv_file_suffix}")
             if "html" in output_options.output_modes:
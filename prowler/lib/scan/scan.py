@@ -6,12 +6,14 @@ from prowler.lib.check.check import (
     execute,
     import_check,
     list_services,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.models import CheckMetadata, Severity
+from prowler.lib.check.prefetch import ServicePrefetcher
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.finding import Finding
@@ -23,6 +25,7 @@ from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidSeverityError,
     ScanInvalidStatusError,
 )
+from prowler.lib.scan.snapshot import ScanSnapshot
 from prowler.providers.common.models import Audit_Metadata, ProviderOutputOptions
 from prowler.providers.common.provider import Provider
 
@@ -41,6 +44,9 @@ class Scan:
     _status: list[str] = None
     _bulk_checks_metadata: dict[str, CheckMetadata]
     _bulk_compliance_frameworks: dict
+    _max_workers: int = 1
+    _service_workers: int = None
+    _snapshot_file: str = None
 
     def __init__(
         self,
@@ -53,6 +59,9 @@ class Scan:
         excluded_checks: list[str] = None,
         excluded_services: list[str] = None,
         status: list[str] = None,
+        max_workers: int = 1,
+        service_workers: int = None,
+        snapshot_file: str = None,
     ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
@@ -67,6 +76,9 @@ class Scan:
             excluded_checks: list[str] -> The checks to exclude
             excluded_services: list[str] -> The services to exclude
             status: list[str] -> The status of the checks
+            max_workers: int -> The number of checks to execute concurrently, 1 (sequential) by default
+            service_workers: int -> The number of services to load concurrently up front, disabled by default
+            snapshot_file: str -> The snapshot of the previous scan, to reuse the findings of the checks whose resources did not change, disabled by default
 
         Raises:
             ScanInvalidCheckError: If the check does not exist in the provider or is from another provider.
@@ -77,6 +89,9 @@ class Scan:
             ScanInvalidStatusError: If the status does not exist in the provider.
         """
         self._provider = provider
+        self._max_workers = max_workers
+        self._service_workers = service_workers
+        self._snapshot_file = snapshot_file
 
         # Validate the status
         if status:
@@ -218,6 +233,18 @@ class Scan:
     def duration(self) -> int:
         return self._duration
 
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def service_workers(self) -> int:
+        return self._service_workers
+
+    @property
+    def snapshot_file(self) -> str:
+        return self._snapshot_file
+
     @property
     def bulk_checks_metadata(self) -> dict[str, CheckMetadata]:
         return self._bulk_checks_metadata
@@ -266,78 +293,126 @@ class Scan:
 
             start_time = datetime.datetime.now()
 
-            for check_name in checks_to_execute:
-                try:
-                    # Recover service from check name
-                    service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
+            # Load the services needed by the checks concurrently, if enabled
+            prefetcher = ServicePrefetcher(
+                self._provider.type,
+                self._service_checks_to_execute,
+                self._service_workers,
+            )
+
+            # Reuse the findings of the checks whose input did not change since the previous scan, if enabled
+            snapshot = None
+            if self._snapshot_file:
+                snapshot = ScanSnapshot(self._snapshot_file)
+                snapshot_context = (
+                    self._provider.type,
+                    self._provider.identity,
+                    getattr(
+                        getattr(self._provider, "mutelist", None), "mutelist", None
+                    ),
+                    custom_checks_metadata,
+                )
+
+            def check_runner(check_name: str) -> list:
+                # Recover service from check name
+                service = get_service_name_from_check_name(check_name)
+                # Wait until the services used by the check are loaded
+                prefetcher.wait_for_check(check_name)
+                # Import check module
+                check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+                lib = import_check(check_module_path)
+                # Recover functions from check
+                check_to_execute = getattr(lib, check_name)
+                check = check_to_execute()
+
+                def execute_check() -> list:
+                    return execute(
                         check,
                         self._provider,
                         custom_checks_metadata,
                         output_options=None,
                     )
 
-                    # Filter the findings by the status
-                    if self._status:
-                        for finding in check_findings:
-                            if finding.status not in self._status:
-                                check_findings.remove(finding)
-
-                    # Remove the executed check
-                    self._service_checks_to_execute[service].remove(check_name)
-                    if len(self._service_checks_to_execute[service]) == 0:
-                        self._service_checks_to_execute.pop(service, None)
-                    # Add the completed check
-                    if service not in self._service_checks_completed:
-                        self._service_checks_completed[service] = set()
-                    self._service_checks_completed[service].add(check_name)
-                    self._number_of_checks_completed += 1
-
-                    # This should be done just once all the service's checks are completed
-                    # This metadata needs to get to the services not within the provider
-                    # since it is present in the Scan class
-                    self._provider.audit_metadata = update_audit_metadata(
-                        self._provider.audit_metadata,
-                        self.get_completed_services(),
-                        self.get_completed_checks(),
+                # Execute the check, or reuse its previous findings if its input did not change
+                if snapshot:
+                    return snapshot.run_check(
+                        check_name,
+                        lib,
+                        (snapshot_context, check),
+                        execute_check,
                     )
-
-                    findings = []
-                    for finding in check_findings:
+                return execute_check()
+
+            # The checks can be executed concurrently but the results are always
+            # processed here, in the checks_to_execute order, to keep the output stable
+            with prefetcher:
+                for check_name, future in run_checks(
+                    checks_to_execute, check_runner, self._max_workers
+                ):
+                    try:
+                        # Recover service from check name
+                        service = get_service_name_from_check_name(check_name)
                         try:
-                            findings.append(
-                                Finding.generate_output(
-                                    self.provider,
-                                    finding,
-                                    output_options=output_options,
-                                )
+                            check_findings = future.result()
+                        except ModuleNotFoundError:
+                            logger.error(
+                                f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
                             )
-                        except Exception:
                             continue
 
-                    yield self.progress, findings
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                        # Filter the findings by the status
+                        if self._status:
+                            for finding in check_findings:
+                                if finding.status not in self._status:
+                                    check_findings.remove(finding)
+
+                        # Remove the executed check
+                        self._service_checks_to_execute[service].remove(check_name)
+                        if len(self._service_checks_to_execute[service]) == 0:
+                            self._service_checks_to_execute.pop(service, None)
+                        # Add the completed check
+                        if service not in self._service_checks_completed:
+                            self._service_checks_completed[service] = set()
+                        self._service_checks_completed[service].add(check_name)
+                        self._number_of_checks_completed += 1
+
+                        # This should be done just once all the service's checks are completed
+                        # This metadata needs to get to the services not within the provider
+                        # since it is present in the Scan class
+                        self._provider.audit_metadata = update_audit_metadata(
+                            self._provider.audit_metadata,
+                            self.get_completed_services(),
+                            self.get_completed_checks(),
+                        )
+
+                        findings = []
+                        for finding in check_findings:
+                            try:
+                                findings.append(
+                                    Finding.generate_output(
+                                        self.provider,
+                                        finding,
+                                        output_options=output_options,
+                                    )
+                                )
+                            except Exception:
+                                continue
+
+                        yield self.progress, findings
+                    # If check does not exists in the provider or is from another provider
+                    except ModuleNotFoundError:
+                        logger.error(
+                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+                        )
+                    except Exception as error:
+                        logger.error(
+                            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            if snapshot:
+                snapshot.save()
+                logger.info(
+                    f"Scan snapshot {self._snapshot_file}: reused the findings of {snapshot.reused} checks and executed {snapshot.executed} checks"
+                )
             # Update the scan duration when all checks are completed
             self._duration = int((datetime.datetime.now() - start_time).total_seconds())
         except Exception as error:
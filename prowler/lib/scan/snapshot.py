@@ -0,0 +1,372 @@
+import datetime
+import hashlib
+import inspect
+import os
+import pickle
+import zlib
+from enum import Enum
+from threading import Lock
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+from pydantic.v1 import BaseModel
+
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import write_pickle_file
+
+# Version of the format of the snapshot files, increase it when the format changes
+SCAN_SNAPSHOT_VERSION = 1
+# Attributes of the services that hold the clients to the provider instead of the audited resources
+SERVICE_INFRASTRUCTURE_ATTRIBUTES = {
+    "provider",
+    "session",
+    "client",
+    "clients",
+    "regional_clients",
+    "thread_pool",
+    "rate_limiter",
+}
+# Modules that make a check depend on the time it is executed, e.g. to compare the age of a resource
+TIME_MODULES = {"datetime", "time", "dateutil"}
+
+
+class ScanSnapshot:
+    """
+    ScanSnapshot is the local snapshot of a previous scan, used to reuse the findings of the checks whose input did not change.
+
+    The findings of every check are stored together with the fingerprint of its input: the resources of the
+    services that the check reads, i.e. the fields of their models, and the scan context like the audited
+    identity, the mutelist and the check metadata. In the next scan, a check whose fingerprint did not change
+    is not executed again and its previous findings are reused, while the checks with any added, removed or
+    changed resource are executed as usual. The checks that depend on the time they are executed, e.g. the age
+    of a key, are always executed.
+
+    The snapshot is only an optimization: if it cannot be read or written, or it was written by another version
+    of Prowler, every check is executed.
+
+    Attributes:
+        path (str): The path of the snapshot file.
+        reused (int): The number of checks whose findings were reused.
+        executed (int): The number of checks executed and stored.
+
+    Example:
+        snapshot = ScanSnapshot("scan.snapshot")
+        reports = snapshot.run_check(check_name, check_module, context, lambda: execute(...))
+        snapshot.save()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reused = 0
+        self.executed = 0
+        self._version = (SCAN_SNAPSHOT_VERSION, prowler_version)
+        self._previous_entries = self._load()
+        self._entries = {}
+        self._service_fingerprints = {}
+        self._lock = Lock()
+
+    def run_check(
+        self,
+        check_name: str,
+        check_module: ModuleType,
+        context: Any,
+        execute_check: Callable[[], list],
+    ) -> list:
+        """
+        run_check returns the findings of the check in the previous scan if its input did not change, otherwise it executes the check and stores its findings.
+
+        Args:
+            check_name (str): The name of the check.
+            check_module (ModuleType): The module of the check.
+            context (Any): The context of the scan that changes the findings of the check, e.g. the mutelist.
+            execute_check (Callable[[], list]): The function that executes the check and returns its findings.
+
+        Returns:
+            list: The findings of the check.
+        """
+        fingerprint = self.get_check_fingerprint(check_module, context)
+        reports = self.get_check_reports(check_name, fingerprint)
+        if reports is None:
+            reports = execute_check()
+            self.put_check_reports(check_name, fingerprint, reports)
+        return reports
+
+    def get_check_fingerprint(
+        self, check_module: ModuleType, context: Any = None
+    ) -> Optional[str]:
+        """
+        get_check_fingerprint returns the fingerprint of the input of the check: its context and the services it reads.
+
+        The services are the clients, the module variables ending with "_client", of the check module and of
+        the Prowler modules of the functions that it uses, e.g. its helpers.
+
+        Args:
+            check_module (ModuleType): The module of the check.
+            context (Any): The context of the scan that changes the findings of the check, e.g. the mutelist.
+
+        Returns:
+            Optional[str]: The fingerprint, or None if the findings of the check cannot be reused.
+        """
+        try:
+            modules = get_check_modules(check_module)
+            if any(is_time_dependent(module) for module in modules):
+                return None
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr(canonicalize(context)).encode())
+            for client_name, client in sorted(get_module_clients(modules).items()):
+                digest.update(client_name.encode())
+                digest.update(self.get_service_fingerprint(client).encode())
+            return digest.hexdigest()
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    def get_service_fingerprint(self, service: Any) -> str:
+        """
+        get_service_fingerprint returns the fingerprint of the resources of the service, computed once per service.
+
+        Args:
+            service (Any): The service, e.g. the object of ec2_client.
+
+        Returns:
+            str: The fingerprint of the public attributes of the service.
+        """
+        with self._lock:
+            fingerprint = self._service_fingerprints.get(id(service))
+            if fingerprint is None:
+                # The lazy attributes of the service are loaded, so they are part of the fingerprint too
+                load_all_attributes = getattr(
+                    type(service), "load_all_attributes", None
+                )
+                if load_all_attributes:
+                    load_all_attributes(service)
+                attributes = {
+                    name: value
+                    for name, value in vars(service).items()
+                    if not name.startswith("_")
+                    and name not in SERVICE_INFRASTRUCTURE_ATTRIBUTES
+                }
+                fingerprint = hashlib.blake2b(
+                    repr(canonicalize(attributes)).encode(), digest_size=16
+                ).hexdigest()
+                self._service_fingerprints[id(service)] = fingerprint
+            return fingerprint
+
+    def get_check_reports(
+        self, check_name: str, fingerprint: Optional[str]
+    ) -> Optional[list]:
+        """
+        get_check_reports returns the findings of the check in the previous scan if its fingerprint did not change.
+
+        Args:
+            check_name (str): The name of the check.
+            fingerprint (Optional[str]): The fingerprint of the input of the check.
+
+        Returns:
+            Optional[list]: The findings of the check, or None if the check has to be executed.
+        """
+        if fingerprint is None:
+            return None
+        entry = self._previous_entries.get(check_name)
+        if not entry or entry[0] != fingerprint:
+            return None
+        try:
+            reports = pickle.loads(zlib.decompress(entry[1]))
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+        with self._lock:
+            self._entries[check_name] = entry
+            self.reused += 1
+        return reports
+
+    def put_check_reports(
+        self, check_name: str, fingerprint: Optional[str], reports: list
+    ) -> None:
+        """
+        put_check_reports stores the findings of the executed check with the fingerprint of its input.
+
+        Args:
+            check_name (str): The name of the check.
+            fingerprint (Optional[str]): The fingerprint of the input of the check.
+            reports (list): The findings of the check.
+        """
+        with self._lock:
+            self.executed += 1
+        if fingerprint is None:
+            return
+        try:
+            for report in reports:
+                # Store the resource of the finding as a dict instead of the resource model
+                report.resource
+            entry = (
+                fingerprint,
+                zlib.compress(pickle.dumps(reports, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return
+        with self._lock:
+            self._entries[check_name] = entry
+
+    def save(self) -> None:
+        """save writes the snapshot file, keeping the findings of the checks that were not executed in this scan."""
+        try:
+            with self._lock:
+                entries = {**self._previous_entries, **self._entries}
+            write_pickle_file(
+                self.path,
+                {"version": self._version, "entries": entries},
+                prefix=".scan_snapshot_",
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _load(self) -> dict:
+        """_load reads the snapshot file, discarding it if it is not valid."""
+        try:
+            if os.path.isfile(self.path):
+                with open(self.path, "rb") as file:
+                    snapshot = pickle.load(file)
+                if snapshot.get("version") == self._version:
+                    return snapshot["entries"]
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return {}
+
+
+def get_check_modules(check_module: ModuleType) -> list[ModuleType]:
+    """
+    get_check_modules returns the check module and the Prowler modules of the functions that it uses, e.g. its helpers.
+
+    Args:
+        check_module (ModuleType): The module of the check.
+
+    Returns:
+        list[ModuleType]: The modules, starting with the check module.
+    """
+    modules = {check_module.__name__: check_module}
+    for value in vars(check_module).values():
+        if inspect.isfunction(value):
+            module = inspect.getmodule(value)
+            if (
+                module
+                and module.__name__.startswith("prowler.providers.")
+                and module.__name__ not in modules
+            ):
+                modules[module.__name__] = module
+    return list(modules.values())
+
+
+def get_module_clients(modules: list[ModuleType]) -> dict[str, Any]:
+    """
+    get_module_clients returns the clients, the variables ending with "_client", of the given modules.
+
+    Args:
+        modules (list[ModuleType]): The modules.
+
+    Returns:
+        dict[str, Any]: The clients by name.
+    """
+    clients = {}
+    for module in modules:
+        for name, value in vars(module).items():
+            if (
+                name.endswith("_client")
+                and not inspect.ismodule(value)
+                and not inspect.isclass(value)
+                and not callable(value)
+            ):
+                clients[name] = value
+    return clients
+
+
+def is_time_dependent(module: ModuleType) -> bool:
+    """
+    is_time_dependent returns True if the module uses the time, e.g. the datetime module, so its results change over time.
+
+    Args:
+        module (ModuleType): The module.
+
+    Returns:
+        bool: True if the module uses the time, False otherwise.
+    """
+    for value in vars(module).values():
+        value_module = value if inspect.ismodule(value) else inspect.getmodule(value)
+        if value_module and value_module.__name__.split(".")[0] in TIME_MODULES:
+            return True
+    return False
+
+
+def canonicalize(value: Any, seen: Optional[set] = None) -> Any:
+    """
+    canonicalize converts the value to a structure of built-in types with a stable representation, to be hashed.
+
+    Dictionaries and sets are sorted and pydantic models and other objects are converted to their fields. The
+    values without a stable representation are converted to their type, so they never change the fingerprint.
+
+    Args:
+        value (Any): The value, e.g. the resources of a service.
+        seen (Optional[set]): The objects being converted, to stop at reference cycles.
+
+    Returns:
+        Any: The canonical value.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, Enum):
+        return canonicalize(value.value, seen)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return "<cycle>"
+    seen.add(id(value))
+    try:
+        if isinstance(value, BaseModel):
+            return [
+                type(value).__name__,
+                canonicalize(value.dict(), seen),
+            ]
+        if isinstance(value, dict):
+            return sorted(
+                (
+                    (repr(canonicalize(key, seen)), canonicalize(item, seen))
+                    for key, item in value.items()
+                ),
+                key=lambda item: item[0],
+            )
+        if isinstance(value, (list, tuple)):
+            return [canonicalize(item, seen) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted(repr(canonicalize(item, seen)) for item in value)
+        if hasattr(value, "__dict__") and not (
+            inspect.ismodule(value) or inspect.isclass(value) or callable(value)
+        ):
+            return [
+                type(value).__name__,
+                canonicalize(
+                    {
+                        name: item
+                        for name, item in vars(value).items()
+                        if not name.startswith("_")
+                        and name not in SERVICE_INFRASTRUCTURE_ATTRIBUTES
+                    },
+                    seen,
+                ),
+            ]
+        return type(value).__name__
+    finally:
+        seen.discard(id(value))
@@ -1,6 +1,69 @@
+from bisect import bisect_left
+from typing import Iterable
+
 from prowler.lib.logger import logger
 
 
+class AuditResources(list):
+    """
+    AuditResources is the list of resources to audit, e.g. the input ARNs, indexed to filter the resources of the services.
+
+    A resource is filtered when it is part of any of the resources to audit, like the original substring match
+    against the whole list. The exact resources are kept in a set and the ARNs in a sorted list, where the ARNs
+    starting with a resource are found with a binary search, so filtering a resource does not build nor search
+    the string of the whole list. Only the resources that are not ARNs, e.g. names or IDs, are still searched
+    within the string of the list, built once.
+
+    The index is built the first time a resource is filtered and again when resources are added or removed.
+
+    Example:
+        audit_resources = AuditResources(["arn:aws:s3:::test_bucket"])
+        audit_resources.is_filtered("arn:aws:s3:::test_bucket")
+    """
+
+    def __init__(self, resources: Iterable[str] = ()):
+        super().__init__(resources)
+        self._indexed_count = None
+
+    def is_filtered(self, resource: str) -> bool:
+        """
+        is_filtered returns True if the resource is part of any of the resources to audit.
+
+        Args:
+            resource (str): The resource, usually its ARN.
+
+        Returns:
+            bool: True if the resource is filtered, False otherwise.
+        """
+        if self._indexed_count != len(self):
+            self._build_index()
+        if resource in self._resources:
+            return True
+        if resource.startswith("arn:"):
+            # An ARN can only be found at the beginning of the ARNs to audit
+            position = bisect_left(self._arns, resource)
+            if position < len(self._arns) and self._arns[position].startswith(resource):
+                return True
+            return resource in self._other_resources_string
+        return resource in self._resources_string
+
+    def _build_index(self) -> None:
+        """_build_index indexes the resources to audit."""
+        self._resources = set(self)
+        self._resources_string = str(list(self))
+        # ARNs including another "arn:" are searched as strings, like the resources that are not ARNs
+        self._arns = sorted(
+            resource
+            for resource in self._resources
+            if resource.startswith("arn:") and resource.find("arn:", 1) == -1
+        )
+        arns = set(self._arns)
+        self._other_resources_string = str(
+            [resource for resource in self if resource not in arns]
+        )
+        self._indexed_count = len(self)
+
+
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
@@ -8,6 +71,8 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
+        if isinstance(audit_resources, AuditResources):
+            return audit_resources.is_filtered(resource)
         if resource in str(audit_resources):
             return True
         return False
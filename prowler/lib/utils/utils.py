@@ -1,5 +1,7 @@
 import json
 import os
+import pickle
+import tempfile
 from operator import attrgetter
 
 try:
@@ -10,18 +12,35 @@ except ImportError:
 
 import re
 import sys
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from hashlib import sha512
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from multiprocessing import get_context
 from os.path import exists
+from threading import Lock
 from time import mktime
 from typing import Any, Optional
 
 from colorama import Style
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
+from detect_secrets.core.scan import (
+    MAX_LINE_LENGTH,
+    MIN_LINE_LENGTH,
+    _is_filtered_out,
+    _scan_line,
+)
+from detect_secrets.settings import (
+    cache_bust,
+    configure_settings_from_baseline,
+    get_filters,
+    get_plugins,
+    get_settings,
+)
+from detect_secrets.transformers import get_transformed_file
+from detect_secrets.util.code_snippet import get_code_snippet
+from detect_secrets.util.filetype import FileType, determine_file_type
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
@@ -106,6 +125,32 @@ def file_exists(filename: str):
         return exists_filename
 
 
+def write_pickle_file(path: str, data: Any, prefix: str = ".") -> None:
+    """
+    write_pickle_file pickles the given data into the file, creating its directory if needed.
+
+    The data is written to a temporary file that is then renamed, so a concurrent run never reads a partial file.
+
+    Args:
+        path (str): The path of the file.
+        data (Any): The data to pickle.
+        prefix (str): The prefix of the temporary file, in the directory of the file.
+
+    Raises:
+        Exception: If the file cannot be written, the temporary file is removed.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=prefix)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+    except Exception:
+        os.remove(temporary_path)
+        raise
+
+
 def hash_sha512(string: str) -> str:
     """hash_sha512 returns the first 9 bytes of the SHA512 representation for the given string."""
     return sha512(string.encode(encoding_format_utf_8)).hexdigest()[0:9]
@@ -133,55 +178,275 @@ def detect_secrets_scan(
         >>> detect_secrets_scan(file="file.txt")
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
-    try:
-        if not file:
-            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-            temp_data_file.close()
+    secrets_scanner = get_secrets_scanner(excluded_secrets, detect_secrets_plugins)
+    if file:
+        return secrets_scanner.scan_file(file)
+    return secrets_scanner.scan(data)
+
 
-        secrets = SecretsCollection()
+class SecretsScanner:
+    """SecretsScanner scans data for secrets in memory using the detect-secrets library.
 
-        if not detect_secrets_plugins:
-            detect_secrets_plugins = default_detect_secrets_plugins
+    The detect-secrets plugins and filters are configured once and kept while the following
+    scans use the same settings, and the data is scanned without writing it to a file.
+    Batches of data can be scanned by a pool of processes.
+    """
 
-        settings = {
-            "plugins_used": detect_secrets_plugins,
+    # The detect-secrets settings are global, so the scans are serialized and the settings
+    # are only configured again when a scanner with other settings is used
+    _lock = Lock()
+    _configured_settings = None
+
+    def __init__(
+        self,
+        excluded_secrets: list[str] = None,
+        detect_secrets_plugins: dict = None,
+    ):
+        """
+        Args:
+            excluded_secrets (list): A list of regex patterns to exclude from the scan.
+            detect_secrets_plugins (dict): The detect-secrets plugins to use for the scan.
+        """
+        self.excluded_secrets = excluded_secrets
+        self.detect_secrets_plugins = detect_secrets_plugins
+        self.settings = {
+            "plugins_used": detect_secrets_plugins or default_detect_secrets_plugins,
             "filters_used": [
-                {"path": "detect_secrets.filters.common.is_invalid_file"},
                 {"path": "detect_secrets.filters.common.is_known_false_positive"},
                 {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
                 {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
             ],
         }
-
         if excluded_secrets and len(excluded_secrets) > 0:
-            settings["filters_used"].append(
+            self.settings["filters_used"].append(
                 {
                     "path": "detect_secrets.filters.regex.should_exclude_line",
                     "pattern": excluded_secrets,
                 }
             )
-        with transient_settings(settings):
-            if file:
-                secrets.scan_file(file)
+        self._settings_key = json.dumps(self.settings, sort_keys=True)
+        self._pool = None
+        self._pool_processes = None
+        # The batches can be scanned from several threads, e.g. while the services are loaded
+        self._pool_lock = Lock()
+
+    def _configure(self) -> None:
+        """Configures the detect-secrets settings of the scanner if they are not in use."""
+        if SecretsScanner._configured_settings != self._settings_key:
+            cache_bust()
+            configure_settings_from_baseline(self.settings)
+            # The data is not read from a file, so there is no file to validate
+            get_settings().disable_filters(
+                "detect_secrets.filters.common.is_invalid_file"
+            )
+            get_filters.cache_clear()
+            SecretsScanner._configured_settings = self._settings_key
+
+    def scan(self, data, filename: str = "data") -> Optional[list[dict]]:
+        """scan scans a string or bytes buffer for secrets.
+        Args:
+            data (str or bytes): The data to scan for secrets.
+            filename (str): The name of the data, used as the filename of the secrets and to pick the detect-secrets file transformers.
+        Returns:
+            list: The secrets found in the data, or None if there are no secrets.
+        """
+        try:
+            if isinstance(data, bytes):
+                text = data.decode(encoding_format_utf_8)
             else:
-                secrets.scan_file(temp_data_file.name)
+                # Same text read back from the data file the scans used to write
+                text = (
+                    (data or "")
+                    .encode("raw_unicode_escape")
+                    .decode(encoding_format_utf_8)
+                )
+        except UnicodeDecodeError:
+            # Binary data is ignored
+            return None
+        try:
+            with SecretsScanner._lock:
+                self._configure()
+                secrets = SecretsCollection()
+                for secret in self._scan_text(text, filename):
+                    secrets[filename].add(secret)
+                detect_secrets_output = secrets.json()
+            return detect_secrets_output.get(filename)
+        except Exception as e:
+            logger.error(f"Error scanning for secrets: {e}")
+            return None
+
+    def scan_file(self, file: str) -> Optional[list[dict]]:
+        """scan_file scans a file for secrets.
+        Args:
+            file (str): The path of the file to scan for secrets.
+        Returns:
+            list: The secrets found in the file, or None if there are no secrets.
+        """
+        try:
+            if not os.path.isfile(file):
+                return None
+            with open(file, "rb") as f:
+                data = f.read()
+        except Exception as e:
+            logger.error(f"Error scanning for secrets: {e}")
+            return None
+        return self.scan(data, filename=file)
+
+    def scan_batch(self, data: list, processes: int = 1) -> list[Optional[list[dict]]]:
+        """scan_batch scans several strings or bytes buffers for secrets.
+        Args:
+            data (list): The data to scan for secrets.
+            processes (int): The number of processes to scan the data. With 1 the data is scanned in this process.
+        Returns:
+            list: The secrets found in each item of the data, or None for the items without secrets.
+        """
+        if processes > 1 and len(data) > 1:
+            try:
+                return list(
+                    self._get_pool(processes).map(
+                        _scan_in_secrets_scanner_process,
+                        data,
+                        chunksize=max(1, len(data) // (processes * 4)),
+                    )
+                )
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                self.close()
+        return [self.scan(item) for item in data]
+
+    def close(self) -> None:
+        """close shuts down the pool of processes of the scanner, if any."""
+        with self._pool_lock:
+            self._close_pool()
+
+    def _close_pool(self) -> None:
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+            self._pool_processes = None
+
+    def _get_pool(self, processes: int) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool_processes != processes:
+                self._close_pool()
+                # The processes are spawned since the scan runs from threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=processes,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_secrets_scanner_process,
+                    initargs=(self.excluded_secrets, self.detect_secrets_plugins),
+                )
+                self._pool_processes = processes
+            return self._pool
+
+    def _scan_text(self, text: str, filename: str):
+        """Scans the lines of the text like detect-secrets scans the lines of a file."""
+        if not get_plugins():
+            return
+        if _is_filtered_out(required_filter_parameters=["filename"], filename=filename):
+            return
+        raw_lines = StringIO(text, newline=None).readlines()
+        file = _NamedStringIO(text, filename)
+        lines = get_transformed_file(file) or file.readlines()
+        has_secret = False
+        for secret in self._scan_lines(lines, raw_lines, filename):
+            has_secret = True
+            yield secret
+        if has_secret:
+            return
+        # If the lines are not useful, try the eager file transformers
+        file.seek(0)
+        lines = get_transformed_file(file, use_eager_transformers=True)
+        if lines:
+            yield from self._scan_lines(lines, raw_lines, filename)
+
+    @staticmethod
+    def _scan_lines(lines: list[str], raw_lines: list[str], filename: str):
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if len(line) < MIN_LINE_LENGTH or len(line) > MAX_LINE_LENGTH:
+                continue
+            code_snippet = get_code_snippet(lines=lines, line_number=line_number)
+            raw_code_snippet = get_code_snippet(
+                lines=raw_lines, line_number=line_number
+            )
+            if _is_filtered_out(
+                required_filter_parameters=["line"],
+                filename=filename,
+                line=line,
+                context=code_snippet,
+            ):
+                continue
+            for plugin in get_plugins():
+                for secret in _scan_line(
+                    plugin=plugin,
+                    filename=filename,
+                    line=line,
+                    line_number=line_number,
+                    context=code_snippet,
+                    raw_context=raw_code_snippet,
+                    commit_hash="",
+                ):
+                    secret.is_removed = False
+                    secret.is_added = False
+                    if _is_filtered_out(
+                        required_filter_parameters=["context"],
+                        filename=secret.filename,
+                        secret=secret.secret_value,
+                        plugin=plugin,
+                        line=line,
+                        context=code_snippet,
+                    ):
+                        continue
+                    if (
+                        determine_file_type(filename) == FileType.YAML
+                        and secret.secret_value
+                    ):
+                        # YAML multi-line strings are grouped in one line
+                        for index, raw_line in enumerate(raw_lines[line_number - 1 :]):
+                            if secret.secret_value in raw_line:
+                                secret.line_number = line_number + index
+                                break
+                    yield secret
+
+
+class _NamedStringIO(StringIO):
+    """In memory text file with a name, as the detect-secrets file transformers need."""
+
+    def __init__(self, text: str, name: str):
+        super().__init__(text, newline=None)
+        self.name = name
+
+
+_secrets_scanners = {}
+_secrets_scanner_process = None
+
+
+def get_secrets_scanner(
+    excluded_secrets: list[str] = None, detect_secrets_plugins: dict = None
+) -> SecretsScanner:
+    """get_secrets_scanner returns the shared SecretsScanner for the given settings.
+    Args:
+        excluded_secrets (list): A list of regex patterns to exclude from the scan.
+        detect_secrets_plugins (dict): The detect-secrets plugins to use for the scan.
+    Returns:
+        SecretsScanner: The scanner, created the first time its settings are used.
+    """
+    secrets_scanner = SecretsScanner(excluded_secrets, detect_secrets_plugins)
+    return _secrets_scanners.setdefault(secrets_scanner._settings_key, secrets_scanner)
 
-        if not file:
-            os.remove(temp_data_file.name)
 
-        detect_secrets_output = secrets.json()
+def _init_secrets_scanner_process(
+    excluded_secrets: list[str], detect_secrets_plugins: dict
+) -> None:
+    global _secrets_scanner_process
+    _secrets_scanner_process = SecretsScanner(excluded_secrets, detect_secrets_plugins)
 
-        if detect_secrets_output:
-            if file:
-                return detect_secrets_output[file]
-            else:
-                return detect_secrets_output[temp_data_file.name]
-        else:
-            return None
-    except Exception as e:
-        logger.error(f"Error scanning for secrets: {e}")
-        return None
+
+def _scan_in_secrets_scanner_process(data) -> Optional[list[dict]]:
+    return _secrets_scanner_process.scan(data)
 
 
 def validate_ip_address(ip_string):
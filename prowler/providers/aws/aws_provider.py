@@ -1,7 +1,9 @@
 import os
 import pathlib
 from datetime import datetime
+from functools import lru_cache
 from re import fullmatch
+from threading import Lock
 from typing import Optional
 
 from boto3.session import Session
@@ -21,6 +23,7 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import AuditResources
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
@@ -54,6 +57,18 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.service.rate_limiter import (
+    get_api_rate_limiter,
+    set_api_rate_limiter,
+)
+from prowler.providers.aws.lib.service.response_cache import (
+    get_api_response_cache,
+    set_api_response_cache,
+)
+from prowler.providers.aws.lib.service.worker_pool import (
+    get_api_worker_pool,
+    set_api_worker_pool,
+)
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -69,6 +84,13 @@ from prowler.providers.common.models import Audit_Metadata, Connection
 from prowler.providers.common.provider import Provider
 
 
+# Default size of the connection pool of the botocore clients
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# The clients are created once per session, service and region and shared by all the services
+AWS_CLIENTS_LOCK = Lock()
+
+
 class AwsProvider(Provider):
     """
     AwsProvider class is the main class for the AWS provider.
@@ -98,6 +120,7 @@ class AwsProvider(Provider):
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
+    _clients: dict
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -123,6 +146,13 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        api_max_workers: int = None,
+        api_max_workers_per_service: int = None,
+        api_max_workers_per_region: int = None,
+        api_rate_limit: float = None,
+        api_cache_ttl: int = None,
+        api_cache_max_size: int = None,
+        api_cache_file: str = None,
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +178,13 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - api_max_workers: The maximum number of concurrent AWS API calls shared by all the services, optional.
+            - api_max_workers_per_service: The maximum number of concurrent AWS API calls for the same service, optional.
+            - api_max_workers_per_region: The maximum number of concurrent AWS API calls for the same region, optional.
+            - api_rate_limit: The maximum rate, in requests per second, of the AWS API calls for each service and region, lowered adaptively when AWS throttles the calls, optional.
+            - api_cache_ttl: The time to live, in seconds, of the on-disk cache of the AWS API responses. The cache is disabled if not set.
+            - api_cache_max_size: The maximum size, in megabytes, of the on-disk cache of the AWS API responses, optional.
+            - api_cache_file: The path of the on-disk cache of the AWS API responses, optional.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -190,6 +227,9 @@ class AwsProvider(Provider):
 
         logger.info("Initializing AWS provider ...")
 
+        # Clients by session, service and region, shared by all the services
+        self._clients = {}
+
         ######## AWS Session
         logger.info("Generating original session ...")
 
@@ -330,11 +370,13 @@ class AwsProvider(Provider):
 
         # Parse Scan Tags
         if resource_tags:
-            self._audit_resources = self.get_tagged_resources(resource_tags)
+            self._audit_resources = AuditResources(
+                self.get_tagged_resources(resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if resource_arn:
-            self._audit_resources = resource_arn
+            self._audit_resources = AuditResources(resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -355,6 +397,22 @@ class AwsProvider(Provider):
         # Fixer Config
         self._fixer_config = fixer_config
 
+        # Shared API worker pool used by all the AWS services
+        if api_max_workers or api_max_workers_per_service or api_max_workers_per_region:
+            set_api_worker_pool(
+                max_workers=api_max_workers,
+                max_workers_per_service=api_max_workers_per_service,
+                max_workers_per_region=api_max_workers_per_region,
+            )
+
+        # Adaptive rate limiter and API calls stats of the clients of this provider
+        set_api_rate_limiter(max_rate=api_rate_limit)
+
+        # On-disk cache of the AWS API responses, disabled if the TTL is not set
+        set_api_response_cache(
+            ttl=api_cache_ttl, max_size=api_cache_max_size, path=api_cache_file
+        )
+
         # Mutelist
         if mutelist_content:
             self._mutelist = AWSMutelist(
@@ -738,11 +796,7 @@ class AwsProvider(Provider):
                 enabled_regions = service_regions
 
             for region in enabled_regions:
-                regional_client = self._session.current_session.client(
-                    service, region_name=region, config=self._session.session_config
-                )
-                regional_client.region = region
-                regional_clients[region] = regional_client
+                regional_clients[region] = self.get_client(service, region)
 
             return regional_clients
         except Exception as error:
@@ -750,6 +804,54 @@ class AwsProvider(Provider):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def get_client(self, service: str, region: str):
+        """
+        get_client returns the client of the given service and region for the current session.
+
+        The client is created the first time it is needed and shared by all the services using it, e.g. CloudWatch
+        and Logs, with the API rate limiter and the API responses cache hooked into it.
+
+        Args:
+            - service: The AWS service name, e.g. "ec2".
+            - region: The AWS region name, e.g. "eu-west-1".
+
+        Returns:
+            - The boto3 client, with its region in the region attribute.
+        """
+        session = self._session.current_session
+        with AWS_CLIENTS_LOCK:
+            # The session is part of the key, so the clients are created again if the session changes
+            client = self._clients.get((session, service, region))
+            if client is None:
+                client = session.client(
+                    service, region_name=region, config=self.get_client_config()
+                )
+                client.region = region
+                get_api_rate_limiter().register_client(client, service, region)
+                if get_api_response_cache():
+                    get_api_response_cache().register_client(
+                        client, self._identity.account, service, region
+                    )
+                self._clients[(session, service, region)] = client
+            return client
+
+    def get_client_config(self) -> Config:
+        """
+        get_client_config returns the botocore Config of the clients, with the session configuration and a connection
+        pool big enough for the API calls the shared API worker pool can make at the same time.
+
+        Returns:
+            - Config: The botocore Config object
+        """
+        config = Config(
+            max_pool_connections=max(
+                DEFAULT_MAX_POOL_CONNECTIONS, get_api_worker_pool().max_workers
+            )
+        )
+        if self._session.session_config:
+            config = self._session.session_config.merge(config)
+        return config
+
     @staticmethod
     def get_available_aws_service_regions(
         service: str, partition: str = "aws", audited_regions: set = None
@@ -1525,10 +1627,15 @@ class AwsProvider(Provider):
             raise error
 
 
+@lru_cache(maxsize=None)
 def read_aws_regions_file() -> dict:
     """
     Reads the AWS services JSON file and returns the parsed data as a dictionary.
 
+    The file is only read and parsed the first time, the following calls return the same dictionary,
+    so it must not be modified. read_aws_regions_file.cache_clear() resets it, e.g. in the tests patching
+    the parsed data.
+
     Returns:
         dict: The parsed data from the AWS services JSON file.
     """
@@ -149,6 +149,60 @@ def init_parser(self):
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
 
+    # AWS API Concurrency
+    aws_api_concurrency_subparser = aws_parser.add_argument_group("AWS API Concurrency")
+    aws_api_concurrency_subparser.add_argument(
+        "--aws-api-workers",
+        nargs="?",
+        default=None,
+        type=validate_api_workers,
+        help="Set the maximum number of concurrent AWS API calls, shared by all the services (Default: 10)",
+    )
+    aws_api_concurrency_subparser.add_argument(
+        "--aws-api-workers-per-service",
+        nargs="?",
+        default=None,
+        type=validate_api_workers,
+        help="Set the maximum number of concurrent AWS API calls for the same service (Default: unlimited)",
+    )
+    aws_api_concurrency_subparser.add_argument(
+        "--aws-api-workers-per-region",
+        nargs="?",
+        default=None,
+        type=validate_api_workers,
+        help="Set the maximum number of concurrent AWS API calls for the same region (Default: unlimited)",
+    )
+    aws_api_concurrency_subparser.add_argument(
+        "--aws-api-rate-limit",
+        nargs="?",
+        default=None,
+        type=validate_api_rate_limit,
+        help="Set the maximum number of AWS API requests per second for each service and region, lowered adaptively when AWS throttles the requests (Default: unlimited)",
+    )
+
+    # AWS API Responses Cache
+    aws_api_cache_subparser = aws_parser.add_argument_group("AWS API Responses Cache")
+    aws_api_cache_subparser.add_argument(
+        "--aws-api-cache-ttl",
+        nargs="?",
+        default=None,
+        type=validate_positive_integer,
+        help="Enable the on-disk cache of the AWS API responses with the given time to live in seconds, so scans of the same account within the TTL reuse the responses (Default: disabled)",
+    )
+    aws_api_cache_subparser.add_argument(
+        "--aws-api-cache-max-size",
+        nargs="?",
+        default=None,
+        type=validate_positive_integer,
+        help="Set the maximum size in megabytes of the AWS API responses cache, the oldest responses are evicted when it is full (Default: 512)",
+    )
+    aws_api_cache_subparser.add_argument(
+        "--aws-api-cache-file",
+        nargs="?",
+        default=None,
+        help="Set the path of the AWS API responses cache (Default: ~/.prowler/aws_api_cache.db)",
+    )
+
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
         "Scan Unused Services"
@@ -180,6 +234,39 @@ def validate_session_duration(session_duration: int) -> int:
         return duration
 
 
+def validate_api_workers(workers: str) -> int:
+    """validate_api_workers validates that the input number of AWS API workers is a positive integer"""
+    try:
+        workers = int(workers)
+    except ValueError:
+        raise ArgumentTypeError("The number of AWS API workers must be an integer")
+    if workers < 1:
+        raise ArgumentTypeError("The number of AWS API workers must be at least 1")
+    return workers
+
+
+def validate_positive_integer(value: str) -> int:
+    """validate_positive_integer validates that the input value is a positive integer"""
+    try:
+        value = int(value)
+    except ValueError:
+        raise ArgumentTypeError("The value must be an integer")
+    if value < 1:
+        raise ArgumentTypeError("The value must be greater than 0")
+    return value
+
+
+def validate_api_rate_limit(rate_limit: str) -> float:
+    """validate_api_rate_limit validates that the input AWS API rate limit is a positive number"""
+    try:
+        rate_limit = float(rate_limit)
+    except ValueError:
+        raise ArgumentTypeError("The AWS API rate limit must be a number")
+    if rate_limit <= 0:
+        raise ArgumentTypeError("The AWS API rate limit must be greater than 0")
+    return rate_limit
+
+
 def validate_role_session_name(session_name) -> str:
     """
     Validates that the role session name is valid.
@@ -43,6 +43,18 @@ class AWSMutelist(Mutelist):
         if self._mutelist:
             self._mutelist = self.validate_mutelist(self._mutelist)
 
+    def get_finding_fields(
+        self,
+        finding: Check_Report_AWS,
+        aws_account_id: str,
+    ) -> tuple:
+        return (
+            aws_account_id,
+            finding.check_metadata.CheckID,
+            finding.region,
+            finding.resource_id,
+        )
+
     def is_finding_muted(
         self,
         finding: Check_Report_AWS,
@@ -162,6 +162,8 @@ class S3:
         subfolder_name = ""
         if extension == ".ocsf.json":
             subfolder_name = "json-ocsf"
+        elif extension == ".ocsf.ndjson":
+            subfolder_name = "ndjson-ocsf"
         elif extension == ".asff.json":
             subfolder_name = "json-asff"
         else:
@@ -187,6 +189,7 @@ class S3:
                 ".html": "text/html",
                 ".csv": "text/csv",
                 ".ocsf.json": "application/json",
+                ".ocsf.ndjson": "application/x-ndjson",
                 ".asff.json": "application/json",
             }
             # Keys are regular and/or compliance
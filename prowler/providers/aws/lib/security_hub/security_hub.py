@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -12,11 +13,24 @@ from prowler.providers.aws.lib.security_hub.exceptions.exceptions import (
     SecurityHubInvalidRegionError,
     SecurityHubNoEnabledRegionsError,
 )
+from prowler.providers.aws.lib.service.rate_limiter import get_api_rate_limiter
+from prowler.providers.aws.lib.service.worker_pool import get_api_worker_pool
 from prowler.providers.aws.lib.session.aws_set_up_session import AwsSetUpSession
 from prowler.providers.common.models import Connection
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# Batches sent at the same time to each region, within the BatchImportFindings limit of 10 requests per second and bursts of 30
+SECURITY_HUB_BATCHES_IN_FLIGHT = 5
+# Times the failed findings of a batch are sent again, waiting SECURITY_HUB_RETRY_DELAY seconds doubled on every retry
+SECURITY_HUB_MAX_RETRIES = 2
+SECURITY_HUB_RETRY_DELAY = 1
+# Errors of the failed findings that are not solved by sending them again
+SECURITY_HUB_NON_RETRYABLE_ERROR_CODES = {
+    "AccessDeniedException",
+    "InvalidAccessException",
+    "InvalidInput",
+}
 
 
 @dataclass
@@ -216,6 +230,10 @@ class SecurityHub:
                     enabled_regions[region] = session.client(
                         "securityhub", region_name=region
                     )
+                    # The findings are sent within the process-wide API rate limit
+                    get_api_rate_limiter().register_client(
+                        enabled_regions[region], "securityhub", region
+                    )
 
             # Handle all the permissions / configuration errors
             except ClientError as client_error:
@@ -246,28 +264,23 @@ class SecurityHub:
         """
         Sends the findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
 
+        The regions are sent in parallel, with several batches in flight for each region.
+
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
         success_count = 0
         try:
-            # Iterate findings by region
             for region, findings in self._findings_per_region.items():
-                # Send findings to Security Hub
                 logger.info(
                     f"Sending {len(findings)} findings to Security Hub in the region {region}"
                 )
-
-                # Convert findings to dict
-                findings = [finding.dict(exclude_none=True) for finding in findings]
-                success_count += self._send_findings_in_batches(
-                    findings,
-                    region,
-                )
+            # Send findings to Security Hub
+            success_count = self._send_findings_per_region(self._findings_per_region)
 
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error}"
             )
         return success_count
 
@@ -275,55 +288,70 @@ class SecurityHub:
         """
         Checks previous findings in Security Hub to archive them.
 
+        The previous findings of every region are retrieved in parallel.
+
         Returns:
             int: Number of successfully archived findings.
         """
         logger.info("Checking previous findings in Security Hub to archive them.")
-        success_count = 0
-        for region in self._findings_per_region.keys():
+        worker_pool = get_api_worker_pool()
+        futures = {
+            region: worker_pool.submit_api_call(
+                "securityhub", region, self._get_findings_to_archive, region
+            )
+            for region in self._findings_per_region.keys()
+        }
+        findings_to_archive_per_region = {}
+        for region, future in futures.items():
             try:
-                current_findings = self._findings_per_region[region]
-                # Get current findings IDs
-                current_findings_ids = []
-                for finding in current_findings:
-                    current_findings_ids.append(finding.Id)
-                # Get findings of that region
-                findings_filter = {
-                    "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                    "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                    "AwsAccountId": [
-                        {"Value": self._aws_account_id, "Comparison": "EQUALS"}
-                    ],
-                    "Region": [{"Value": region, "Comparison": "EQUALS"}],
-                }
-                get_findings_paginator = self._enabled_regions[region].get_paginator(
-                    "get_findings"
-                )
-                findings_to_archive = []
-                for page in get_findings_paginator.paginate(
-                    Filters=findings_filter, PaginationConfig={"PageSize": 100}
-                ):
-                    # Archive findings that have not appear in this execution
-                    for finding in page["Findings"]:
-                        if finding["Id"] not in current_findings_ids:
-                            finding["RecordState"] = "ARCHIVED"
-                            finding["UpdatedAt"] = timestamp_utc.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            )
-
-                            findings_to_archive.append(finding)
-                logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-                # Send archive findings to SHub
-                success_count += self._send_findings_in_batches(
-                    findings_to_archive,
-                    region,
+                findings_to_archive = future.result()
+                logger.info(
+                    f"Archiving {len(findings_to_archive)} findings in the region {region}."
                 )
+                findings_to_archive_per_region[region] = findings_to_archive
             except Exception as error:
                 logger.error(
                     f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
                 )
-        return success_count
+        # Send archive findings to SHub
+        return self._send_findings_per_region(findings_to_archive_per_region)
+
+    def _get_findings_to_archive(self, region: str) -> list[dict]:
+        """
+        Gets the active Prowler findings of the region in Security Hub that are not present in the current execution, marked as archived.
+
+        Args:
+            region (str): The AWS region of the findings.
+
+        Returns:
+            list[dict]: The findings to archive.
+        """
+        # Get current findings IDs
+        current_findings_ids = {
+            finding.Id for finding in self._findings_per_region[region]
+        }
+        # Get findings of that region
+        findings_filter = {
+            "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+            "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+            "AwsAccountId": [{"Value": self._aws_account_id, "Comparison": "EQUALS"}],
+            "Region": [{"Value": region, "Comparison": "EQUALS"}],
+        }
+        get_findings_paginator = self._enabled_regions[region].get_paginator(
+            "get_findings"
+        )
+        findings_to_archive = []
+        for page in get_findings_paginator.paginate(
+            Filters=findings_filter, PaginationConfig={"PageSize": 100}
+        ):
+            # Archive findings that have not appear in this execution
+            for finding in page["Findings"]:
+                if finding["Id"] not in current_findings_ids:
+                    finding["RecordState"] = "ARCHIVED"
+                    finding["UpdatedAt"] = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+                    findings_to_archive.append(finding)
+        return findings_to_archive
 
     def _send_findings_in_batches(
         self, findings: list[AWSSecurityFindingFormat], region: str
@@ -335,31 +363,135 @@ class SecurityHub:
             findings (list[AWSSecurityFindingFormat]): List of findings to send to AWS Security Hub.
             region (str): The AWS region where the findings will be sent.
 
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        return self._send_findings_per_region({region: findings})
+
+    def _send_findings_per_region(self, findings_per_region: dict[str, list]) -> int:
+        """
+        Sends the given findings to AWS Security Hub in batches, sending to the regions in parallel and keeping up to SECURITY_HUB_BATCHES_IN_FLIGHT batches in flight for each region.
+
+        Args:
+            findings_per_region (dict[str, list]): The findings to send, ASFF findings or their dicts, per region.
+
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
         success_count = 0
-        try:
-            list_chunked = [
+        worker_pool = get_api_worker_pool()
+        futures = []
+        for region, findings in findings_per_region.items():
+            batches = [
                 findings[i : i + SECURITY_HUB_MAX_BATCH]
                 for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
             ]
-            for findings in list_chunked:
-                batch_import = self._enabled_regions[region].batch_import_findings(
-                    Findings=findings
+            # Every sender sends its batches one after the other
+            senders = min(SECURITY_HUB_BATCHES_IN_FLIGHT, len(batches))
+            for sender in range(senders):
+                futures.append(
+                    (
+                        region,
+                        worker_pool.submit_api_call(
+                            "securityhub",
+                            region,
+                            self._send_batches,
+                            batches[sender::senders],
+                            region,
+                        ),
+                    )
                 )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
+        for region, future in futures:
+            try:
+                success_count += future.result()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                )
+        return success_count
+
+    def _send_batches(self, batches: list[list], region: str) -> int:
+        """
+        Sends the given batches of findings to AWS Security Hub in a region, sending again only the failed findings of each batch.
+
+        Args:
+            batches (list[list]): The batches of findings, ASFF findings or their dicts.
+            region (str): The AWS region where the findings will be sent.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        success_count = 0
+        for findings in batches:
+            # Convert findings to dict
+            findings = [
+                (
+                    finding.dict(exclude_none=True)
+                    if isinstance(finding, AWSSecurityFindingFormat)
+                    else finding
+                )
+                for finding in findings
+            ]
+            failed_findings = []
+            for attempt in range(SECURITY_HUB_MAX_RETRIES + 1):
+                if attempt:
+                    time.sleep(SECURITY_HUB_RETRY_DELAY * 2 ** (attempt - 1))
+                try:
+                    batch_import = self._enabled_regions[region].batch_import_findings(
+                        Findings=findings
+                    )
+                except Exception as error:
                     logger.error(
-                        f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+                        f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
                     )
+                    break
                 success_count += batch_import["SuccessCount"]
-            return success_count
-        except Exception as error:
+                if batch_import["FailedCount"] == 0:
+                    break
+                # Only the failed findings that can succeed are sent again
+                retry_findings = {}
+                for failed_finding in batch_import.get("FailedFindings", []):
+                    if (
+                        attempt < SECURITY_HUB_MAX_RETRIES
+                        and failed_finding.get("ErrorCode")
+                        not in SECURITY_HUB_NON_RETRYABLE_ERROR_CODES
+                    ):
+                        retry_findings[failed_finding.get("Id")] = failed_finding
+                    else:
+                        failed_findings.append(failed_finding)
+                findings = [
+                    finding
+                    for finding in findings
+                    if retry_findings.pop(finding["Id"], None)
+                ]
+                # The failed findings that are not in the batch cannot be sent again
+                failed_findings.extend(retry_findings.values())
+                if not findings:
+                    break
+                logger.warning(
+                    f"Sending again {len(findings)} failed findings to AWS Security Hub in region {region}"
+                )
+            self._log_failed_findings(failed_findings, region)
+        return success_count
+
+    @staticmethod
+    def _log_failed_findings(failed_findings: list[dict], region: str) -> None:
+        """
+        Logs the findings that failed to be sent to AWS Security Hub, once per error code.
+
+        Args:
+            failed_findings (list[dict]): The FailedFindings of the BatchImportFindings response.
+            region (str): The AWS region where the findings were sent.
+        """
+        failed_per_error_code = {}
+        for failed_finding in failed_findings:
+            failed_per_error_code.setdefault(
+                failed_finding.get("ErrorCode"), []
+            ).append(failed_finding)
+        for error_code, failed_import in failed_per_error_code.items():
             logger.error(
-                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                f"Failed to send {len(failed_import)} findings to AWS Security Hub in region {region} -- {error_code} -- {failed_import[0].get('ErrorMessage')}"
             )
-            return success_count
 
     @staticmethod
     def test_connection(
@@ -0,0 +1,306 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from threading import local
+from typing import Callable, Iterable, Optional, Union
+
+from prowler.lib.logger import logger
+
+# Key of the tasks that are not bound to an audited region: the items of a phase without a region, or whose
+# region is not audited, are processed once the phases it depends on are completed in every region
+GLOBAL_TASK = None
+
+# Service whose phases are being run by the current thread, either scheduling them or calling the APIs
+_running_phases = local()
+
+
+def is_running_phases(service) -> bool:
+    """is_running_phases returns whether the current thread is running phases of the given service"""
+    return getattr(_running_phases, "service", None) is service
+
+
+class ServicePhase:
+    """
+    ServicePhase is one of the API fetch phases run by an AWS service to load its resources.
+
+    A phase calls its function with every regional client of the service or, if an iterator is given, with every
+    item of the iterator, e.g. the resources loaded by a previous phase. The phases it depends on are completed
+    before it starts, but only in the same region: the items of an iterator are split by their region attribute,
+    so a phase can process the resources of a region as soon as they are loaded there.
+
+    A phase declaring the service attributes it loads is lazy: it only runs, along with the phases it depends on,
+    when one of those attributes is first read, so the scans only call the APIs whose resources their checks read.
+
+    Attributes:
+        call (Callable): The function called with each regional client or item.
+        iterator (Iterable | str): The items to call the function with, the regional clients if None. It is read
+            when the phase starts in each region, so it can be a container filled by the phases it depends on. It
+            can also be the name of the service attribute holding the items, the values if it is a dict.
+        depends_on (list): The names, or the functions, of the phases that must be completed before this one.
+        name (str): The name of the phase, the name of the function by default.
+        attributes (dict): The service attributes loaded or completed by a lazy phase, with the factory of their
+            initial value, e.g. {"snapshots": list}.
+    """
+
+    def __init__(
+        self,
+        call: Callable,
+        iterator: Optional[Union[Iterable, str]] = None,
+        depends_on: Optional[list[Union[str, Callable]]] = None,
+        name: Optional[str] = None,
+        attributes: Optional[dict[str, Callable]] = None,
+    ):
+        self.call = call
+        self.iterator = iterator
+        self.attributes = attributes or {}
+        self.depends_on = [
+            dependency if isinstance(dependency, str) else dependency.__name__
+            for dependency in depends_on or []
+        ]
+        self.name = name or call.__name__
+
+
+class ServicePhaseScheduler:
+    """
+    ServicePhaseScheduler runs the fetch phases of an AWS service as a dependency graph.
+
+    Each phase is split into one task per audited region, plus a global task for the items that are not bound to an
+    audited region. A task starts as soon as the tasks of the phases it depends on are completed in its region, so
+    independent phases run concurrently and a slow region does not hold back the other regions. Every API call is
+    submitted to the shared API worker pool of the service from the thread running the scheduler.
+
+    Attributes:
+        service (AWSService): The AWS service whose phases are run.
+        phases (dict): The phases to run by name.
+        completed (set): The names of the phases already run.
+    """
+
+    def __init__(self, service, phases: list[ServicePhase]):
+        self.service = service
+        self.completed: set[str] = set()
+        self.phases: dict[str, ServicePhase] = {}
+        for phase in phases:
+            if phase.name in self.phases:
+                raise ValueError(f"Duplicated service phase '{phase.name}'")
+            self.phases[phase.name] = phase
+        for phase in self.phases.values():
+            for dependency in phase.depends_on:
+                if dependency not in self.phases:
+                    raise ValueError(
+                        f"Service phase '{phase.name}' depends on the unknown phase '{dependency}'"
+                    )
+        self._check_cycles()
+
+    def get_eager_phases(self) -> list[str]:
+        """get_eager_phases returns the phases that are not lazy, with the lazy phases needed by any of them"""
+        return self._with_needed_phases(
+            [name for name, phase in self.phases.items() if not phase.attributes]
+        )
+
+    def get_lazy_attributes(self) -> set[str]:
+        """get_lazy_attributes returns the attributes of the lazy phases that are not run yet"""
+        return {
+            attribute
+            for name, phase in self.phases.items()
+            if name not in self.completed
+            for attribute in phase.attributes
+        }
+
+    def get_attribute_phases(self, attribute: str) -> list[str]:
+        """
+        get_attribute_phases returns the phases not run yet that are needed to load the given attribute.
+
+        Args:
+            attribute (str): The name of the service attribute.
+
+        Returns:
+            list[str]: The names of the phases to run.
+        """
+        return self._with_needed_phases(
+            [
+                name
+                for name, phase in self.phases.items()
+                if attribute in phase.attributes
+            ]
+        )
+
+    def run(
+        self,
+        phase_names: Optional[list[str]] = None,
+        initialize_attributes: bool = True,
+    ) -> None:
+        """
+        run runs the given phases, returning once all of them are completed in every region.
+
+        Args:
+            phase_names (list[str]): The names of the phases to run, every phase not run yet if None. The phases
+                they depend on must be run before or be included.
+            initialize_attributes (bool): Whether to set the initial value of the attributes of the lazy phases
+                not set yet, otherwise the service must provide them.
+        """
+        if phase_names is None:
+            phase_names = [name for name in self.phases if name not in self.completed]
+        phase_names = [name for name in phase_names if name not in self.completed]
+        if initialize_attributes:
+            for phase_name in phase_names:
+                for attribute, factory in self.phases[phase_name].attributes.items():
+                    if attribute not in vars(self.service):
+                        setattr(self.service, attribute, factory())
+        previous_service = getattr(_running_phases, "service", None)
+        _running_phases.service = self.service
+        try:
+            self._run(phase_names)
+        finally:
+            _running_phases.service = previous_service
+        self.completed.update(phase_names)
+
+    def _run(self, phase_names: list[str]) -> None:
+        regional_clients = getattr(self.service, "regional_clients", None) or {}
+        regions = list(regional_clients)
+        tasks = [
+            (phase_name, region)
+            for phase_name in phase_names
+            for region in regions + [GLOBAL_TASK]
+        ]
+        # Tasks each task is waiting for, and tasks waiting for each task
+        waiting_for = {task: set() for task in tasks}
+        dependents = {task: [] for task in tasks}
+        for phase_name, region in tasks:
+            for dependency in self.phases[phase_name].depends_on:
+                if dependency in self.completed:
+                    continue
+                # The global task of a phase waits for its dependencies in every region
+                for dependency_region in (
+                    regions + [GLOBAL_TASK] if region is GLOBAL_TASK else [region]
+                ):
+                    waiting_for[(phase_name, region)].add(
+                        (dependency, dependency_region)
+                    )
+                    dependents[(dependency, dependency_region)].append(
+                        (phase_name, region)
+                    )
+
+        throttles = self.service.rate_limiter.get_throttles(self.service.service)
+        logger.info(
+            f"{self.service.service.upper()} - Starting {len(phase_names)} phases across {len(regions)} regions..."
+        )
+
+        running: dict[Future, tuple] = {}
+        pending_calls = {task: 0 for task in tasks}
+        ready = [task for task in tasks if not waiting_for[task]]
+        while ready or running:
+            # Start the ready tasks, completing right away the ones without calls
+            while ready:
+                task = ready.pop()
+                for future in self._start_task(task, regional_clients):
+                    running[future] = task
+                    pending_calls[task] += 1
+                if not pending_calls[task]:
+                    ready.extend(self._complete_task(task, waiting_for, dependents))
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                try:
+                    future.result()  # Raises exceptions from the thread, if any
+                except Exception:
+                    pass  # Currently handled within the called function
+                pending_calls[task] -= 1
+                if not pending_calls[task]:
+                    ready.extend(self._complete_task(task, waiting_for, dependents))
+
+        throttles = (
+            self.service.rate_limiter.get_throttles(self.service.service) - throttles
+        )
+        if throttles > 0:
+            logger.warning(
+                f"{self.service.service.upper()} - Service phases were throttled {throttles} times"
+            )
+
+    def _start_task(self, task: tuple, regional_clients: dict) -> list[Future]:
+        phase_name, region = task
+        phase = self.phases[phase_name]
+        if phase.iterator is None:
+            if region is GLOBAL_TASK:
+                return []
+            items = [regional_clients[region]]
+        else:
+            iterator = phase.iterator
+            if isinstance(iterator, str):
+                iterator = getattr(self.service, iterator)
+                if isinstance(iterator, dict):
+                    iterator = iterator.values()
+            items = [
+                item
+                for item in list(iterator)
+                if self._get_task_region(item, regional_clients) == region
+            ]
+        return [
+            self.service.thread_pool.submit_api_call(
+                self.service.service, region, self._call_phase, phase.call, item
+            )
+            for item in items
+        ]
+
+    def _call_phase(self, call: Callable, item) -> None:
+        previous_service = getattr(_running_phases, "service", None)
+        _running_phases.service = self.service
+        try:
+            call(item)
+        finally:
+            _running_phases.service = previous_service
+
+    def _with_needed_phases(self, phase_names: list[str]) -> list[str]:
+        """
+        _with_needed_phases returns the given phases not run yet, the phases they depend on, and the lazy phases
+        loading any attribute of them, since an attribute must be complete once it is set.
+        """
+        pending = list(phase_names)
+        selected = set()
+        while pending:
+            phase_name = pending.pop()
+            if phase_name in selected or phase_name in self.completed:
+                continue
+            selected.add(phase_name)
+            pending.extend(self.phases[phase_name].depends_on)
+            attributes = self.phases[phase_name].attributes
+            pending.extend(
+                name
+                for name, phase in self.phases.items()
+                if attributes and not attributes.keys().isdisjoint(phase.attributes)
+            )
+        # Keep the declaration order of the phases
+        return [name for name in self.phases if name in selected]
+
+    @staticmethod
+    def _get_task_region(item, regional_clients: dict) -> Optional[str]:
+        region = getattr(item, "region", None)
+        return region if region in regional_clients else GLOBAL_TASK
+
+    @staticmethod
+    def _complete_task(task: tuple, waiting_for: dict, dependents: dict) -> list:
+        ready = []
+        for dependent in dependents[task]:
+            waiting_for[dependent].discard(task)
+            if not waiting_for[dependent]:
+                ready.append(dependent)
+        return ready
+
+    def _check_cycles(self) -> None:
+        visited = set()
+        visiting = set()
+
+        def visit(phase_name):
+            if phase_name in visited:
+                return
+            if phase_name in visiting:
+                raise ValueError(
+                    f"Service phase '{phase_name}' has a circular dependency"
+                )
+            visiting.add(phase_name)
+            for dependency in self.phases[phase_name].depends_on:
+                visit(dependency)
+            visiting.discard(phase_name)
+            visited.add(phase_name)
+
+        for phase_name in self.phases:
+            visit(phase_name)
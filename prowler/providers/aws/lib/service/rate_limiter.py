@@ -0,0 +1,269 @@
+import time
+from threading import Lock
+from typing import Optional
+
+from pydantic.v1 import BaseModel
+
+from prowler.lib.logger import logger
+
+# Minimum rate, in requests per second, an AIMD bucket can be throttled down to
+MIN_API_RATE = 0.5
+# The rate is multiplied by this factor every time a call is throttled
+RATE_DECREASE_FACTOR = 0.5
+# The rate grows by roughly this number of requests per second, every second without throttling
+RATE_INCREASE_STEP = 1.0
+
+# Error codes returned by the AWS APIs when a call is throttled
+THROTTLING_ERROR_CODES = {
+    "BandwidthLimitExceeded",
+    "EC2ThrottledException",
+    "LimitExceededException",
+    "PriorRequestNotComplete",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "ThrottledException",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "TransactionInProgressException",
+}
+
+
+class APICallStats(BaseModel):
+    """
+    APICallStats holds the counters of an AWS API operation in a service and region.
+
+    Attributes:
+        requests (int): The number of HTTP requests sent, retries included.
+        throttles (int): The number of requests throttled by AWS.
+        retries (int): The number of requests that were a retry of a previous one.
+    """
+
+    requests: int = 0
+    throttles: int = 0
+    retries: int = 0
+
+
+class TokenBucket:
+    """
+    TokenBucket is a token bucket whose rate follows an AIMD (additive increase, multiplicative decrease) policy.
+
+    Every request takes a token, waiting until one is available. When AWS throttles a request the rate is
+    multiplied by RATE_DECREASE_FACTOR, and every successful request raises it by RATE_INCREASE_STEP / rate,
+    so the rate grows by about RATE_INCREASE_STEP requests per second, up to max_rate.
+
+    Attributes:
+        max_rate (float): The maximum rate, in requests per second, which is also the initial rate.
+        min_rate (float): The minimum rate, in requests per second.
+        rate (float): The current rate, in requests per second.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = MIN_API_RATE):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        # The bucket can hold up to one second of requests
+        self._tokens = max(1.0, max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """acquire takes a token from the bucket, waiting until there is one available"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def on_success(self) -> None:
+        """on_success raises the rate additively after a request that was not throttled"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_INCREASE_STEP / self.rate)
+
+    def on_throttle(self) -> None:
+        """on_throttle lowers the rate multiplicatively after a throttled request"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+            self._tokens = min(self._tokens, max(1.0, self.rate))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            max(1.0, self.rate), self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+
+class APIRateLimiter:
+    """
+    APIRateLimiter tracks the AWS API calls made by the boto3 clients and, if a max_rate is set,
+    limits them with an adaptive TokenBucket for each service and region.
+
+    The limiter hooks into the botocore events of each client, so every HTTP request is counted and
+    limited, including the retries made by the botocore retrier. A throttled request slows down all the
+    calls to the same service and region, instead of every thread retrying on its own.
+
+    Attributes:
+        max_rate (float): The maximum rate, in requests per second, for each service and region. None to only track the calls.
+
+    Example:
+        rate_limiter = APIRateLimiter(max_rate=20)
+        rate_limiter.register_client(regional_client, "ec2", "eu-west-1")
+    """
+
+    def __init__(self, max_rate: Optional[float] = None):
+        self.max_rate = max_rate
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._stats: dict[tuple[str, str, str], APICallStats] = {}
+        self._lock = Lock()
+
+    def register_client(self, client, service: str, region: str) -> None:
+        """
+        register_client hooks the rate limiter into the given boto3 client.
+
+        Args:
+            client: The boto3 client.
+            service (str): The AWS service of the client, e.g. "ec2".
+            region (str): The AWS region of the client, e.g. "eu-west-1".
+        """
+        try:
+            client.meta.events.register(
+                "before-send",
+                lambda **kwargs: self._before_send(service, region, **kwargs),
+                unique_id=f"prowler-rate-limiter-before-send-{id(self)}",
+            )
+            client.meta.events.register(
+                "needs-retry",
+                lambda **kwargs: self._after_send(service, region, **kwargs),
+                unique_id=f"prowler-rate-limiter-needs-retry-{id(self)}",
+            )
+        except Exception as error:
+            logger.error(
+                f"{service} - {region} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_stats(
+        self, service: str = None
+    ) -> dict[tuple[str, str, str], APICallStats]:
+        """
+        get_stats returns a copy of the stats of every API operation called, optionally filtered by service.
+
+        Returns:
+            dict: The stats keyed by (service, region, operation), e.g. {("ec2", "eu-west-1", "DescribeInstances"): APICallStats}.
+        """
+        with self._lock:
+            return {
+                key: stats.copy()
+                for key, stats in self._stats.items()
+                if service is None or key[0] == service
+            }
+
+    def get_throttles(self, service: str) -> int:
+        """get_throttles returns the total number of throttled requests of the given service"""
+        with self._lock:
+            return sum(
+                stats.throttles
+                for (stats_service, _, _), stats in self._stats.items()
+                if stats_service == service
+            )
+
+    def get_rate(self, service: str, region: str) -> Optional[float]:
+        """get_rate returns the current rate of the given service and region, None if it is not limited"""
+        bucket = self._buckets.get((service, region))
+        return bucket.rate if bucket else None
+
+    def _get_bucket(self, service: str, region: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get((service, region))
+            if bucket is None:
+                bucket = TokenBucket(self.max_rate)
+                self._buckets[(service, region)] = bucket
+            return bucket
+
+    def _before_send(self, service: str, region: str, **kwargs) -> None:
+        # Returning None lets botocore send the request
+        if self.max_rate:
+            self._get_bucket(service, region).acquire()
+
+    def _after_send(
+        self,
+        service: str,
+        region: str,
+        event_name: str,
+        response: tuple = None,
+        attempts: int = 1,
+        **kwargs,
+    ) -> None:
+        # Returning None leaves the retry decision to the botocore retrier
+        operation = event_name.split(".")[-1]
+        throttled = is_throttling_response(response)
+        with self._lock:
+            stats = self._stats.setdefault((service, region, operation), APICallStats())
+            stats.requests += 1
+            if attempts and attempts > 1:
+                stats.retries += 1
+            if throttled:
+                stats.throttles += 1
+        if self.max_rate and response:
+            bucket = self._get_bucket(service, region)
+            if throttled:
+                bucket.on_throttle()
+            elif response[0].status_code < 400:
+                bucket.on_success()
+
+
+def is_throttling_response(response: Optional[tuple]) -> bool:
+    """
+    is_throttling_response returns True if the botocore response is a throttling error.
+
+    Args:
+        response (tuple): The (http_response, parsed_response) tuple, None if the request raised an exception.
+    """
+    if not response:
+        return False
+    http_response, parsed_response = response
+    if getattr(http_response, "status_code", None) == 429:
+        return True
+    error_code = (parsed_response or {}).get("Error", {}).get("Code")
+    return error_code in THROTTLING_ERROR_CODES
+
+
+_api_rate_limiter: Optional[APIRateLimiter] = None
+_api_rate_limiter_lock = Lock()
+
+
+def get_api_rate_limiter() -> APIRateLimiter:
+    """get_api_rate_limiter returns the process-wide APIRateLimiter, creating it without rate limits if needed"""
+    global _api_rate_limiter
+    with _api_rate_limiter_lock:
+        if _api_rate_limiter is None:
+            _api_rate_limiter = APIRateLimiter()
+        return _api_rate_limiter
+
+
+def set_api_rate_limiter(max_rate: Optional[float] = None) -> APIRateLimiter:
+    """
+    set_api_rate_limiter replaces the process-wide APIRateLimiter with a new one using the given rate.
+
+    The clients registered in the previous limiter keep using it, so it has to be set before the services are loaded.
+
+    Args:
+        max_rate (float): The maximum rate, in requests per second, for each service and region. None to only track the calls.
+
+    Returns:
+        APIRateLimiter: The new process-wide rate limiter.
+    """
+    global _api_rate_limiter
+    with _api_rate_limiter_lock:
+        _api_rate_limiter = APIRateLimiter(max_rate=max_rate)
+    logger.info(
+        f"AWS API rate limiter: {f'{max_rate} requests per second' if max_rate else 'unlimited'} per service and region"
+    )
+    return _api_rate_limiter
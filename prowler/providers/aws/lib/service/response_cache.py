@@ -0,0 +1,328 @@
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+
+from botocore.awsrequest import AWSResponse
+
+from prowler.lib.logger import logger
+
+# Default path of the cache of AWS API responses
+DEFAULT_API_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".prowler", "aws_api_cache.db"
+)
+# Default time to live, in seconds, of the cached responses
+DEFAULT_API_CACHE_TTL = 900
+# Default maximum size, in megabytes, of the cached responses
+DEFAULT_API_CACHE_MAX_SIZE = 512
+
+# Only the responses of the read-only operations are cached
+CACHEABLE_OPERATION_PREFIXES = ("Describe", "Get", "List")
+
+# Key of the request context where the cache key of the call is stored
+CACHE_KEY_CONTEXT = "prowler_cache_key"
+CACHE_HIT_CONTEXT = "prowler_cache_hit"
+
+
+class APIResponseCache:
+    """
+    APIResponseCache is an on-disk SQLite cache of the raw responses of the read-only AWS API calls.
+
+    The responses are keyed by account, region, service, operation and the call parameters, so a new scan
+    of the same account within the TTL gets the same responses without calling the AWS APIs, e.g. to rerun
+    the scan after changing the mutelist or the checks to execute. When the size of the cached responses
+    exceeds max_size the oldest ones are evicted.
+
+    The cache hooks into the botocore events of each client, so the services do not need any change and
+    the paginators are cached page by page.
+
+    The responses are stored in plaintext and include sensitive data, like the EC2 user data, the Lambda
+    environment variables or the CloudFormation templates, so the database is only readable by its owner.
+
+    Attributes:
+        path (str): The path of the SQLite database.
+        ttl (int): The time to live of the cached responses, in seconds.
+        max_size (int): The maximum size of the cached responses, in bytes.
+        hits (int): The number of calls served from the cache.
+        misses (int): The number of cacheable calls sent to AWS.
+
+    Example:
+        response_cache = APIResponseCache(ttl=600)
+        response_cache.register_client(regional_client, "123456789012", "s3", "eu-west-1")
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_API_CACHE_FILE,
+        ttl: int = DEFAULT_API_CACHE_TTL,
+        max_size: int = DEFAULT_API_CACHE_MAX_SIZE * 1024 * 1024,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        # The responses include sensitive data like the EC2 user data or the Lambda environment variables,
+        # so only the owner can read the cache
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+        os.chmod(path, 0o600)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, account TEXT, region TEXT, service TEXT, "
+                "operation TEXT, response TEXT, size INTEGER, created_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)"
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - ttl,)
+            )
+            self._connection.commit()
+            self._size = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def register_client(self, client, account: str, service: str, region: str) -> None:
+        """
+        register_client hooks the cache into the given boto3 client.
+
+        Args:
+            client: The boto3 client.
+            account (str): The AWS account audited with the client.
+            service (str): The AWS service of the client, e.g. "s3".
+            region (str): The AWS region of the client, e.g. "eu-west-1".
+        """
+        try:
+            client.meta.events.register(
+                "before-parameter-build",
+                lambda **kwargs: self._set_cache_key(
+                    account, service, region, **kwargs
+                ),
+                unique_id=f"prowler-response-cache-key-{id(self)}",
+            )
+            client.meta.events.register(
+                "before-call",
+                self._get_cached_response,
+                unique_id=f"prowler-response-cache-get-{id(self)}",
+            )
+            client.meta.events.register(
+                "after-call",
+                lambda **kwargs: self._put_response(account, service, region, **kwargs),
+                unique_id=f"prowler-response-cache-put-{id(self)}",
+            )
+        except Exception as error:
+            logger.error(
+                f"{service} - {region} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        """get returns the cached response for the given key, None if it is not cached or it is expired"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row or row[1] < time.time() - self.ttl:
+            return None
+        return json.loads(row[0], object_hook=decode_response_value)
+
+    def put(
+        self,
+        key: str,
+        account: str,
+        service: str,
+        region: str,
+        operation: str,
+        response: dict,
+    ) -> None:
+        """put stores the given response, evicting the oldest responses if the cache is full"""
+        serialized_response = json.dumps(response, default=encode_response_value)
+        size = len(serialized_response)
+        if size > self.max_size:
+            return
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    account,
+                    region,
+                    service,
+                    operation,
+                    serialized_response,
+                    size,
+                    time.time(),
+                ),
+            )
+            self._size += size - (previous[0] if previous else 0)
+            if self._size > self.max_size:
+                self._evict()
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """clear removes all the cached responses"""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        """close closes the SQLite database"""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        # Remove the oldest responses until the cache fits in max_size, must be called holding the lock
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY created_at"
+        ).fetchall():
+            if self._size <= self.max_size:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._size -= size
+
+    def _set_cache_key(
+        self,
+        account: str,
+        service: str,
+        region: str,
+        params: dict,
+        model,
+        context: dict,
+        **kwargs,
+    ) -> None:
+        if not model.name.startswith(CACHEABLE_OPERATION_PREFIXES):
+            return
+        try:
+            params_hash = hashlib.sha256(
+                json.dumps(
+                    params, sort_keys=True, default=encode_response_value
+                ).encode()
+            ).hexdigest()
+            context[CACHE_KEY_CONTEXT] = (
+                f"{account}:{region}:{service}:{model.name}:{params_hash}"
+            )
+        except Exception as error:
+            logger.debug(
+                f"{service} - {model.name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_cached_response(self, context: dict, **kwargs) -> Optional[tuple]:
+        key = context.get(CACHE_KEY_CONTEXT)
+        if not key:
+            return None
+        try:
+            response = self.get(key)
+        except Exception as error:
+            logger.error(
+                f"{key} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            response = None
+        with self._lock:
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        context[CACHE_HIT_CONTEXT] = True
+        # botocore uses this response instead of calling the API
+        return AWSResponse(None, 200, {}, None), response
+
+    def _put_response(
+        self,
+        account: str,
+        service: str,
+        region: str,
+        http_response,
+        parsed: dict,
+        model,
+        context: dict,
+        **kwargs,
+    ) -> None:
+        key = context.get(CACHE_KEY_CONTEXT)
+        if (
+            not key
+            or context.get(CACHE_HIT_CONTEXT)
+            or http_response.status_code >= 300
+        ):
+            return
+        try:
+            self.put(key, account, service, region, model.name, parsed)
+        except Exception as error:
+            # Responses that cannot be serialized, like streams, are not cached
+            logger.debug(
+                f"{key} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+def encode_response_value(value):
+    """encode_response_value encodes the values of the AWS API responses that are not JSON serializable"""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    raise TypeError(f"Object of type {value.__class__.__name__} cannot be cached")
+
+
+def decode_response_value(value: dict):
+    """decode_response_value decodes the values encoded by encode_response_value"""
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+_api_response_cache: Optional[APIResponseCache] = None
+_api_response_cache_lock = Lock()
+
+
+def get_api_response_cache() -> Optional[APIResponseCache]:
+    """get_api_response_cache returns the process-wide APIResponseCache, None if the cache is disabled"""
+    return _api_response_cache
+
+
+def set_api_response_cache(
+    ttl: Optional[int] = None,
+    max_size: Optional[int] = None,
+    path: Optional[str] = None,
+) -> Optional[APIResponseCache]:
+    """
+    set_api_response_cache enables the process-wide APIResponseCache with the given settings, or disables it if ttl is None.
+
+    Args:
+        ttl (int): The time to live of the cached responses, in seconds. None to disable the cache.
+        max_size (int): The maximum size of the cached responses, in megabytes, DEFAULT_API_CACHE_MAX_SIZE if None.
+        path (str): The path of the SQLite database, DEFAULT_API_CACHE_FILE if None.
+
+    Returns:
+        APIResponseCache: The new process-wide cache, None if it is disabled.
+    """
+    global _api_response_cache
+    with _api_response_cache_lock:
+        previous_cache = _api_response_cache
+        _api_response_cache = None
+        if ttl:
+            _api_response_cache = APIResponseCache(
+                path=path or DEFAULT_API_CACHE_FILE,
+                ttl=ttl,
+                max_size=(max_size or DEFAULT_API_CACHE_MAX_SIZE) * 1024 * 1024,
+            )
+            logger.info(
+                f"AWS API responses cache: {_api_response_cache.path}, {ttl} seconds TTL"
+            )
+    if previous_cache:
+        previous_cache.close()
+    return _api_response_cache
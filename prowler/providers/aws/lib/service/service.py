@@ -1,7 +1,15 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
+from threading import Lock, RLock
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.service.phases import (
+    ServicePhase,
+    ServicePhaseScheduler,
+    is_running_phases,
+)
+from prowler.providers.aws.lib.service.rate_limiter import get_api_rate_limiter
+from prowler.providers.aws.lib.service.worker_pool import get_api_worker_pool
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,7 +17,9 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
+# Boto3 sessions are not thread safe, so the clients are created one at a time
+# when the services are loaded concurrently
+CLIENT_CREATION_LOCK = Lock()
 
 
 class AWSService:
@@ -17,7 +27,10 @@ class AWSService:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Shared API worker pool for the __threading_call__ and __threading_call_phases__
+    - Shared API rate limiter and calls stats
+    - Optional on-disk cache of the API responses
+    - Lazy attributes, loaded by their phases the first time they are read
     - Also handles if the AWS Service is Global
     """
 
@@ -33,6 +46,11 @@ class AWSService:
         return (check_id.split(".")[-1], arn) in cls.failed_checks
 
     def __init__(self, service: str, provider: AwsProvider, global_service=False):
+        # Lazy attributes not loaded yet, and the attributes being loaded by their phases
+        self._lazy_attributes: dict[str, ServicePhaseScheduler] = {}
+        self._loading_attributes = {}
+        self._lazy_attributes_lock = RLock()
+
         # Audit Information
         # Do we need to store the whole provider?
         self.provider = provider
@@ -52,20 +70,25 @@ class AWSService:
         # e.g.: AccessAnalyzer --> we need a lowercase string, so service.lower()
         self.service = service.lower() if not service.islower() else service
 
-        # Generate Regional Clients
-        if not global_service:
-            self.regional_clients = provider.generate_regional_clients(self.service)
-            # TODO: review the following code
-            # self.regional_clients = generate_regional_clients(self.service, audit_info)
+        with CLIENT_CREATION_LOCK:
+            # Generate Regional Clients
+            if not global_service:
+                self.regional_clients = provider.generate_regional_clients(self.service)
+                # TODO: review the following code
+                # self.regional_clients = generate_regional_clients(self.service, audit_info)
+
+            # Get a single region and client if the service needs it (e.g. AWS Global Service)
+            # We cannot include this within an else because some services needs both the regional_clients
+            # and a single client like S3
+            self.region = provider.get_default_region(self.service)
+            self.client = provider.get_client(self.service, self.region)
 
-        # Get a single region and client if the service needs it (e.g. AWS Global Service)
-        # We cannot include this within an else because some services needs both the regional_clients
-        # and a single client like S3
-        self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        # Process-wide API worker pool for __threading_call__, shared by all the services
+        self.thread_pool = get_api_worker_pool()
 
-        # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # Process-wide API rate limiter and opt-in on-disk cache of the API responses,
+        # the clients are registered by the provider when they are created
+        self.rate_limiter = get_api_rate_limiter()
 
     def __get_session__(self):
         return self.session
@@ -91,8 +114,15 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
-        # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
+        throttles = self.rate_limiter.get_throttles(self.service)
+
+        # Submit tasks to the shared thread pool, within the service and region limits
+        futures = [
+            self.thread_pool.submit_api_call(
+                self.service, getattr(item, "region", None), call, item
+            )
+            for item in items
+        ]
 
         # Wait for all tasks to complete
         for future in as_completed(futures):
@@ -102,6 +132,88 @@ class AWSService:
                 # Handle exceptions if necessary
                 pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
 
+        throttles = self.rate_limiter.get_throttles(self.service) - throttles
+        if throttles > 0:
+            logger.warning(
+                f"{self.service.upper()} - '{call_name}' function was throttled {throttles} times"
+            )
+
+    def __threading_call_phases__(self, phases: list[ServicePhase]):
+        """
+        Run the given fetch phases of the service as a dependency graph.
+
+        Each phase runs in a region once the phases it depends on are completed there, so the phases that do
+        not depend on each other run concurrently instead of waiting for one another across every region.
+        Args:
+            phases (list[ServicePhase]): The phases to run and their dependencies.
+        Raises:
+            ValueError: If a phase is duplicated, depends on an unknown phase or has a circular dependency.
+        Examples:
+            >>> self.__threading_call_phases__(
+            ...     [
+            ...         ServicePhase(self._describe_snapshots),
+            ...         ServicePhase(
+            ...             self._determine_public_snapshots,
+            ...             self.snapshots,
+            ...             depends_on=[self._describe_snapshots],
+            ...         ),
+            ...     ]
+            ... )
+        """
+        scheduler = ServicePhaseScheduler(self, phases)
+        scheduler.run(scheduler.get_eager_phases())
+        for attribute in scheduler.get_lazy_attributes():
+            self._lazy_attributes[attribute] = scheduler
+
+    def __getattr__(self, name):
+        # Only called for the attributes not set, so the lazy attributes are loaded the first time they are read
+        lazy_attributes = self.__dict__.get("_lazy_attributes")
+        if not lazy_attributes or name not in lazy_attributes:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        # The phases loading the attribute read and fill it before it is set
+        loading_attributes = self.__dict__["_loading_attributes"]
+        if name in loading_attributes and is_running_phases(self):
+            return loading_attributes[name]
+        self._load_lazy_attribute(name)
+        return self.__dict__[name]
+
+    def load_all_attributes(self):
+        """Load every lazy attribute not read yet, e.g. to inspect all the resources of the service"""
+        for name in list(self._lazy_attributes):
+            self._load_lazy_attribute(name)
+
+    def _load_lazy_attribute(self, name):
+        # A phase must depend on the phases loading the lazy attributes it reads: loading them from its thread
+        # would wait for the lock held by the thread waiting for the phase
+        if is_running_phases(self) and name not in self.__dict__:
+            raise AttributeError(
+                f"{self.service.upper()} - Lazy attribute '{name}' read by a phase not depending on the phases loading it"
+            )
+        with self._lazy_attributes_lock:
+            if name in self.__dict__ or name not in self._lazy_attributes:
+                return
+            scheduler = self._lazy_attributes[name]
+            phase_names = scheduler.get_attribute_phases(name)
+            logger.info(
+                f"{self.service.upper()} - Loading '{name}' on demand with {len(phase_names)} phases..."
+            )
+            for phase_name in phase_names:
+                for attribute, factory in scheduler.phases[
+                    phase_name
+                ].attributes.items():
+                    if attribute not in self.__dict__:
+                        self._loading_attributes[attribute] = factory()
+            try:
+                scheduler.run(phase_names, initialize_attributes=False)
+            finally:
+                # Other threads only see the attributes once all their phases are completed
+                for attribute, value in self._loading_attributes.items():
+                    setattr(self, attribute, value)
+                    self._lazy_attributes.pop(attribute, None)
+                self._loading_attributes = {}
+
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
         Generate an unknown ARN for the service
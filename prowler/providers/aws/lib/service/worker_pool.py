@@ -0,0 +1,140 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Optional
+
+from prowler.lib.logger import logger
+
+# Default number of threads shared by all the AWS services to call the AWS APIs
+DEFAULT_API_MAX_WORKERS = 10
+
+
+class APIWorkerPool:
+    """
+    APIWorkerPool is the process-wide thread pool used by every AWS service to call the AWS APIs.
+
+    All the services share the same bounded pool, so the total number of concurrent API calls is controlled
+    regardless of how many services are loaded at the same time. On top of the global limit, the number of
+    concurrent calls for the same service and for the same region can be limited too, to raise the overall
+    parallelism for big accounts without raising the throttling of a single service or region.
+
+    The per-service and per-region slots are acquired by the thread submitting the calls, so a worker
+    thread never waits for a slot and the submitter is slowed down until a slot is released.
+
+    Attributes:
+        max_workers (int): The maximum number of concurrent API calls.
+        max_workers_per_service (int): The maximum number of concurrent API calls for the same service, unlimited if None.
+        max_workers_per_region (int): The maximum number of concurrent API calls for the same region, unlimited if None.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_API_MAX_WORKERS,
+        max_workers_per_service: Optional[int] = None,
+        max_workers_per_region: Optional[int] = None,
+    ):
+        self.max_workers = max_workers or DEFAULT_API_MAX_WORKERS
+        self.max_workers_per_service = max_workers_per_service
+        self.max_workers_per_region = max_workers_per_region
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prowler-aws-api"
+        )
+        self._semaphores: dict[tuple[str, str], BoundedSemaphore] = {}
+        self._semaphores_lock = Lock()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """submit runs the given function in the shared pool, only bounded by the global limit"""
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def submit_api_call(
+        self, service: str, region: Optional[str], fn: Callable, /, *args, **kwargs
+    ) -> Future:
+        """
+        submit_api_call runs the given function in the shared pool once there is a free slot for the service and the region.
+
+        Args:
+            service (str): The AWS service making the call, e.g. "ec2".
+            region (str): The AWS region of the call, None if it is unknown.
+            fn (Callable): The function to run.
+
+        Returns:
+            Future: The future of the submitted function.
+        """
+        semaphores = []
+        if self.max_workers_per_service:
+            semaphores.append(
+                self._get_semaphore("service", service, self.max_workers_per_service)
+            )
+        if self.max_workers_per_region and region:
+            semaphores.append(
+                self._get_semaphore("region", region, self.max_workers_per_region)
+            )
+        for semaphore in semaphores:
+            semaphore.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            for semaphore in semaphores:
+                semaphore.release()
+            raise
+        for semaphore in semaphores:
+            future.add_done_callback(lambda _, semaphore=semaphore: semaphore.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """shutdown releases the threads of the pool"""
+        self._executor.shutdown(wait=wait)
+
+    def _get_semaphore(self, scope: str, key: str, limit: int) -> BoundedSemaphore:
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get((scope, key))
+            if semaphore is None:
+                semaphore = BoundedSemaphore(limit)
+                self._semaphores[(scope, key)] = semaphore
+            return semaphore
+
+
+_api_worker_pool: Optional[APIWorkerPool] = None
+_api_worker_pool_lock = Lock()
+
+
+def get_api_worker_pool() -> APIWorkerPool:
+    """get_api_worker_pool returns the process-wide APIWorkerPool, creating it with the default limits if needed"""
+    global _api_worker_pool
+    with _api_worker_pool_lock:
+        if _api_worker_pool is None:
+            _api_worker_pool = APIWorkerPool()
+        return _api_worker_pool
+
+
+def set_api_worker_pool(
+    max_workers: Optional[int] = None,
+    max_workers_per_service: Optional[int] = None,
+    max_workers_per_region: Optional[int] = None,
+) -> APIWorkerPool:
+    """
+    set_api_worker_pool replaces the process-wide APIWorkerPool with a new one using the given limits.
+
+    The calls already submitted to the previous pool are not cancelled.
+
+    Args:
+        max_workers (int): The maximum number of concurrent API calls, DEFAULT_API_MAX_WORKERS if None.
+        max_workers_per_service (int): The maximum number of concurrent API calls for the same service.
+        max_workers_per_region (int): The maximum number of concurrent API calls for the same region.
+
+    Returns:
+        APIWorkerPool: The new process-wide pool.
+    """
+    global _api_worker_pool
+    with _api_worker_pool_lock:
+        previous_pool = _api_worker_pool
+        _api_worker_pool = APIWorkerPool(
+            max_workers=max_workers,
+            max_workers_per_service=max_workers_per_service,
+            max_workers_per_region=max_workers_per_region,
+        )
+    if previous_pool:
+        previous_pool.shutdown(wait=False)
+    logger.info(
+        f"AWS API worker pool: {_api_worker_pool.max_workers} workers, {max_workers_per_service or 'unlimited'} per service, {max_workers_per_region or 'unlimited'} per region"
+    )
+    return _api_worker_pool
@@ -1,7 +1,7 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import detect_secrets_scan, get_secrets_scanner
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -15,6 +15,15 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
             secrets_ignore_patterns = logs_client.audit_config.get(
                 "secrets_ignore_patterns", []
             )
+            secrets_scanner = get_secrets_scanner(
+                excluded_secrets=secrets_ignore_patterns,
+                detect_secrets_plugins=logs_client.audit_config.get(
+                    "detect_secrets_plugins",
+                ),
+            )
+            secrets_scan_processes = logs_client.audit_config.get(
+                "secrets_scan_processes", 1
+            )
             for log_group in logs_client.log_groups.values():
                 report = Check_Report_AWS(metadata=self.metadata(), resource=log_group)
                 report.status = "PASS"
@@ -23,22 +32,23 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                 )
                 log_group_secrets = []
                 if log_group.log_streams:
-                    for log_stream_name in log_group.log_streams:
+                    # Scan all the log streams of the log group in one batch
+                    log_streams_secrets_output = secrets_scanner.scan_batch(
+                        [
+                            "\n".join(
+                                [
+                                    dumps(event["message"])
+                                    for event in log_group.log_streams[log_stream_name]
+                                ]
+                            )
+                            for log_stream_name in log_group.log_streams
+                        ],
+                        processes=secrets_scan_processes,
+                    )
+                    for log_stream_name, log_stream_secrets_output in zip(
+                        log_group.log_streams, log_streams_secrets_output
+                    ):
                         log_stream_secrets = {}
-                        log_stream_data = "\n".join(
-                            [
-                                dumps(event["message"])
-                                for event in log_group.log_streams[log_stream_name]
-                            ]
-                        )
-                        log_stream_secrets_output = detect_secrets_scan(
-                            data=log_stream_data,
-                            excluded_secrets=secrets_ignore_patterns,
-                            detect_secrets_plugins=logs_client.audit_config.get(
-                                "detect_secrets_plugins",
-                            ),
-                        )
-
                         if log_stream_secrets_output:
                             for secret in log_stream_secrets_output:
                                 flagged_event = log_group.log_streams[log_stream_name][
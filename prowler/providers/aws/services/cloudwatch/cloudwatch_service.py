@@ -1,5 +1,5 @@
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from botocore.exceptions import ClientError
@@ -7,6 +7,7 @@ from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import get_secrets_scanner
 from prowler.providers.aws.lib.service.service import AWSService
 
 
@@ -85,6 +86,11 @@ class Logs(AWSService):
         self.log_group_arn_template = f"arn:{self.audited_partition}:logs:{self.region}:{self.audited_account}:log-group"
         self.log_groups = {}
         self.__threading_call__(self._describe_log_groups)
+        # Log groups by region and name, to find the log group of each metric filter
+        self._log_groups_by_name = {
+            (log_group.region, log_group.name): log_group
+            for log_group in (self.log_groups or {}).values()
+        }
         self.resource_policies = {}
         self.__threading_call__(self._describe_resource_policies)
         self.metric_filters = []
@@ -97,7 +103,23 @@ class Logs(AWSService):
                 self.events_per_log_group_threshold = (
                     1000  # The threshold for number of events to return per log group.
                 )
-                self.__threading_call__(self._get_log_events)
+                # Hours of log events to scan, all the events retained if 0
+                self.log_events_hours = self.audit_config.get(
+                    "secrets_log_events_hours", 0
+                )
+                # Maximum size of the log events messages to scan per log group
+                self.log_events_max_bytes = self.audit_config.get(
+                    "secrets_log_events_max_bytes", 1048576
+                )
+                self._secrets_scanner = get_secrets_scanner(
+                    excluded_secrets=self.audit_config.get(
+                        "secrets_ignore_patterns", []
+                    ),
+                    detect_secrets_plugins=self.audit_config.get(
+                        "detect_secrets_plugins",
+                    ),
+                )
+                self.__threading_call__(self._get_log_events, self.log_groups.values())
             self.__threading_call__(
                 self._list_tags_for_resource, self.log_groups.values()
             )
@@ -117,11 +139,9 @@ class Logs(AWSService):
                         if self.metric_filters is None:
                             self.metric_filters = []
 
-                        log_group = None
-                        for lg in self.log_groups.values():
-                            if lg.name == filter["logGroupName"]:
-                                log_group = lg
-                                break
+                        log_group = self._log_groups_by_name.get(
+                            (regional_client.region, filter["logGroupName"])
+                        )
 
                         self.metric_filters.append(
                             MetricFilter(
@@ -192,37 +212,63 @@ class Logs(AWSService):
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_log_events(self, regional_client):
-        regional_log_groups = [
-            log_group
-            for log_group in self.log_groups.values()
-            if log_group.region == regional_client.region
-        ]
-        total_log_groups = len(regional_log_groups)
-        logger.info(
-            f"CloudWatch Logs - Retrieving log events for {total_log_groups} log groups in {regional_client.region}..."
-        )
+    def _get_log_events(self, log_group):
         try:
-            for count, log_group in enumerate(regional_log_groups, start=1):
-                events = regional_client.filter_log_events(
-                    logGroupName=log_group.name,
-                    limit=self.events_per_log_group_threshold,
-                )["events"]
-                for event in events:
-                    if event["logStreamName"] not in log_group.log_streams:
-                        log_group.log_streams[event["logStreamName"]] = []
-                    log_group.log_streams[event["logStreamName"]].append(event)
-                if count % 10 == 0:
+            regional_client = self.regional_clients[log_group.region]
+            filter_log_events_args = {
+                "logGroupName": log_group.name,
+                "limit": self.events_per_log_group_threshold,
+            }
+            if self.log_events_hours:
+                filter_log_events_args["startTime"] = int(
+                    (
+                        datetime.now(timezone.utc)
+                        - timedelta(hours=self.log_events_hours)
+                    ).timestamp()
+                    * 1000
+                )
+            events = regional_client.filter_log_events(**filter_log_events_args)[
+                "events"
+            ]
+            log_streams = {}
+            events_bytes = 0
+            for event in events:
+                events_bytes += len(event["message"])
+                if events_bytes > self.log_events_max_bytes:
                     logger.info(
-                        f"CloudWatch Logs - Retrieved log events for {count}/{total_log_groups} log groups in {regional_client.region}..."
+                        f"CloudWatch Logs - Scanning the log events of {log_group.name} up to {self.log_events_max_bytes} bytes..."
                     )
+                    break
+                if event["logStreamName"] not in log_streams:
+                    log_streams[event["logStreamName"]] = []
+                log_streams[event["logStreamName"]].append(event)
+            # The log events are scanned as soon as they are retrieved, so only the ones with secrets are kept
+            log_group.log_streams = self._get_log_events_with_secrets(log_streams)
         except Exception as error:
             logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{log_group.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-        logger.info(
-            f"CloudWatch Logs - Finished retrieving log events in {regional_client.region}..."
+
+    def _get_log_events_with_secrets(self, log_streams: dict) -> dict:
+        log_streams_secrets_output = self._secrets_scanner.scan_batch(
+            [
+                "\n".join([json.dumps(event["message"]) for event in events])
+                for events in log_streams.values()
+            ],
+            processes=self.audit_config.get("secrets_scan_processes", 1),
         )
+        log_streams_with_secrets = {}
+        for (log_stream_name, events), log_stream_secrets_output in zip(
+            log_streams.items(), log_streams_secrets_output
+        ):
+            if log_stream_secrets_output:
+                log_streams_with_secrets[log_stream_name] = [
+                    events[line_number - 1]
+                    for line_number in sorted(
+                        {secret["line_number"] for secret in log_stream_secrets_output}
+                    )
+                ]
+        return log_streams_with_secrets
 
     def _describe_resource_policies(self, regional_client):
         logger.info("CloudWatch Logs - Describing resource policies...")
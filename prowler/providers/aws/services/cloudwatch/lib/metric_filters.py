@@ -1,8 +1,85 @@
 import re
+from functools import lru_cache
+from threading import Lock
 
 from prowler.lib.check.models import Check_Report_AWS
 
 
+class MetricFilterIndex:
+    """
+    MetricFilterIndex indexes the metric filters and alarms evaluated by the cloudwatch_log_metric_filter checks.
+
+    It is built once for the CloudTrail trails, metric filters and metric alarms of the scan and shared by all the
+    checks, so each check only matches its pattern against the metric filters of the trails log groups and looks
+    up the alarms by metric, instead of walking all the log groups, metric filters and alarms.
+
+    Attributes:
+        metric_filters (list): The metric filters of the log groups of the trails, in the order of the service.
+        alarm_metrics (set): The metrics with at least one alarm.
+    """
+
+    def __init__(self, trails: dict, metric_filters: list, metric_alarms: list):
+        trail_log_groups = {
+            trail.log_group_arn.split(":")[6]
+            for trail in trails.values()
+            if trail.log_group_arn
+        }
+        self.metric_filters = [
+            metric_filter
+            for metric_filter in metric_filters
+            if metric_filter.log_group
+            and metric_filter.log_group.name in trail_log_groups
+        ]
+        self.alarm_metrics = {alarm.metric for alarm in metric_alarms}
+
+    def get_metric_filters(self, metric_filter_pattern: str) -> list:
+        """get_metric_filters returns the metric filters of the trails log groups whose pattern matches the given one"""
+        matcher = compile_metric_filter_pattern(metric_filter_pattern)
+        return [
+            metric_filter
+            for metric_filter in self.metric_filters
+            if matcher.search(metric_filter.pattern)
+        ]
+
+    def has_alarm(self, metric_filter) -> bool:
+        """has_alarm returns whether there is an alarm for the metric of the metric filter"""
+        return metric_filter.metric in self.alarm_metrics
+
+
+@lru_cache(maxsize=None)
+def compile_metric_filter_pattern(metric_filter_pattern: str) -> re.Pattern:
+    return re.compile(metric_filter_pattern, flags=re.DOTALL)
+
+
+_metric_filter_index = None
+_metric_filter_index_lock = Lock()
+
+
+def get_metric_filter_index(
+    trails: dict, metric_filters: list, metric_alarms: list
+) -> MetricFilterIndex:
+    """
+    get_metric_filter_index returns the MetricFilterIndex of the given trails, metric filters and alarms.
+
+    The last index is reused while it is requested for the same objects with the same number of items.
+    """
+    global _metric_filter_index
+    key = (
+        (id(trails), len(trails)),
+        (id(metric_filters), len(metric_filters)),
+        (id(metric_alarms), len(metric_alarms)),
+    )
+    with _metric_filter_index_lock:
+        # The indexed objects are kept along with the key, so their ids cannot be reused
+        if _metric_filter_index is None or _metric_filter_index[0] != key:
+            _metric_filter_index = (
+                key,
+                (trails, metric_filters, metric_alarms),
+                MetricFilterIndex(trails, metric_filters, metric_alarms),
+            )
+        return _metric_filter_index[2]
+
+
 def check_cloudwatch_log_metric_filter(
     metric_filter_pattern: str,
     trails: list,
@@ -11,29 +88,19 @@ def check_cloudwatch_log_metric_filter(
     metadata: dict,
 ):
     report = None
-    # 1. Iterate for CloudWatch Log Group in CloudTrail trails
-    log_groups = []
     if trails is not None and metric_filters is not None and metric_alarms is not None:
-        for trail in trails.values():
-            if trail.log_group_arn:
-                log_groups.append(trail.log_group_arn.split(":")[6])
-        # 2. Describe metric filters for previous log groups
-        for metric_filter in metric_filters:
-            if metric_filter.log_group.name in log_groups and re.search(
-                metric_filter_pattern, metric_filter.pattern, flags=re.DOTALL
-            ):
-                report = Check_Report_AWS(
-                    metadata=metadata, resource=metric_filter.log_group
-                )
-                report.status = "FAIL"
-                report.status_extended = f"CloudWatch log group {metric_filter.log_group.name} found with metric filter {metric_filter.name} but no alarms associated."
-                # 3. Check if there is an alarm for the metric
-                for alarm in metric_alarms:
-                    if alarm.metric == metric_filter.metric:
-                        report.status = "PASS"
-                        report.status_extended = f"CloudWatch log group {metric_filter.log_group.name} found with metric filter {metric_filter.name} and alarms set."
-                        break
-                if report.status == "PASS":
-                    break
+        index = get_metric_filter_index(trails, metric_filters, metric_alarms)
+        # 1. Metric filters of the CloudWatch Log Groups in CloudTrail trails matching the pattern
+        for metric_filter in index.get_metric_filters(metric_filter_pattern):
+            report = Check_Report_AWS(
+                metadata=metadata, resource=metric_filter.log_group
+            )
+            # 2. Check if there is an alarm for the metric
+            if index.has_alarm(metric_filter):
+                report.status = "PASS"
+                report.status_extended = f"CloudWatch log group {metric_filter.log_group.name} found with metric filter {metric_filter.name} and alarms set."
+                break
+            report.status = "FAIL"
+            report.status_extended = f"CloudWatch log group {metric_filter.log_group.name} found with metric filter {metric_filter.name} but no alarms associated."
 
     return report
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS, Severity
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
@@ -24,15 +23,13 @@ class ec2_securitygroup_allow_ingress_from_internet_to_all_ports(Check):
                 report.status = "PASS"
                 report.status_extended = f"Security group {security_group.name} ({security_group.id}) does not have all ports open to the Internet."
 
-                for ingress_rule in security_group.ingress_rules:
-                    if check_security_group(ingress_rule, "-1", any_address=True):
-                        ec2_client.set_failed_check(
-                            self.__class__.__name__,
-                            security_group_arn,
-                        )
-                        report.status = "FAIL"
-                        report.status_extended = f"Security group {security_group.name} ({security_group.id}) has all ports open to the Internet."
-                        break
+                if security_group.exposure.is_open("-1", any_address=True):
+                    ec2_client.set_failed_check(
+                        self.__class__.__name__,
+                        security_group_arn,
+                    )
+                    report.status = "FAIL"
+                    report.status_extended = f"Security group {security_group.name} ({security_group.id}) has all ports open to the Internet."
 
                 findings.append(report)
 
@@ -4,7 +4,6 @@ from prowler.providers.aws.services.ec2.ec2_securitygroup_allow_ingress_from_int
     ec2_securitygroup_allow_ingress_from_internet_to_all_ports,
 )
 from prowler.providers.aws.services.ec2.ec2_service import NetworkInterface
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
@@ -29,19 +28,15 @@ class ec2_securitygroup_allow_ingress_from_internet_to_any_port(Check):
                     report.resource_details = security_group.name
                     report.status = "PASS"
                     report.status_extended = f"Security group {security_group.name} ({security_group.id}) does not have any port open to the Internet."
-                    for ingress_rule in security_group.ingress_rules:
-                        if check_security_group(
-                            ingress_rule, "-1", ports=None, any_address=True
-                        ):
-                            self.check_enis(
-                                report=report,
-                                security_group_name=security_group.name,
-                                security_group_id=security_group.id,
-                                enis=security_group.network_interfaces,
-                            )
-
-                        if report.status == "FAIL":
-                            break
+                    if security_group.exposure.is_open(
+                        "-1", ports=None, any_address=True
+                    ):
+                        self.check_enis(
+                            report=report,
+                            security_group_name=security_group.name,
+                            security_group_id=security_group.id,
+                            enis=security_group.network_interfaces,
+                        )
                     findings.append(report)
 
         return findings
@@ -3,11 +3,15 @@ from ipaddress import IPv4Address, IPv6Address, ip_address
 from typing import Optional, Union
 
 from botocore.client import ClientError
-from pydantic.v1 import BaseModel
+from pydantic.v1 import BaseModel, PrivateAttr
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.providers.aws.lib.service.phases import ServicePhase
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupExposure,
+)
 
 
 class EC2(AWSService):
@@ -16,43 +20,91 @@ class EC2(AWSService):
         super().__init__(__class__.__name__, provider)
         self.account_arn_template = f"arn:{self.audited_partition}:ec2:{self.region}:{self.audited_account}:account"
         self.instances = []
-        self.__threading_call__(self._describe_instances)
-        self.__threading_call__(self._get_instance_user_data, self.instances)
         self.security_groups = {}
         self.regions_with_sgs = []
-        self.__threading_call__(self._describe_security_groups)
-        self.network_acls = {}
-        self.__threading_call__(self._describe_network_acls)
-        self.snapshots = []
-        self.volumes_with_snapshots = {}
-        self.regions_with_snapshots = {}
-        self.__threading_call__(self._describe_snapshots)
-        self.__threading_call__(self._determine_public_snapshots, self.snapshots)
         self.network_interfaces = {}
-        self.__threading_call__(self._describe_network_interfaces)
-        self.images = []
-        self.__threading_call__(self._describe_images)
-        self.volumes = []
-        self.__threading_call__(self._describe_volumes)
-        self.attributes_for_regions = {}
-        self.__threading_call__(self._get_resources_for_regions)
-        self.ebs_encryption_by_default = []
-        self.__threading_call__(self._get_ebs_encryption_settings)
-        self.elastic_ips = []
-        self.__threading_call__(self._describe_ec2_addresses)
-        self.ebs_block_public_access_snapshots_states = []
-        self.__threading_call__(self._get_snapshot_block_public_access_state)
-        self.instance_metadata_defaults = []
-        self.__threading_call__(self._get_instance_metadata_defaults)
-        self.launch_templates = []
-        self.__threading_call__(self._describe_launch_templates)
-        self.__threading_call__(
-            self._describe_launch_template_versions, self.launch_templates
+        # The phases declaring their attributes are lazy: they only call the APIs when the attributes are read
+        self.__threading_call_phases__(
+            [
+                ServicePhase(self._describe_instances),
+                ServicePhase(
+                    self._get_instance_user_data,
+                    self.instances,
+                    depends_on=[self._describe_instances],
+                ),
+                ServicePhase(self._describe_security_groups),
+                ServicePhase(
+                    self._describe_network_interfaces,
+                    depends_on=[self._describe_security_groups],
+                ),
+                ServicePhase(
+                    self._describe_network_acls, attributes={"network_acls": dict}
+                ),
+                ServicePhase(
+                    self._describe_snapshots,
+                    attributes={
+                        "snapshots": list,
+                        "volumes_with_snapshots": dict,
+                        "regions_with_snapshots": dict,
+                    },
+                ),
+                ServicePhase(
+                    self._determine_public_snapshots,
+                    "snapshots",
+                    depends_on=[self._describe_snapshots],
+                    attributes={"snapshots": list},
+                ),
+                ServicePhase(self._describe_images, attributes={"images": list}),
+                ServicePhase(self._describe_volumes, attributes={"volumes": list}),
+                ServicePhase(
+                    self._get_resources_for_regions,
+                    depends_on=[
+                        self._describe_instances,
+                        self._describe_snapshots,
+                        self._describe_volumes,
+                    ],
+                    attributes={"attributes_for_regions": dict},
+                ),
+                ServicePhase(
+                    self._get_ebs_encryption_settings,
+                    depends_on=[self._get_resources_for_regions],
+                    attributes={"ebs_encryption_by_default": list},
+                ),
+                ServicePhase(
+                    self._describe_ec2_addresses, attributes={"elastic_ips": list}
+                ),
+                ServicePhase(
+                    self._get_snapshot_block_public_access_state,
+                    depends_on=[self._get_resources_for_regions],
+                    attributes={"ebs_block_public_access_snapshots_states": list},
+                ),
+                ServicePhase(
+                    self._get_instance_metadata_defaults,
+                    depends_on=[self._get_resources_for_regions],
+                    attributes={"instance_metadata_defaults": list},
+                ),
+                ServicePhase(
+                    self._describe_launch_templates,
+                    attributes={"launch_templates": list},
+                ),
+                ServicePhase(
+                    self._describe_launch_template_versions,
+                    "launch_templates",
+                    depends_on=[
+                        self._describe_launch_templates,
+                        self._describe_network_interfaces,
+                    ],
+                    attributes={"launch_templates": list},
+                ),
+                ServicePhase(
+                    self._describe_vpn_endpoints, attributes={"vpn_endpoints": dict}
+                ),
+                ServicePhase(
+                    self._describe_transit_gateways,
+                    attributes={"transit_gateways": dict},
+                ),
+            ]
         )
-        self.vpn_endpoints = {}
-        self.__threading_call__(self._describe_vpn_endpoints)
-        self.transit_gateways = {}
-        self.__threading_call__(self._describe_transit_gateways)
 
     def _get_volume_arn_template(self, region):
         return (
@@ -321,7 +373,8 @@ class EC2(AWSService):
     ):
         try:
             for sg in interface_security_groups:
-                for security_group in self.security_groups.values():
+                # The security groups of other regions can be loaded at the same time
+                for security_group in list(self.security_groups.values()):
                     if security_group.id == sg["GroupId"]:
                         security_group.network_interfaces.append(interface)
         except Exception as error:
@@ -719,6 +772,14 @@ class SecurityGroup(BaseModel):
     ingress_rules: list[dict]
     egress_rules: list[dict]
     tags: Optional[list] = []
+    _exposure: Optional[SecurityGroupExposure] = PrivateAttr(default=None)
+
+    @property
+    def exposure(self) -> SecurityGroupExposure:
+        """Index of the ports opened by the ingress rules, built once on first use"""
+        if self._exposure is None:
+            self._exposure = SecurityGroupExposure(self.ingress_rules)
+        return self._exposure
 
 
 class NetworkACL(BaseModel):
@@ -1,5 +1,123 @@
 import ipaddress
-from typing import Any
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Optional
+
+PUBLIC_IPV4 = "0.0.0.0/0"
+PUBLIC_IPV6 = "::/0"
+ALL_PORTS_RANGE = 65536
+
+
+class SecurityGroupExposure:
+    """
+    Index of the ports opened by a set of Security Group ingress rules
+
+    The ingress rules are normalized once into merged port intervals per protocol, split by
+    the scope of the source CIDR: any address (0.0.0.0/0 or ::/0), public and private.
+    Every lookup afterwards is a binary search over the intervals instead of walking the rules.
+
+    The lookups with public sources return the same result as calling check_security_group
+    for every ingress rule and keeping whether any of them returned True.
+    """
+
+    def __init__(self, ingress_rules: list) -> None:
+        self._scopes = {
+            "any_address": _ExposureScope(),
+            "public": _ExposureScope(),
+            "private": _ExposureScope(),
+        }
+        for ingress_rule in ingress_rules:
+            cidrs = [
+                ip_range["CidrIp"] for ip_range in ingress_rule.get("IpRanges", [])
+            ] + [
+                ip_range["CidrIpv6"] for ip_range in ingress_rule.get("Ipv6Ranges", [])
+            ]
+            for scope in {_get_cidr_scope(cidr) for cidr in cidrs} - {None}:
+                self._scopes[scope].add_rule(ingress_rule)
+        for scope in self._scopes.values():
+            scope.merge()
+
+    def is_open(
+        self, protocol: str, ports: list = [], any_address: bool = False
+    ) -> bool:
+        """
+        Check if the ports are open to the Internet using the protocol
+
+        @param protocol: Protocol to check. If -1, all protocols will be checked.
+
+        @param ports: List of ports to check. If empty, check if all ports are open. If None, any port will be checked. (Default: [])
+
+        @param any_address: If True, only 0.0.0.0/0 or "::/0" will be public and do not search for public addresses. (Default: False)
+
+        @return: True if any ingress rule opens the ports to the Internet using the protocol
+        """
+        scopes = ["any_address"] if any_address else ["any_address", "public"]
+        return any(self._scopes[scope].is_open(protocol, ports) for scope in scopes)
+
+    def is_open_from_private(self, protocol: str, ports: list = []) -> bool:
+        """
+        Check if the ports are open to private networks using the protocol
+
+        @param protocol: Protocol to check. If -1, all protocols will be checked.
+
+        @param ports: List of ports to check. If empty, check if all ports are open. If None, any port will be checked. (Default: [])
+
+        @return: True if any ingress rule opens the ports to a private CIDR using the protocol
+        """
+        return self._scopes["private"].is_open(protocol, ports)
+
+
+class _ExposureScope:
+    """Port intervals opened to the sources of one scope"""
+
+    def __init__(self) -> None:
+        self.all_traffic = False
+        self.all_ports = False
+        self.any_port = False
+        self.port_ranges = {}
+        self._starts = {}
+        self._ends = {}
+
+    def add_rule(self, ingress_rule: dict) -> None:
+        # All traffic ingress rules regardless of the protocol
+        if ingress_rule["IpProtocol"] == "-1":
+            self.all_traffic = True
+        if "FromPort" in ingress_rule:
+            from_port = int(ingress_rule["FromPort"])
+            to_port = int(ingress_rule["ToPort"])
+            self.any_port = True
+            if to_port - from_port + 1 == ALL_PORTS_RANGE:
+                self.all_ports = True
+            if from_port <= to_port:
+                self.port_ranges.setdefault(ingress_rule["IpProtocol"], []).append(
+                    (from_port, to_port)
+                )
+
+    def merge(self) -> None:
+        for protocol, port_ranges in self.port_ranges.items():
+            merged = []
+            for from_port, to_port in sorted(port_ranges):
+                if merged and from_port <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], to_port)
+                else:
+                    merged.append([from_port, to_port])
+            self._starts[protocol] = [port_range[0] for port_range in merged]
+            self._ends[protocol] = [port_range[1] for port_range in merged]
+
+    def is_open(self, protocol: str, ports: list) -> bool:
+        if self.all_traffic or self.all_ports:
+            return True
+        if ports is None:
+            return self.any_port
+        starts = self._starts.get(protocol)
+        if not starts:
+            return False
+        ends = self._ends[protocol]
+        for port in ports:
+            index = bisect_right(starts, port) - 1
+            if index >= 0 and port <= ends[index]:
+                return True
+        return False
 
 
 def check_security_group(
@@ -36,67 +154,25 @@ def check_security_group(
 
     @return: True if the security group has public access to the check_ports using the protocol
     """
-    # Check for all traffic ingress rules regardless of the protocol
-    if ingress_rule["IpProtocol"] == "-1":
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                return True
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                return True
+    return SecurityGroupExposure([ingress_rule]).is_open(protocol, ports, any_address)
+
+
+@lru_cache(maxsize=4096)
+def _get_cidr_scope(cidr: str) -> Optional[str]:
+    """
+    Get the scope of the sources of a CIDR: "any_address", "public" or "private"
+
+    @param cidr: CIDR 10.22.33.44/8
 
-    # Check for specific ports in ingress rules
-    if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
-
-        # Test Security Group
-        # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-                # If None input ports check if any port is open
-                if ports is None:
-                    return True
-
-        # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-                # If None input ports check if any port is open
-                if ports is None:
-                    return True
-
-    return False
+    @return: The scope of the CIDR or None if it is not a valid network
+    """
+    if cidr in (PUBLIC_IPV4, PUBLIC_IPV6):
+        return "any_address"
+    try:
+        network = ipaddress.ip_network(cidr)
+    except ValueError:
+        return None
+    return "public" if network.is_global else "private"
 
 
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
@@ -107,9 +183,7 @@ def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
 
     @param any_address: If True, only 0.0.0.0/0 or "::/0" will be public and do not search for public addresses. (Default: False)
     """
-    public_IPv4 = "0.0.0.0/0"
-    public_IPv6 = "::/0"
-    if cidr in (public_IPv4, public_IPv6):
+    if cidr in (PUBLIC_IPV4, PUBLIC_IPV6):
         return True
     if not any_address:
         return ipaddress.ip_network(cidr).is_global
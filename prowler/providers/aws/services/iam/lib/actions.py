@@ -0,0 +1,108 @@
+from threading import Lock
+from typing import Iterable
+
+from py_iam_expand.actions import InvalidActionHandling, expand_actions
+
+
+class ActionIndex:
+    """
+    Index of the IAM actions known by py_iam_expand.
+
+    Every action has a fixed position in the index, so a set of actions is stored as an
+    integer bitset and the union, difference and subset operations between the sets
+    of actions of the policies are bitwise operations. The expansion of every action
+    pattern is memoized, so each pattern is expanded only once per process.
+    """
+
+    def __init__(self) -> None:
+        self._actions = []
+        self._positions = {}
+        self._patterns = {}
+        self._lock = Lock()
+        self.all_actions = self.expand("*")
+
+    def expand(self, pattern: str) -> int:
+        """
+        Expands an action pattern, with wildcards, into the bitset of its actions.
+
+        Args:
+            pattern (str): The action pattern (e.g., 's3:Get*' or '*').
+
+        Returns:
+            int: The bitset of the actions matched by the pattern. Invalid patterns match no actions.
+        """
+        bitset = self._patterns.get(pattern)
+        if bitset is None:
+            bitset = self.from_actions(
+                expand_actions(pattern, InvalidActionHandling.REMOVE)
+            )
+            self._patterns[pattern] = bitset
+        return bitset
+
+    def expand_patterns(self, patterns: Iterable[str]) -> int:
+        """
+        Expands several action patterns into the bitset of the union of their actions.
+
+        Args:
+            patterns (Iterable[str]): The action patterns.
+
+        Returns:
+            int: The bitset of the actions matched by any of the patterns.
+        """
+        bitset = 0
+        for pattern in patterns:
+            bitset |= self.expand(pattern)
+        return bitset
+
+    def from_actions(self, actions: Iterable[str]) -> int:
+        """
+        Builds the bitset of a set of actions, adding the actions not indexed yet.
+
+        Args:
+            actions (Iterable[str]): The IAM actions (e.g., 's3:GetObject').
+
+        Returns:
+            int: The bitset of the actions.
+        """
+        bitset = 0
+        for action in actions:
+            position = self._positions.get(action)
+            if position is None:
+                with self._lock:
+                    position = self._positions.get(action)
+                    if position is None:
+                        position = len(self._actions)
+                        self._actions.append(action)
+                        self._positions[action] = position
+            bitset |= 1 << position
+        return bitset
+
+    def to_actions(self, bitset: int) -> set[str]:
+        """
+        Converts a bitset back into its set of actions.
+
+        Args:
+            bitset (int): The bitset of the actions.
+
+        Returns:
+            set[str]: The IAM actions of the bitset.
+        """
+        return {
+            self._actions[position]
+            for position, bit in enumerate(reversed(bin(bitset)[2:]))
+            if bit == "1"
+        }
+
+
+_action_index = None
+_action_index_lock = Lock()
+
+
+def get_action_index() -> ActionIndex:
+    """Returns the IAM action index, built once per process."""
+    global _action_index
+    if _action_index is None:
+        with _action_index_lock:
+            if _action_index is None:
+                _action_index = ActionIndex()
+    return _action_index
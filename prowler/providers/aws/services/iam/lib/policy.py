@@ -2,10 +2,12 @@ import re
 from ipaddress import ip_address, ip_network
 from typing import Optional, Tuple
 
-from py_iam_expand.actions import InvalidActionHandling, expand_actions
-
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.services.iam.lib.actions import (
+    ActionIndex,
+    get_action_index,
+)
 
 
 def _get_patterns_from_standard_value(value):
@@ -36,13 +38,29 @@ def get_effective_actions(policy: dict) -> set[str]:
     Returns:
         set[str]: A set of effectively allowed IAM action strings.
     """
+    action_index = get_action_index()
+    return action_index.to_actions(get_effective_actions_bitset(policy, action_index))
+
+
+def get_effective_actions_bitset(policy: dict, action_index: ActionIndex) -> int:
+    """
+    Calculates the effectively allowed IAM actions from a policy document as a bitset
+    of the action index. See get_effective_actions.
+
+    Args:
+        policy (dict): The IAM policy document.
+        action_index (ActionIndex): The IAM action index.
+
+    Returns:
+        int: The bitset of the effectively allowed IAM actions.
+    """
     if not policy or "Statement" not in policy:
-        return set()
+        return 0
 
-    directly_allowed_actions = set()
-    directly_denied_actions = set()
-    allow_not_action_exclusions = set()
-    deny_not_action_exclusions = set()
+    directly_allowed_actions = 0
+    directly_denied_actions = 0
+    allow_not_action_exclusions = 0
+    deny_not_action_exclusions = 0
     has_allow_not_action_statement = False
     has_deny_not_action_statement = False
 
@@ -64,71 +82,39 @@ def get_effective_actions(policy: dict) -> set[str]:
 
         action_patterns_to_expand = _get_patterns_from_standard_value(actions)
         if action_patterns_to_expand:
-            expanded = set()
-            for pattern in action_patterns_to_expand:
-                expanded.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            expanded = action_index.expand_patterns(action_patterns_to_expand)
             if effect == "allow":
-                directly_allowed_actions.update(expanded)
+                directly_allowed_actions |= expanded
             else:  # deny
-                directly_denied_actions.update(expanded)
+                directly_denied_actions |= expanded
 
         not_action_patterns_to_expand = _get_patterns_from_standard_value(not_actions)
         if not_action_patterns_to_expand:
-            expanded_exclusions = set()
-            for pattern in not_action_patterns_to_expand:
-                expanded_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            expanded_exclusions = action_index.expand_patterns(
+                not_action_patterns_to_expand
+            )
             if effect == "allow":
-                allow_not_action_exclusions.update(expanded_exclusions)
+                allow_not_action_exclusions |= expanded_exclusions
                 has_allow_not_action_statement = True
             else:  # deny
-                deny_not_action_exclusions.update(expanded_exclusions)
+                deny_not_action_exclusions |= expanded_exclusions
                 has_deny_not_action_statement = True
 
-    all_actions = None
-
     # Actions allowed by "Allow Action" statements
     potentially_allowed = directly_allowed_actions
 
     # Actions allowed by "Allow NotAction" statements
     if has_allow_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        allowed_by_not_action = all_actions.difference(allow_not_action_exclusions)
-        potentially_allowed.update(allowed_by_not_action)
+        potentially_allowed |= action_index.all_actions & ~allow_not_action_exclusions
 
     # Actions denied by "Deny Action" statements
     potentially_denied = directly_denied_actions
 
     # Actions denied by "Deny NotAction" statements
     if has_deny_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        denied_by_not_action = all_actions.difference(deny_not_action_exclusions)
-        potentially_denied.update(denied_by_not_action)
+        potentially_denied |= action_index.all_actions & ~deny_not_action_exclusions
 
-    effective_actions = potentially_allowed.difference(potentially_denied)
-
-    return effective_actions
+    return potentially_allowed & ~potentially_denied
 
 
 def check_full_service_access(service: str, policy: dict) -> bool:
@@ -146,26 +132,20 @@ def check_full_service_access(service: str, policy: dict) -> bool:
     if not policy or "Statement" not in policy:
         return False
 
+    action_index = get_action_index()
     service_wildcard = f"{service}:*" if service != "*" else "*"
-    all_target_service_actions = set(
-        expand_actions(
-            service_wildcard,
-            InvalidActionHandling.REMOVE,
-        )
-    )
+    all_target_service_actions = action_index.expand(service_wildcard)
 
-    effective_allowed_actions = get_effective_actions(policy)
+    effective_allowed_actions = get_effective_actions_bitset(policy, action_index)
 
-    if not all_target_service_actions.issubset(effective_allowed_actions):
+    if all_target_service_actions & ~effective_allowed_actions:
         return False
 
-    actions_allowed_on_all_resources = set()
+    actions_allowed_on_all_resources = 0
     statements = policy.get("Statement", [])
     if not isinstance(statements, list):
         statements = [statements]
 
-    all_aws_actions_for_inversion = None
-
     for statement in statements:
         effect = statement.get("Effect", "")
         resources = statement.get("Resource", [])
@@ -179,48 +159,24 @@ def check_full_service_access(service: str, policy: dict) -> bool:
 
         actions = statement.get("Action")
         not_actions = statement.get("NotAction")
-        statement_specific_allowed = set()
 
         # Use the shared helper function instead of the duplicated one
         action_patterns = _get_patterns_from_standard_value(actions)
-        for pattern in action_patterns:
-            statement_specific_allowed.update(
-                expand_actions(
-                    pattern,
-                    InvalidActionHandling.REMOVE,
-                )
-            )
+        statement_specific_allowed = action_index.expand_patterns(action_patterns)
 
         not_action_patterns = _get_patterns_from_standard_value(not_actions)
         if not_action_patterns:
-            if all_aws_actions_for_inversion is None:
-                all_aws_actions_for_inversion = set(
-                    expand_actions(
-                        "*",
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-
-            statement_exclusions = set()
-            for pattern in not_action_patterns:
-                statement_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            statement_exclusions = action_index.expand_patterns(not_action_patterns)
             # Actions allowed by THIS NotAction statement
-            statement_specific_allowed.update(
-                all_aws_actions_for_inversion.difference(statement_exclusions)
+            statement_specific_allowed |= (
+                action_index.all_actions & ~statement_exclusions
             )
 
-        actions_allowed_on_all_resources.update(
-            action
-            for action in statement_specific_allowed
-            if action in all_target_service_actions
+        actions_allowed_on_all_resources |= (
+            statement_specific_allowed & all_target_service_actions
         )
 
-    return all_target_service_actions.issubset(actions_allowed_on_all_resources)
+    return not all_target_service_actions & ~actions_allowed_on_all_resources
 
 
 def is_condition_restricting_from_private_ip(condition_statement: dict) -> bool:
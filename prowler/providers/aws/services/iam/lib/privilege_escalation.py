@@ -1,7 +1,6 @@
-from py_iam_expand.actions import expand_actions
-
 from prowler.lib.logger import logger
-from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
+from prowler.providers.aws.services.iam.lib.actions import get_action_index
+from prowler.providers.aws.services.iam.lib.policy import get_effective_actions_bitset
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
 # Does the tool take a principal-centric or policy-centric approach? --> Policy-centric approach.
@@ -107,7 +106,8 @@ def check_privilege_escalation(policy: dict) -> str:
         return policies_affected
 
     try:
-        effective_allowed_actions = get_effective_actions(policy)
+        action_index = get_action_index()
+        effective_allowed_actions = get_effective_actions_bitset(policy, action_index)
 
         matched_combo_actions = set()
         matched_combo_keys = set()
@@ -117,13 +117,14 @@ def check_privilege_escalation(policy: dict) -> str:
             required_actions_patterns,
         ) in privilege_escalation_policies_combination.items():
             # Expand the required actions for the current combo
-            expanded_required_actions = set()
-            for action_pattern in required_actions_patterns:
-                expanded_required_actions.update(expand_actions(action_pattern))
+            expanded_required_actions = action_index.expand_patterns(
+                required_actions_patterns
+            )
 
             # Check if all expanded required actions are present in the effective actions
-            if expanded_required_actions and expanded_required_actions.issubset(
-                effective_allowed_actions
+            if (
+                expanded_required_actions
+                and not expanded_required_actions & ~effective_allowed_actions
             ):
                 # If match, store the original patterns and the key
                 matched_combo_actions.update(required_actions_patterns)
@@ -6,6 +6,7 @@ from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.providers.aws.lib.service.phases import ServicePhase
 from prowler.providers.aws.lib.service.service import AWSService
 
 
@@ -20,18 +21,41 @@ class RDS(AWSService):
         self.db_cluster_parameters = {}
         self.db_cluster_snapshots = []
         self.db_event_subscriptions = []
-        self.__threading_call__(self._describe_db_instances)
-        self.__threading_call__(self._describe_db_certificate)
-        self.__threading_call__(self._describe_db_parameters)
-        self.__threading_call__(self._describe_db_snapshots)
-        self.__threading_call__(self._describe_db_snapshot_attributes)
-        self.__threading_call__(self._describe_db_clusters)
-        self.__threading_call__(self._describe_db_cluster_parameters)
-        self.__threading_call__(self._describe_db_cluster_snapshots)
-        self.__threading_call__(self._describe_db_cluster_snapshot_attributes)
-        self.__threading_call__(self._describe_db_engine_versions)
-        self.__threading_call__(self._describe_db_event_subscriptions)
-        self.__threading_call__(self._list_tags, self.db_event_subscriptions)
+        self.__threading_call_phases__(
+            [
+                ServicePhase(self._describe_db_instances),
+                ServicePhase(
+                    self._describe_db_certificate,
+                    depends_on=[self._describe_db_instances],
+                ),
+                ServicePhase(
+                    self._describe_db_parameters,
+                    depends_on=[self._describe_db_instances],
+                ),
+                ServicePhase(self._describe_db_snapshots),
+                ServicePhase(
+                    self._describe_db_snapshot_attributes,
+                    depends_on=[self._describe_db_snapshots],
+                ),
+                ServicePhase(self._describe_db_clusters),
+                ServicePhase(
+                    self._describe_db_cluster_parameters,
+                    depends_on=[self._describe_db_clusters],
+                ),
+                ServicePhase(self._describe_db_cluster_snapshots),
+                ServicePhase(
+                    self._describe_db_cluster_snapshot_attributes,
+                    depends_on=[self._describe_db_cluster_snapshots],
+                ),
+                ServicePhase(self._describe_db_engine_versions),
+                ServicePhase(self._describe_db_event_subscriptions),
+                ServicePhase(
+                    self._list_tags,
+                    self.db_event_subscriptions,
+                    depends_on=[self._describe_db_event_subscriptions],
+                ),
+            ]
+        )
 
     def _get_rds_arn_template(self, region):
         return (
@@ -118,7 +142,7 @@ class RDS(AWSService):
     def _describe_db_parameters(self, regional_client):
         logger.info("RDS - Describe DB Parameters...")
         try:
-            for instance in self.db_instances.values():
+            for instance in list(self.db_instances.values()):
                 if instance.region == regional_client.region:
                     for parameter_group in instance.parameter_groups:
                         try:
@@ -143,7 +167,7 @@ class RDS(AWSService):
     def _describe_db_certificate(self, regional_client):
         logger.info("RDS - Describe DB Certificate...")
         try:
-            for instance in self.db_instances.values():
+            for instance in list(self.db_instances.values()):
                 if instance.region == regional_client.region:
                     describe_db_certificates_paginator = regional_client.get_paginator(
                         "describe_certificates"
@@ -305,7 +329,7 @@ class RDS(AWSService):
     def _describe_db_cluster_parameters(self, regional_client):
         logger.info("RDS - Describe DB Cluster Parameters...")
         try:
-            for cluster in self.db_clusters.values():
+            for cluster in list(self.db_clusters.values()):
                 if cluster.region == regional_client.region:
                     try:
                         describe_db_cluster_parameters_paginator = (
@@ -6,6 +6,7 @@ from pydantic.v1 import BaseModel, Field
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.providers.aws.lib.service.phases import ServicePhase
 from prowler.providers.aws.lib.service.service import AWSService
 
 
@@ -17,23 +18,28 @@ class S3(AWSService):
         self.regions_with_buckets = []
         self.buckets = {}
         self._list_buckets(provider)
-        self.__threading_call__(self._get_bucket_versioning, self.buckets.values())
-        self.__threading_call__(self._get_bucket_logging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_policy, self.buckets.values())
-        self.__threading_call__(self._get_bucket_acl, self.buckets.values())
-        self.__threading_call__(self._get_public_access_block, self.buckets.values())
-        self.__threading_call__(self._get_bucket_encryption, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_ownership_controls, self.buckets.values()
-        )
-        self.__threading_call__(
-            self._get_object_lock_configuration, self.buckets.values()
-        )
-        self.__threading_call__(self._get_bucket_tagging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_replication, self.buckets.values())
-        self.__threading_call__(self._get_bucket_lifecycle, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_notification_configuration, self.buckets.values()
+        # The bucket phases are independent, so they run concurrently for every bucket
+        self.__threading_call_phases__(
+            [
+                ServicePhase(self._get_bucket_versioning, self.buckets.values()),
+                ServicePhase(self._get_bucket_logging, self.buckets.values()),
+                ServicePhase(self._get_bucket_policy, self.buckets.values()),
+                ServicePhase(self._get_bucket_acl, self.buckets.values()),
+                ServicePhase(self._get_public_access_block, self.buckets.values()),
+                ServicePhase(self._get_bucket_encryption, self.buckets.values()),
+                ServicePhase(
+                    self._get_bucket_ownership_controls, self.buckets.values()
+                ),
+                ServicePhase(
+                    self._get_object_lock_configuration, self.buckets.values()
+                ),
+                ServicePhase(self._get_bucket_tagging, self.buckets.values()),
+                ServicePhase(self._get_bucket_replication, self.buckets.values()),
+                ServicePhase(self._get_bucket_lifecycle, self.buckets.values()),
+                ServicePhase(
+                    self._get_bucket_notification_configuration, self.buckets.values()
+                ),
+            ]
         )
 
     def _list_buckets(self, provider):
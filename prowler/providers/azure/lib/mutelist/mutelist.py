@@ -4,6 +4,17 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class AzureMutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: Check_Report_Azure,
+    ) -> tuple:
+        return (
+            finding.subscription,
+            finding.check_metadata.CheckID,
+            finding.location,
+            finding.resource_name,
+        )
+
     def is_finding_muted(
         self,
         finding: Check_Report_Azure,
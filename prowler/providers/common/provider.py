@@ -176,6 +176,13 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        api_max_workers=arguments.aws_api_workers,
+                        api_max_workers_per_service=arguments.aws_api_workers_per_service,
+                        api_max_workers_per_region=arguments.aws_api_workers_per_region,
+                        api_rate_limit=arguments.aws_api_rate_limit,
+                        api_cache_ttl=arguments.aws_api_cache_ttl,
+                        api_cache_max_size=arguments.aws_api_cache_max_size,
+                        api_cache_file=arguments.aws_api_cache_file,
                     )
                 elif "azure" in provider_class_name.lower():
                     provider_class(
@@ -201,6 +208,7 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        api_max_workers=arguments.gcp_api_workers,
                     )
                 elif "kubernetes" in provider_class_name.lower():
                     provider_class(
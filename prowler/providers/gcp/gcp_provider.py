@@ -29,6 +29,10 @@ from prowler.providers.gcp.exceptions.exceptions import (
     GCPTestConnectionError,
 )
 from prowler.providers.gcp.lib.mutelist.mutelist import GCPMutelist
+from prowler.providers.gcp.lib.service.api_enablement import (
+    reset_api_enablement_cache,
+)
+from prowler.providers.gcp.lib.service.worker_pool import set_api_worker_pool
 from prowler.providers.gcp.models import GCPIdentityInfo, GCPOrganization, GCPProject
 
 
@@ -84,6 +88,7 @@ class GcpProvider(Provider):
         client_secret: str = None,
         refresh_token: str = None,
         service_account_key: dict = None,
+        api_max_workers: int = None,
     ):
         """
         GCP Provider constructor
@@ -104,6 +109,7 @@ class GcpProvider(Provider):
             client_secret: str
             refresh_token: str
             service_account_key: dict
+            api_max_workers: int
 
         Raises:
             GCPNoAccesibleProjectsError if no project IDs can be accessed via Google Credentials
@@ -255,6 +261,12 @@ class GcpProvider(Provider):
         # Fixer Config
         self._fixer_config = fixer_config
 
+        # Shared API worker pool used by all the GCP services
+        if api_max_workers:
+            set_api_worker_pool(max_workers=api_max_workers)
+        # Enabled APIs of the projects, shared by all the GCP services of this provider
+        reset_api_enablement_cache()
+
         # Mutelist
         if mutelist_content:
             self._mutelist = GCPMutelist(
@@ -1,3 +1,6 @@
+from argparse import ArgumentTypeError
+
+
 def init_parser(self):
     """Init the GCP Provider CLI parser"""
     gcp_parser = self.subparsers.add_parser(
@@ -48,3 +51,23 @@ def init_parser(self):
         action="store_true",
         help="List available project IDs in Google Cloud which can be scanned by Prowler",
     )
+    # GCP API Concurrency
+    gcp_api_concurrency_subparser = gcp_parser.add_argument_group("GCP API Concurrency")
+    gcp_api_concurrency_subparser.add_argument(
+        "--gcp-api-workers",
+        nargs="?",
+        default=None,
+        type=validate_api_workers,
+        help="Set the maximum number of concurrent GCP API calls, shared by all the services and projects (Default: 20)",
+    )
+
+
+def validate_api_workers(workers: str) -> int:
+    """validate_api_workers validates that the input number of GCP API workers is a positive integer"""
+    try:
+        workers = int(workers)
+    except ValueError:
+        raise ArgumentTypeError("The number of GCP API workers must be an integer")
+    if workers < 1:
+        raise ArgumentTypeError("The number of GCP API workers must be at least 1")
+    return workers
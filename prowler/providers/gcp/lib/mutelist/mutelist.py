@@ -4,6 +4,17 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class GCPMutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: Check_Report_GCP,
+    ) -> tuple:
+        return (
+            finding.project_id,
+            finding.check_metadata.CheckID,
+            finding.location,
+            finding.resource_name,
+        )
+
     def is_finding_muted(
         self,
         finding: Check_Report_GCP,
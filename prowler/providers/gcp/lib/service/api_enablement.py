@@ -0,0 +1,134 @@
+import threading
+from threading import Lock
+from typing import Optional
+
+from google.oauth2.credentials import Credentials
+from googleapiclient import discovery
+from googleapiclient.discovery import Resource
+
+from prowler.lib.logger import logger
+
+_thread_clients = threading.local()
+
+
+def get_service_usage_client(credentials: Credentials) -> Resource:
+    """
+    get_service_usage_client returns the Service Usage API client of the current thread for the given credentials.
+
+    The clients are not thread safe, so every thread of the pool builds its own client once and reuses it
+    for all the projects, instead of building a new client for every request.
+
+    Args:
+        credentials (Credentials): The GCP credentials.
+
+    Returns:
+        Resource: The Service Usage API client.
+    """
+    client = getattr(_thread_clients, "service_usage", None)
+    if client is None or client[0] is not credentials:
+        client = (
+            credentials,
+            discovery.build("serviceusage", "v1", credentials=credentials),
+        )
+        _thread_clients.service_usage = client
+    return client[1]
+
+
+class APIEnablementCache:
+    """
+    APIEnablementCache keeps the APIs enabled in every project, shared by all the GCP services of the scan.
+
+    The enabled APIs of a project are listed once, with a single paginated request, the first time any
+    service asks for it, and every service then checks its own API against the list. If the APIs cannot be
+    listed, e.g. the permission is missing, the state of each API is requested as before.
+
+    Example:
+        api_enablement_cache = get_api_enablement_cache()
+        api_enablement_cache.get_api_state(credentials, "project-id", "compute")
+    """
+
+    def __init__(self):
+        self._enabled_services: dict[str, Optional[set[str]]] = {}
+        self._project_locks: dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def get_api_state(
+        self, credentials: Credentials, project_id: str, service: str
+    ) -> str:
+        """
+        get_api_state returns the state of the API of the service in the project, "ENABLED" or "DISABLED".
+
+        Args:
+            credentials (Credentials): The GCP credentials.
+            project_id (str): The project ID.
+            service (str): The service name, e.g. "compute".
+
+        Returns:
+            str: The state of the API.
+
+        Raises:
+            Exception: If the state of the API cannot be requested.
+        """
+        enabled_services = self._get_enabled_services(credentials, project_id)
+        if enabled_services is not None:
+            if f"{service}.googleapis.com" in enabled_services:
+                return "ENABLED"
+            return "DISABLED"
+        response = (
+            get_service_usage_client(credentials)
+            .services()
+            .get(name=f"projects/{project_id}/services/{service}.googleapis.com")
+            .execute()
+        )
+        return response.get("state")
+
+    def _get_enabled_services(
+        self, credentials: Credentials, project_id: str
+    ) -> Optional[set[str]]:
+        """_get_enabled_services returns the APIs enabled in the project, listed once, or None if they cannot be listed."""
+        with self._lock:
+            project_lock = self._project_locks.setdefault(project_id, Lock())
+        with project_lock:
+            if project_id not in self._enabled_services:
+                self._enabled_services[project_id] = self._list_enabled_services(
+                    credentials, project_id
+                )
+            return self._enabled_services[project_id]
+
+    def _list_enabled_services(
+        self, credentials: Credentials, project_id: str
+    ) -> Optional[set[str]]:
+        try:
+            client = get_service_usage_client(credentials)
+            enabled_services = set()
+            request = client.services().list(
+                parent=f"projects/{project_id}", filter="state:ENABLED", pageSize=200
+            )
+            while request is not None:
+                response = request.execute()
+                for service in response.get("services", []):
+                    enabled_services.add(service["name"].split("/")[-1])
+                request = client.services().list_next(
+                    previous_request=request, previous_response=response
+                )
+            return enabled_services
+        except Exception as error:
+            logger.debug(
+                f"{project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+
+_api_enablement_cache = APIEnablementCache()
+
+
+def get_api_enablement_cache() -> APIEnablementCache:
+    """get_api_enablement_cache returns the APIEnablementCache of the current scan"""
+    return _api_enablement_cache
+
+
+def reset_api_enablement_cache() -> APIEnablementCache:
+    """reset_api_enablement_cache starts a new APIEnablementCache, e.g. when a new GCP provider is set up"""
+    global _api_enablement_cache
+    _api_enablement_cache = APIEnablementCache()
+    return _api_enablement_cache
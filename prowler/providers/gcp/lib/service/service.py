@@ -1,4 +1,4 @@
-import threading
+from concurrent.futures import as_completed
 
 import google_auth_httplib2
 import httplib2
@@ -8,6 +8,8 @@ from googleapiclient.discovery import Resource
 
 from prowler.lib.logger import logger
 from prowler.providers.gcp.gcp_provider import GcpProvider
+from prowler.providers.gcp.lib.service.api_enablement import get_api_enablement_cache
+from prowler.providers.gcp.lib.service.worker_pool import get_api_worker_pool
 
 
 class GCPService:
@@ -38,13 +40,16 @@ class GCPService:
         return self.client
 
     def __threading_call__(self, call, iterator):
-        threads = []
-        for value in iterator:
-            threads.append(threading.Thread(target=call, args=(value,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # Submit tasks to the shared and bounded thread pool
+        futures = [get_api_worker_pool().submit(call, value) for value in iterator]
+        # Wait for all tasks to complete
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
 
     def __get_AuthorizedHttp_client__(self):
         return google_auth_httplib2.AuthorizedHttp(
@@ -52,17 +57,21 @@ class GCPService:
         )
 
     def __is_api_active__(self, audited_project_ids):
+        # The projects are checked concurrently, sharing the enabled APIs of each project with the other services
+        api_enablement_cache = get_api_enablement_cache()
+        futures = [
+            get_api_worker_pool().submit(
+                api_enablement_cache.get_api_state,
+                self.credentials,
+                project_id,
+                self.service,
+            )
+            for project_id in audited_project_ids
+        ]
         project_ids = []
-        for project_id in audited_project_ids:
+        for project_id, future in zip(audited_project_ids, futures):
             try:
-                client = discovery.build(
-                    "serviceusage", "v1", credentials=self.credentials
-                )
-                request = client.services().get(
-                    name=f"projects/{project_id}/services/{self.service}.googleapis.com"
-                )
-                response = request.execute()
-                if response.get("state") != "DISABLED":
+                if future.result() != "DISABLED":
                     project_ids.append(project_id)
                 else:
                     logger.error(
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+from prowler.lib.logger import logger
+
+# Default number of threads shared by all the GCP services to call the GCP APIs
+DEFAULT_API_MAX_WORKERS = 20
+
+_api_worker_pool: Optional[ThreadPoolExecutor] = None
+_api_worker_pool_lock = Lock()
+
+
+def get_api_worker_pool() -> ThreadPoolExecutor:
+    """
+    get_api_worker_pool returns the process-wide thread pool used by every GCP service to call the GCP APIs, creating it with the default size if needed.
+
+    All the services share the same bounded pool, so the number of concurrent API calls, and open sockets,
+    does not grow with the number of projects, zones or locations being scanned.
+
+    Returns:
+        ThreadPoolExecutor: The process-wide pool.
+    """
+    global _api_worker_pool
+    with _api_worker_pool_lock:
+        if _api_worker_pool is None:
+            _api_worker_pool = ThreadPoolExecutor(
+                max_workers=DEFAULT_API_MAX_WORKERS,
+                thread_name_prefix="prowler-gcp-api",
+            )
+        return _api_worker_pool
+
+
+def set_api_worker_pool(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    set_api_worker_pool replaces the process-wide thread pool with a new one of the given size.
+
+    The calls already submitted to the previous pool are not cancelled.
+
+    Args:
+        max_workers (int): The maximum number of concurrent API calls, DEFAULT_API_MAX_WORKERS if None.
+
+    Returns:
+        ThreadPoolExecutor: The new process-wide pool.
+    """
+    global _api_worker_pool
+    with _api_worker_pool_lock:
+        previous_pool = _api_worker_pool
+        _api_worker_pool = ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_API_MAX_WORKERS,
+            thread_name_prefix="prowler-gcp-api",
+        )
+    if previous_pool:
+        previous_pool.shutdown(wait=False)
+    logger.info(
+        f"GCP API worker pool: {max_workers or DEFAULT_API_MAX_WORKERS} workers"
+    )
+    return _api_worker_pool
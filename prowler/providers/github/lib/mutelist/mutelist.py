@@ -4,6 +4,18 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class GithubMutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: CheckReportGithub,
+        account_name: str,
+    ) -> tuple:
+        return (
+            account_name,
+            finding.check_metadata.CheckID,
+            "*",
+            finding.resource_name,
+        )
+
     def is_finding_muted(
         self,
         finding: CheckReportGithub,
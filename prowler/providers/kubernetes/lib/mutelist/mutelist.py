@@ -4,6 +4,18 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class KubernetesMutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: Check_Report_Kubernetes,
+        cluster: str,
+    ) -> tuple:
+        return (
+            cluster,
+            finding.check_metadata.CheckID,
+            finding.namespace,
+            finding.resource_name,
+        )
+
     def is_finding_muted(
         self,
         finding: Check_Report_Kubernetes,
@@ -4,6 +4,17 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class M365Mutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: CheckReportM365,
+    ) -> tuple:
+        return (
+            finding.tenant_id,
+            finding.check_metadata.CheckID,
+            finding.location,
+            finding.resource_name,
+        )
+
     def is_finding_muted(
         self,
         finding: CheckReportM365,
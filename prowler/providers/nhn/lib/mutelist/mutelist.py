@@ -4,6 +4,17 @@ from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class NHNMutelist(Mutelist):
+    def get_finding_fields(
+        self,
+        finding: CheckReportNHN,
+    ) -> tuple:
+        return (
+            finding.resource_id,
+            finding.check_metadata.CheckID,
+            finding.location,
+            finding.resource_name,
+        )
+
     def is_finding_muted(self, finding: CheckReportNHN) -> bool:
         return self.is_muted(
             finding.resource_id,
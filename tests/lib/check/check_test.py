@@ -1,6 +1,7 @@
 import json
 import os
 import pathlib
+import time
 from importlib.machinery import FileFinder
 from logging import ERROR
 from pkgutil import ModuleInfo
@@ -21,6 +22,7 @@ from prowler.lib.check.check import (
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -944,6 +946,56 @@ class TestCheck:
                                     check_id == check_dir
                                 ), f"CheckID in metadata does not match the check name in {check_directory}. Found CheckID: {check_id}"
 
+    def test_run_checks_sequential(self):
+        executed = []
+
+        def check_runner(check_name):
+            executed.append(check_name)
+            return [check_name]
+
+        checks = ["check_a", "check_b", "check_c"]
+        results = run_checks(checks, check_runner)
+
+        # Checks are only executed when the generator is consumed
+        assert executed == []
+        assert [(check_name, future.result()) for check_name, future in results] == [
+            (check, [check]) for check in checks
+        ]
+        assert executed == checks
+
+    def test_run_checks_parallel_keeps_order(self):
+        def check_runner(check_name):
+            # The first checks are the slowest ones
+            time.sleep(0.01 * (10 - int(check_name.split("_")[1])))
+            return [check_name]
+
+        checks = [f"check_{index}" for index in range(10)]
+        results = [
+            (check_name, future.result())
+            for check_name, future in run_checks(checks, check_runner, max_workers=4)
+        ]
+
+        assert results == [(check, [check]) for check in checks]
+
+    def test_run_checks_parallel_exception(self):
+        def check_runner(check_name):
+            if check_name == "check_b":
+                raise ModuleNotFoundError(check_name)
+            return [check_name]
+
+        results = list(
+            run_checks(["check_a", "check_b", "check_c"], check_runner, max_workers=2)
+        )
+
+        assert [check_name for check_name, _ in results] == [
+            "check_a",
+            "check_b",
+            "check_c",
+        ]
+        assert results[0][1].result() == ["check_a"]
+        assert isinstance(results[1][1].exception(), ModuleNotFoundError)
+        assert results[2][1].result() == ["check_c"]
+
     def test_execute_check_exception_only_logs(self, caplog):
         caplog.set_level(ERROR)
 
@@ -973,3 +1025,40 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_execute_checks_subscribers(self):
+        checks = ["ec2_ami_public", "s3_bucket_public_access", "iam_root_mfa_enabled"]
+        check_findings = {check: [f"{check}-finding"] for check in checks}
+
+        provider = mock.MagicMock()
+        provider.type = "aws"
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+
+        def execute_check(check, *_):
+            return check_findings[check.CheckID]
+
+        def import_check_module(check_module_path):
+            check_name = check_module_path.split(".")[-1]
+            check_module = mock.MagicMock()
+            getattr(check_module, check_name).return_value.CheckID = check_name
+            return check_module
+
+        subscribed_findings = []
+        with (
+            patch("prowler.lib.check.check.import_check", new=import_check_module),
+            patch("prowler.lib.check.check.execute", new=execute_check),
+        ):
+            findings = execute_checks(
+                checks,
+                provider,
+                custom_checks_metadata=None,
+                config_file=None,
+                output_options=output_options,
+                max_workers=2,
+                subscribers=[subscribed_findings.append],
+            )
+
+        # The findings are passed to the subscribers in order instead of returned
+        assert findings == []
+        assert subscribed_findings == [check_findings[check] for check in checks]
@@ -291,6 +291,85 @@ class TestCompliance:
         assert accessanalyzer_enabled_attribute.AdditionalInformation == "Additional"
         assert accessanalyzer_enabled_attribute.References == "References"
 
+    def get_indexed_compliance(self):
+        return Compliance(
+            Framework="Framework",
+            Provider="aws",
+            Version="1.0",
+            Description="Framework Description",
+            Requirements=[
+                Compliance_Requirement(
+                    Id=requirement_id,
+                    Description="description",
+                    Attributes=[],
+                    Checks=checks,
+                )
+                for requirement_id, checks in [
+                    ("1.1", ["accessanalyzer_enabled", "accessanalyzer_enabled"]),
+                    ("1.2", ["iam_user_mfa_enabled_console_access"]),
+                    ("1.10", ["accessanalyzer_enabled"]),
+                    ("1.2", []),
+                ]
+            ],
+        )
+
+    def test_get_check_requirements(self):
+        compliance = self.get_indexed_compliance()
+
+        assert [
+            requirement.Id
+            for requirement in compliance.get_check_requirements(
+                "accessanalyzer_enabled"
+            )
+        ] == ["1.1", "1.10"]
+        assert compliance.get_check_requirements("non_existent_check") == []
+
+    def test_get_requirements(self):
+        compliance = self.get_indexed_compliance()
+
+        requirements = compliance.get_requirements(["1.10", "1.2", "1.10"])
+        assert requirements == [
+            compliance.Requirements[1],
+            compliance.Requirements[2],
+            compliance.Requirements[3],
+        ]
+        # Memoized by the requirement IDs
+        assert compliance.get_requirements(["1.10", "1.2", "1.10"]) is requirements
+        assert compliance.get_requirements([]) == []
+        assert compliance.get_requirements(["9.9"]) == []
+
+    def test_get_requirements_string(self):
+        compliance = self.get_indexed_compliance()
+
+        assert compliance.get_requirements("1.10") == [
+            compliance.Requirements[0],
+            compliance.Requirements[2],
+        ]
+
+    def test_update_checks_metadata_several_requirements(self):
+        bulk_checks_metadata = update_checks_metadata_with_compliance(
+            {"framework_aws": self.get_indexed_compliance()},
+            self.get_custom_check_metadata(),
+        )
+
+        accessanalyzer_enabled_compliance = bulk_checks_metadata[
+            "accessanalyzer_enabled"
+        ].Compliance
+        assert [
+            [requirement.Id for requirement in compliance.Requirements]
+            for compliance in accessanalyzer_enabled_compliance
+        ] == [["1.1"], ["1.10"]]
+        assert all(
+            compliance.Framework == "Framework" and compliance.Version == "1.0"
+            for compliance in accessanalyzer_enabled_compliance
+        )
+        assert [
+            compliance.Requirements[0].Id
+            for compliance in bulk_checks_metadata[
+                "iam_user_mfa_enabled_console_access"
+            ].Compliance
+        ] == ["1.2"]
+
     def test_list_no_provider(self):
         bulk_compliance_frameworks = custom_compliance_metadata
 
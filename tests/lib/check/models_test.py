@@ -1,6 +1,8 @@
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+from pydantic.v1 import BaseModel
+
+from prowler.lib.check.models import Check, Check_Report, CheckMetadata, Severity
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -325,3 +327,67 @@ class TestCheckMetada:
 
         result = CheckMetadata.list(bulk_checks_metadata=bulk_metadata)
         assert result == set()
+
+
+class TestCheckReport:
+    def test_check_metadata_shared(self):
+        metadata = mock_metadata.json()
+        first_report = Check_Report(metadata=metadata, resource={})
+        second_report = Check_Report(metadata=metadata, resource={})
+
+        assert first_report.check_metadata == mock_metadata
+        assert first_report.check_metadata is not second_report.check_metadata
+        # The metadata is parsed once for the check
+        assert (
+            first_report.check_metadata.Remediation
+            is second_report.check_metadata.Remediation
+        )
+
+        first_report.check_metadata.Severity = Severity.low
+        assert first_report.check_metadata.Severity == Severity.low
+        assert second_report.check_metadata.Severity == Severity.high
+        assert (
+            Check_Report(metadata=metadata, resource={}).check_metadata.Severity
+            == Severity.high
+        )
+
+    def test_resource_converted_on_read(self):
+        class Resource(BaseModel):
+            name: str
+
+        resource = mock.MagicMock(wraps=Resource(name="resource"))
+        resource.tags = []
+        report = Check_Report(metadata=mock_metadata.json(), resource=resource)
+        resource.dict.assert_not_called()
+
+        assert report.resource == {"name": "resource"}
+        assert report.resource == {"name": "resource"}
+        resource.dict.assert_called_once()
+
+        report.resource = {"name": "other"}
+        assert report.resource == {"name": "other"}
+
+    def test_resource_not_convertible(self):
+        report = Check_Report(metadata=mock_metadata.json(), resource=None)
+        assert report.resource == {}
+
+
+class TestCheck:
+    def test_metadata_serialized_once(self):
+        class accessanalyzer_enabled(Check):
+            def execute(self):
+                return []
+
+        with mock.patch(
+            "prowler.lib.check.models.check_metadata_cache.parse_file",
+            return_value=mock_metadata,
+        ):
+            check = accessanalyzer_enabled()
+
+        metadata = check.metadata()
+        assert CheckMetadata.parse_raw(metadata) == mock_metadata
+        assert check.metadata() is metadata
+
+        # Changing the check serializes its metadata again
+        check.Severity = Severity.low
+        assert CheckMetadata.parse_raw(check.metadata()).Severity == Severity.low
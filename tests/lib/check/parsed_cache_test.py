@@ -0,0 +1,105 @@
+import json
+import pickle
+from unittest.mock import patch
+
+import pytest
+from pydantic.v1 import BaseModel, ValidationError
+
+from prowler.lib.check.parsed_cache import ParsedFileCache
+
+
+class ParsedModel(BaseModel):
+    Id: str
+    Values: list[int]
+
+
+def write_file(tmp_path, content: dict) -> str:
+    file_path = tmp_path / "model.json"
+    file_path.write_text(json.dumps(content))
+    return str(file_path)
+
+
+class TestParsedFileCache:
+    def test_parse_file_cached(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1, 2]})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+
+        parsed = parsed_cache.parse_file(file_path)
+        assert parsed == ParsedModel(Id="test", Values=[1, 2])
+        assert parsed_cache.misses == 1
+        # Every call returns a new model
+        parsed.Values.append(3)
+        assert parsed_cache.parse_file(file_path) == ParsedModel(
+            Id="test", Values=[1, 2]
+        )
+        assert parsed_cache.hits == 1
+
+    def test_save_and_load(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1]})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        parsed_cache.parse_file(file_path)
+        parsed_cache.save()
+        assert (tmp_path / "cache" / "test.pickle").is_file()
+
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        with patch.object(ParsedModel, "parse_raw") as parse_raw_mock:
+            assert parsed_cache.parse_file(file_path) == ParsedModel(
+                Id="test", Values=[1]
+            )
+        parse_raw_mock.assert_not_called()
+        assert parsed_cache.hits == 1
+        assert parsed_cache.misses == 0
+
+    def test_file_changed(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1]})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        parsed_cache.parse_file(file_path)
+        parsed_cache.save()
+
+        write_file(tmp_path, {"Id": "test", "Values": [2]})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        assert parsed_cache.parse_file(file_path) == ParsedModel(Id="test", Values=[2])
+        assert parsed_cache.misses == 1
+
+    def test_other_version_discarded(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1]})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        parsed_cache.parse_file(file_path)
+        parsed_cache.save()
+
+        with patch("prowler.lib.check.parsed_cache.prowler_version", "0.0.0"):
+            parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+        assert parsed_cache.parse_file(file_path) == ParsedModel(Id="test", Values=[1])
+        assert parsed_cache.misses == 1
+        parsed_cache.save()
+        with open(tmp_path / "cache" / "test.pickle", "rb") as file:
+            assert pickle.load(file)["version"][1] == "0.0.0"
+
+    def test_corrupted_cache_file(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1]})
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "test.pickle").write_bytes(b"not a pickle")
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+
+        assert parsed_cache.parse_file(file_path) == ParsedModel(Id="test", Values=[1])
+        assert parsed_cache.misses == 1
+
+    def test_save_not_writable(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test", "Values": [1]})
+        (tmp_path / "cache").write_text("not a directory")
+        parsed_cache = ParsedFileCache(
+            "test", ParsedModel, str(tmp_path / "cache" / "directory")
+        )
+
+        assert parsed_cache.parse_file(file_path) == ParsedModel(Id="test", Values=[1])
+        parsed_cache.save()
+        assert (tmp_path / "cache").read_text() == "not a directory"
+
+    def test_parse_file_not_valid(self, tmp_path):
+        file_path = write_file(tmp_path, {"Id": "test"})
+        parsed_cache = ParsedFileCache("test", ParsedModel, str(tmp_path / "cache"))
+
+        with pytest.raises(ValidationError):
+            parsed_cache.parse_file(file_path)
+        parsed_cache.save()
+        assert not (tmp_path / "cache").exists()
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from prowler.lib.check.prefetch import (
+    ServicePrefetcher,
+    get_check_client_modules,
+    get_check_module_path,
+)
+
+EC2_CLIENT = "prowler.providers.aws.services.ec2.ec2_client"
+SSM_CLIENT = "prowler.providers.aws.services.ssm.ssm_client"
+S3_CLIENT = "prowler.providers.aws.services.s3.s3_client"
+S3CONTROL_CLIENT = "prowler.providers.aws.services.s3.s3control_client"
+
+
+class TestServicePrefetcher:
+    def test_get_check_module_path(self):
+        assert (
+            get_check_module_path("aws", "ec2_ami_public")
+            == "prowler.providers.aws.services.ec2.ec2_ami_public.ec2_ami_public"
+        )
+
+    def test_get_check_client_modules(self):
+        assert get_check_client_modules("aws", "ec2_ami_public") == {EC2_CLIENT}
+
+    def test_get_check_client_modules_several_clients(self):
+        assert get_check_client_modules("aws", "ec2_instance_managed_by_ssm") == {
+            EC2_CLIENT,
+            SSM_CLIENT,
+        }
+
+    def test_get_check_client_modules_unknown_check(self):
+        assert get_check_client_modules("aws", "ec2_non_existent_check") == set()
+
+    def test_prefetcher_disabled(self):
+        with mock.patch.object(ServicePrefetcher, "_load_client") as load_client:
+            with ServicePrefetcher(
+                "aws", {"ec2": {"ec2_ami_public"}}, max_workers=None
+            ) as prefetcher:
+                assert prefetcher.client_modules == []
+                prefetcher.wait_for_check("ec2_ami_public")
+            load_client.assert_not_called()
+
+    def test_prefetcher_loads_each_client_once(self):
+        service_checks_to_execute = {
+            "ec2": {"ec2_ami_public", "ec2_instance_managed_by_ssm"},
+            "s3": {"s3_bucket_public_access"},
+        }
+        with (
+            mock.patch("prowler.lib.check.prefetch.importlib.import_module"),
+            mock.patch.object(ServicePrefetcher, "_load_client") as load_client,
+        ):
+            with ServicePrefetcher(
+                "aws", service_checks_to_execute, max_workers=4
+            ) as prefetcher:
+                assert prefetcher.client_modules == [
+                    EC2_CLIENT,
+                    SSM_CLIENT,
+                    S3_CLIENT,
+                    S3CONTROL_CLIENT,
+                ]
+                prefetcher.wait_for_check("ec2_instance_managed_by_ssm")
+                prefetcher.wait_for_check("s3_bucket_public_access")
+
+            assert sorted(call.args[0] for call in load_client.call_args_list) == [
+                EC2_CLIENT,
+                S3_CLIENT,
+                S3CONTROL_CLIENT,
+                SSM_CLIENT,
+            ]
+
+    def test_prefetcher_failed_client_does_not_raise(self):
+        with (
+            mock.patch("prowler.lib.check.prefetch.logger") as logger,
+            mock.patch(
+                "prowler.lib.check.prefetch.importlib.import_module",
+                side_effect=Exception("API error"),
+            ),
+        ):
+            with ServicePrefetcher(
+                "aws", {"ec2": {"ec2_ami_public"}}, max_workers=2
+            ) as prefetcher:
+                prefetcher.wait_for_check("ec2_ami_public")
+            assert logger.error.called
@@ -1081,6 +1081,57 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_api_workers(self):
+        command = [
+            prowler_command,
+            "--aws-api-workers",
+            "50",
+            "--aws-api-workers-per-service",
+            "20",
+            "--aws-api-workers-per-region",
+            "5",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_api_workers == 50
+        assert parsed.aws_api_workers_per_service == 20
+        assert parsed.aws_api_workers_per_region == 5
+
+    def test_aws_parser_api_workers_invalid(self):
+        command = [prowler_command, "--aws-api-workers", "0"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_aws_parser_api_rate_limit(self):
+        command = [prowler_command, "--aws-api-rate-limit", "2.5"]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_api_rate_limit == 2.5
+
+    def test_aws_parser_api_rate_limit_invalid(self):
+        command = [prowler_command, "--aws-api-rate-limit", "0"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
+    def test_aws_parser_api_cache(self):
+        command = [
+            prowler_command,
+            "--aws-api-cache-ttl",
+            "600",
+            "--aws-api-cache-max-size",
+            "100",
+            "--aws-api-cache-file",
+            "/tmp/cache.db",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_api_cache_ttl == 600
+        assert parsed.aws_api_cache_max_size == 100
+        assert parsed.aws_api_cache_file == "/tmp/cache.db"
+
+    def test_aws_parser_api_cache_disabled_by_default(self):
+        parsed = self.parser.parse([prowler_command])
+        assert parsed.aws_api_cache_ttl is None
+
     def test_aws_parser_scan_unused_services(self):
         argument = "--scan-unused-services"
         command = [prowler_command, argument]
@@ -1266,6 +1317,18 @@ class Test_Parser:
         assert parsed.provider == "gcp"
         assert parsed.impersonate_service_account == service_account
 
+    def test_parser_gcp_api_workers(self):
+        command = [prowler_command, "gcp", "--gcp-api-workers", "50"]
+        parsed = self.parser.parse(command)
+        assert parsed.provider == "gcp"
+        assert parsed.gcp_api_workers == 50
+
+    def test_parser_gcp_api_workers_invalid(self):
+        command = [prowler_command, "gcp", "--gcp-api-workers", "0"]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
     def test_parser_kubernetes_auth_kubeconfig_file(self):
         argument = "--kubeconfig-file"
         file = "config"
@@ -0,0 +1,232 @@
+import random
+
+from mock import MagicMock
+
+from prowler.lib.mutelist.matcher import (
+    MutelistMatcher,
+    MutelistPatterns,
+    compile_mutelist_pattern,
+)
+from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+OTHER_ACCOUNT_NUMBER = "210987654321"
+
+CHECKS = [
+    "ec2_ami_public",
+    "ec2_instance_public_ip",
+    "s3_bucket_public_access",
+    "awslambda_function_url_public",
+    "iam_root_mfa_enabled",
+]
+REGIONS = ["us-east-1", "eu-west-1", "eu-south-2", ""]
+RESOURCES = ["i-1234", "i-5678", "prowler-bucket", "test-bucket", "", None]
+TAGS = ["", "environment=dev", "environment=prod | project=prowler", None]
+
+
+def legacy_is_muted(mutelist, account, check, region, resource, tags):
+    # Walk all the accounts of the Mutelist calling is_muted_in_check, as is_muted did before the matcher
+    for muted_account in mutelist.mutelist.get("Accounts", []):
+        if muted_account == account or muted_account == "*":
+            if mutelist.is_muted_in_check(
+                mutelist.mutelist["Accounts"][muted_account]["Checks"],
+                account,
+                check,
+                region,
+                resource,
+                tags,
+            ):
+                return True
+    return False
+
+
+def random_mutelist(randomizer: random.Random, accounts: int, checks: int) -> dict:
+    check_names = CHECKS + ["*", "ec2_*", "lambda_*", "s3", "iam_.*_enabled"]
+    items = ["*", "us-east-1", "eu-*", "i-1234", ".*bucket", "prowler", "[invalid"]
+    tags = ["environment=dev", "project=prowler", "environment=prod", "*"]
+
+    def sample(values):
+        return randomizer.sample(values, randomizer.randint(1, 2))
+
+    mutelist = {"Accounts": {}}
+    for account in [AWS_ACCOUNT_NUMBER, OTHER_ACCOUNT_NUMBER, "*"][:accounts]:
+        account_checks = {}
+        for _ in range(checks):
+            check_info = {"Regions": sample(items), "Resources": sample(items)}
+            if randomizer.random() < 0.5:
+                check_info["Tags"] = sample(tags)
+            if randomizer.random() < 0.3:
+                check_info["Exceptions"] = {
+                    "Accounts": randomizer.choice([[], [OTHER_ACCOUNT_NUMBER]]),
+                    "Regions": randomizer.choice([[], ["eu-west-1"]]),
+                    "Resources": randomizer.choice([[], ["test-bucket", "i-5678"]]),
+                    "Tags": randomizer.choice([[], ["environment=prod"]]),
+                }
+            account_checks[randomizer.choice(check_names)] = check_info
+        mutelist["Accounts"][account] = {"Checks": account_checks}
+    return mutelist
+
+
+class TestMutelistPatterns:
+    def test_compile_mutelist_pattern(self):
+        assert compile_mutelist_pattern("ec2_*").pattern == "ec2_.*"
+        assert compile_mutelist_pattern("ec2_*") is compile_mutelist_pattern("ec2_*")
+
+    def test_match_any(self):
+        patterns = MutelistPatterns(["us-east-1", "eu-*"])
+        assert patterns.match_any("us-east-1")
+        assert patterns.match_any("eu-west-1")
+        assert not patterns.match_any("ap-south-1")
+        assert not patterns.match_any(None)
+        assert not MutelistPatterns([]).match_any("eu-west-1")
+
+    def test_match_any_invalid_pattern(self):
+        patterns = MutelistPatterns(["us-east-1", "[invalid"])
+        # The invalid pattern is only reached when the previous ones do not match
+        assert patterns.match_any("us-east-1")
+        assert not patterns.match_any("eu-west-1")
+
+    def test_match_all(self):
+        patterns = MutelistPatterns(["environment=dev", "project=prowler"])
+        assert patterns.match_all("environment=dev | project=prowler")
+        assert not patterns.match_all("environment=dev")
+        assert MutelistPatterns("*").match_all("")
+
+    def test_match_any_cache(self):
+        patterns = MutelistPatterns(["eu-*"], cache=True)
+        assert patterns.match_any("eu-west-1")
+        assert patterns.match_any("eu-west-1")
+        assert patterns._cache == {"eu-west-1": True}
+
+
+class TestMutelistMatcher:
+    def test_is_muted(self):
+        matcher = MutelistMatcher(
+            {
+                "Accounts": {
+                    AWS_ACCOUNT_NUMBER: {
+                        "Checks": {
+                            "lambda_*": {"Regions": ["*"], "Resources": ["*"]},
+                            "ec2_*": {
+                                "Regions": ["eu-*"],
+                                "Resources": ["i-1234"],
+                                "Tags": ["environment=dev"],
+                            },
+                        }
+                    },
+                    "*": {
+                        "Checks": {
+                            "s3_bucket_public_access": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                                "Exceptions": {"Resources": ["test-bucket"]},
+                            }
+                        }
+                    },
+                }
+            }
+        )
+        assert matcher.is_muted(
+            AWS_ACCOUNT_NUMBER, "awslambda_function_url_public", "us-east-1", "f", ""
+        )
+        assert not matcher.is_muted(
+            OTHER_ACCOUNT_NUMBER, "awslambda_function_url_public", "us-east-1", "f", ""
+        )
+        assert matcher.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "ec2_ami_public",
+            "eu-west-1",
+            "i-1234",
+            "environment=dev",
+        )
+        assert not matcher.is_muted(
+            AWS_ACCOUNT_NUMBER, "ec2_ami_public", "eu-west-1", "i-1234", ""
+        )
+        assert matcher.is_muted(
+            OTHER_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            "eu-west-1",
+            "prowler-bucket",
+            "",
+        )
+        assert not matcher.is_muted(
+            OTHER_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            "eu-west-1",
+            "test-bucket",
+            "",
+        )
+
+    def test_mutelist_matcher_is_recompiled(self):
+        mutelist = AWSMutelist(
+            mutelist_content={
+                "Accounts": {
+                    "*": {"Checks": {"*": {"Regions": ["*"], "Resources": ["*"]}}}
+                }
+            }
+        )
+        matcher = mutelist.matcher
+        assert mutelist.matcher is matcher
+        assert mutelist.is_muted(AWS_ACCOUNT_NUMBER, "ec2_ami_public", "", "ami", "")
+
+        mutelist._mutelist = {"Accounts": {}}
+        assert mutelist.matcher is not matcher
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "ec2_ami_public", "", "ami", ""
+        )
+
+    def test_same_results_as_is_muted_in_check(self):
+        randomizer = random.Random(1234)
+        for _ in range(50):
+            mutelist = AWSMutelist(
+                mutelist_content=random_mutelist(
+                    randomizer,
+                    accounts=randomizer.randint(1, 3),
+                    checks=randomizer.randint(1, 6),
+                )
+            )
+            for account in [AWS_ACCOUNT_NUMBER, OTHER_ACCOUNT_NUMBER]:
+                for check in CHECKS:
+                    for _ in range(10):
+                        finding = (
+                            account,
+                            check,
+                            randomizer.choice(REGIONS),
+                            randomizer.choice(RESOURCES),
+                            randomizer.choice(TAGS),
+                        )
+                        assert mutelist.is_muted(*finding) == legacy_is_muted(
+                            mutelist, *finding
+                        ), (mutelist.mutelist, finding)
+
+    def test_mute_findings_same_results_as_is_finding_muted(self):
+        randomizer = random.Random(4321)
+        tags = [
+            [],
+            [{"Key": "environment", "Value": "dev"}],
+            [
+                {"Key": "environment", "Value": "prod"},
+                {"Key": "project", "Value": "prowler"},
+            ],
+        ]
+        for _ in range(50):
+            mutelist = AWSMutelist(
+                mutelist_content=random_mutelist(
+                    randomizer,
+                    accounts=randomizer.randint(1, 3),
+                    checks=randomizer.randint(1, 6),
+                )
+            )
+            findings = []
+            for _ in range(30):
+                finding = MagicMock()
+                finding.check_metadata.CheckID = randomizer.choice(CHECKS)
+                finding.region = randomizer.choice(REGIONS)
+                finding.resource_id = randomizer.choice(RESOURCES)
+                finding.resource_tags = randomizer.choice(tags)
+                findings.append(finding)
+            for account in [AWS_ACCOUNT_NUMBER, OTHER_ACCOUNT_NUMBER]:
+                mutelist.mute_findings(findings, aws_account_id=account)
+                assert [finding.muted for finding in findings] == [
+                    mutelist.is_finding_muted(finding, account) for finding in findings
+                ], mutelist.mutelist
@@ -7,7 +7,10 @@ from prowler.lib.check.compliance_models import (
     Compliance_Requirement,
 )
 from prowler.lib.check.models import Check_Report, load_check_metadata
-from prowler.lib.outputs.compliance.compliance import get_check_compliance
+from prowler.lib.outputs.compliance.compliance import (
+    build_check_compliance,
+    get_check_compliance,
+)
 
 
 class TestCompliance:
@@ -382,3 +385,47 @@ class TestCompliance:
         assert get_check_compliance(finding, "github", bulk_checks_metadata) == {
             "CIS-1.0": ["1.1.11"],
         }
+
+    def test_get_check_compliance_built_once_per_check(self):
+        check_metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/../fixtures/metadata.json"
+        )
+        check_metadata.Compliance = [
+            Compliance(
+                Framework="CIS",
+                Provider="AWS",
+                Version=version,
+                Description="CIS",
+                Requirements=[
+                    Compliance_Requirement(
+                        Checks=[], Id="2.1.3", Description="", Attributes=[]
+                    )
+                ],
+            )
+            for version in ["1.4", "1.5"]
+        ]
+        finding = Check_Report(metadata=check_metadata.json(), resource={})
+        bulk_checks_metadata = {check_metadata.CheckID: check_metadata}
+
+        with mock.patch(
+            "prowler.lib.outputs.compliance.compliance.build_check_compliance",
+            wraps=build_check_compliance,
+        ) as build_check_compliance_mock:
+            check_compliance = get_check_compliance(
+                finding, "aws", bulk_checks_metadata
+            )
+            other_check_compliance = get_check_compliance(
+                finding, "aws", bulk_checks_metadata
+            )
+            assert build_check_compliance_mock.call_count == 1
+
+            # Every finding gets its own requirements
+            assert check_compliance == other_check_compliance
+            assert check_compliance["CIS-1.4"] is not other_check_compliance["CIS-1.4"]
+
+            # The check's compliance changed
+            check_metadata.Compliance = check_metadata.Compliance[:1]
+            assert get_check_compliance(finding, "aws", bulk_checks_metadata) == {
+                "CIS-1.4": ["2.1.3"]
+            }
+            assert build_check_compliance_mock.call_count == 2
@@ -258,6 +258,69 @@ class TestOCSF:
     def test_batch_write_data_to_file_without_findings(self):
         assert not OCSF([])._file_descriptor
 
+    def test_batch_write_data_to_file_compact(self):
+        mock_file = StringIO()
+        findings = [generate_finding_output(timestamp=datetime.now())]
+
+        output = OCSF(findings)
+        output._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        content = mock_file.read()
+        assert "\n" not in content
+        assert content == json.dumps(
+            json.loads(content), separators=(",", ":"), ensure_ascii=True
+        )
+
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+        findings = [
+            generate_finding_output(
+                resource_uid=f"resource-{index}", timestamp=datetime.now()
+            )
+            for index in range(3)
+        ]
+
+        output = OCSF(findings[:1], from_cli=False)
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file()
+        output._data.clear()
+        output.transform(findings[1:])
+        output.close_file = True
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        assert [
+            finding["resources"][0]["uid"] for finding in json.loads(mock_file.read())
+        ] == ["resource-0", "resource-1", "resource-2"]
+
+    def test_batch_write_data_to_file_json_lines(self):
+        mock_file = StringIO()
+        findings = [
+            generate_finding_output(
+                resource_uid=f"resource-{index}", timestamp=datetime.now()
+            )
+            for index in range(2)
+        ]
+
+        output = OCSF(findings, json_lines=True)
+        output._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        lines = mock_file.read().splitlines()
+        assert len(lines) == 2
+        assert [json.loads(line) for line in lines] == [
+            json.loads(finding.json(exclude_none=True)) for finding in output.data
+        ]
+
     def test_finding_output_cloud_pass_low_muted(self):
         finding_output = generate_finding_output(
             status="PASS",
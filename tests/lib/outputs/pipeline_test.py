@@ -0,0 +1,160 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.pipeline import (
+    OutputPipeline,
+    ReportedFinding,
+    get_compliance_output_class,
+)
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS, CIS_1_4_AWS_NAME
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+
+def generate_check_findings(check_id: str, count: int) -> list:
+    check_findings = []
+    for index in range(count):
+        finding = MagicMock()
+        finding.check_metadata.CheckID = check_id
+        finding.status = "FAIL" if index % 2 else "PASS"
+        finding.muted = index % 3 == 0
+        finding.output = generate_finding_output(
+            status=finding.status,
+            muted=finding.muted,
+            check_id=check_id,
+            resource_uid=f"{check_id}-resource-{index}",
+            resource_name=f"resource-{index}",
+            compliance={"CIS-1.4": ["2.1.3"]},
+            timestamp=datetime(2025, 1, 1),
+        )
+        check_findings.append(finding)
+    return check_findings
+
+
+def generate_output(provider, check_output, output_options):
+    return check_output.output
+
+
+class TestOutputPipeline:
+    def test_get_compliance_output_class(self):
+        assert get_compliance_output_class("aws", "cis_1.4_aws") is AWSCIS
+        assert get_compliance_output_class("aws", "soc2_aws") is GenericCompliance
+        assert get_compliance_output_class("iac", "cis_1.4_aws") is GenericCompliance
+
+    @patch(
+        "prowler.lib.outputs.pipeline.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_write_findings_same_outputs(self, _, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        output_options = MagicMock()
+        output_options.output_directory = str(tmp_path / "pipeline")
+        output_options.output_filename = "prowler-output"
+        (tmp_path / "pipeline" / "compliance").mkdir(parents=True)
+        (tmp_path / "expected" / "compliance").mkdir(parents=True)
+        checks = [
+            generate_check_findings("s3_bucket_default_encryption", 3),
+            [],
+            generate_check_findings("ec2_ami_public", 4),
+        ]
+
+        output_pipeline = OutputPipeline(
+            provider,
+            output_options,
+            ["csv", "json-asff", "json-ocsf", "ndjson-ocsf", "html", CIS_1_4_AWS_NAME],
+            {CIS_1_4_AWS_NAME: CIS_1_4_AWS},
+            keep_asff_findings=True,
+        )
+        for check_findings in checks:
+            output_pipeline.write_findings(check_findings)
+        output_pipeline.close()
+
+        # The same outputs written at once with all the findings
+        finding_outputs = [
+            finding.output for check_findings in checks for finding in check_findings
+        ]
+        stats = extract_findings_statistics(finding_outputs)
+        expected = f"{tmp_path}/expected/prowler-output"
+        CSV(finding_outputs, f"{expected}.csv").batch_write_data_to_file()
+        asff = ASFF(finding_outputs, f"{expected}.asff.json")
+        asff.batch_write_data_to_file()
+        OCSF(finding_outputs, f"{expected}.ocsf.json").batch_write_data_to_file()
+        OCSF(
+            finding_outputs, f"{expected}.ocsf.ndjson", json_lines=True
+        ).batch_write_data_to_file()
+        HTML(finding_outputs, f"{expected}.html").batch_write_data_to_file(
+            provider=provider, stats=stats
+        )
+        AWSCIS(
+            finding_outputs,
+            CIS_1_4_AWS,
+            f"{tmp_path}/expected/compliance/prowler-output_{CIS_1_4_AWS_NAME}.csv",
+        ).batch_write_data_to_file()
+
+        for suffix in [
+            ".csv",
+            ".asff.json",
+            ".ocsf.json",
+            ".ocsf.ndjson",
+            ".html",
+        ]:
+            assert (tmp_path / "pipeline" / f"prowler-output{suffix}").read_text() == (
+                tmp_path / "expected" / f"prowler-output{suffix}"
+            ).read_text(), suffix
+        compliance_file = f"compliance/prowler-output_{CIS_1_4_AWS_NAME}.csv"
+        assert (tmp_path / "pipeline" / compliance_file).read_text() == (
+            tmp_path / "expected" / compliance_file
+        ).read_text()
+        assert (
+            len(
+                json.loads(
+                    (tmp_path / "pipeline" / "prowler-output.ocsf.json").read_text()
+                )
+            )
+            == 7
+        )
+
+        assert output_pipeline.stats == stats
+        assert [
+            output.data for output in output_pipeline.generated_outputs["regular"]
+        ] == [[]] * 5
+        assert output_pipeline.asff_findings == asff.data
+        assert len(output_pipeline.findings) == 7
+        assert all(
+            isinstance(finding, ReportedFinding) for finding in output_pipeline.findings
+        )
+        assert [
+            (finding.check_metadata.CheckID, finding.status, finding.muted)
+            for finding in output_pipeline.findings
+        ] == [
+            (finding.check_metadata.CheckID, finding.status, finding.muted)
+            for check_findings in checks
+            for finding in check_findings
+        ]
+
+    def test_close_without_findings(self, tmp_path):
+        output_options = MagicMock()
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+
+        output_pipeline = OutputPipeline(
+            set_mocked_aws_provider(),
+            output_options,
+            ["csv", "json-ocsf", "html"],
+            {CIS_1_4_AWS_NAME: CIS_1_4_AWS},
+        )
+        output_pipeline.write_findings([])
+        output_pipeline.close()
+
+        assert list(tmp_path.iterdir()) == []
+        assert output_pipeline.stats["findings_count"] == 0
+        assert len(output_pipeline.generated_outputs["regular"]) == 3
+        assert len(output_pipeline.generated_outputs["compliance"]) == 1
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 from mock import MagicMock, patch
 
+import prowler.lib.scan.scan as scan_module
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -392,3 +393,84 @@ class TestScan:
         results = list(scan.scan(custom_checks_metadata))
 
         assert results[0] == (100.0, [])
+
+    @patch("importlib.import_module")
+    def test_scan_with_workers(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(mock_global_provider, checks=checks_to_execute, max_workers=4)
+        results = list(scan.scan({}))
+
+        assert scan.max_workers == 4
+        assert mock_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0] == (100.0, mock_execute.side_effect())
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        mock_logger.error.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_scan_with_snapshot(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        # importlib.import_module is mocked, so the module is patched directly
+        with mock.patch.object(scan_module, "ScanSnapshot") as mock_snapshot_class:
+            mock_snapshot = mock_snapshot_class.return_value
+            mock_snapshot.run_check.side_effect = (
+                lambda check_name, check_module, context, execute_check: execute_check()
+            )
+            scan = Scan(
+                mock_global_provider,
+                checks=checks_to_execute,
+                snapshot_file="scan.snapshot",
+            )
+            results = list(scan.scan({}))
+
+        assert scan.snapshot_file == "scan.snapshot"
+        mock_snapshot_class.assert_called_once_with("scan.snapshot")
+        assert mock_snapshot.run_check.call_count == 1
+        assert mock_snapshot.run_check.call_args.args[0] == "accessanalyzer_enabled"
+        mock_snapshot.save.assert_called_once()
+        assert mock_execute.call_count == 1
+        assert results[0] == (100.0, mock_execute.side_effect())
+        mock_logger.error.assert_not_called()
@@ -0,0 +1,188 @@
+import pickle
+from datetime import datetime
+from types import ModuleType
+from unittest.mock import MagicMock
+
+from pydantic.v1 import BaseModel
+
+from prowler.lib.scan.snapshot import (
+    ScanSnapshot,
+    canonicalize,
+    get_module_clients,
+    is_time_dependent,
+)
+
+
+class Bucket(BaseModel):
+    name: str
+    arn: str
+    region: str
+    tags: list = []
+
+
+class Service:
+    def __init__(self, buckets: list):
+        self.buckets = buckets
+        self.audit_config = {}
+        self.regional_clients = {"eu-west-1": MagicMock()}
+        self._private = MagicMock()
+
+
+class Report:
+    def __init__(self, bucket: Bucket):
+        self.status = "PASS"
+        self.resource = bucket.dict()
+
+
+def get_check_module(service: Service) -> ModuleType:
+    check_module = ModuleType("prowler.providers.aws.services.s3.s3_test.s3_test")
+    check_module.s3_client = service
+    return check_module
+
+
+def get_buckets(number: int = 2) -> list:
+    return [
+        Bucket(
+            name=f"bucket-{index}",
+            arn=f"arn:aws:s3:::bucket-{index}",
+            region="eu-west-1",
+        )
+        for index in range(number)
+    ]
+
+
+class TestScanSnapshot:
+    def test_run_check_reused(self, tmp_path):
+        snapshot_file = str(tmp_path / "scan.snapshot")
+        execute_check = MagicMock(return_value=[Report(get_buckets()[0])])
+
+        snapshot = ScanSnapshot(snapshot_file)
+        reports = snapshot.run_check(
+            "s3_test",
+            get_check_module(Service(get_buckets())),
+            "context",
+            execute_check,
+        )
+        assert reports[0].resource["name"] == "bucket-0"
+        assert snapshot.executed == 1
+        snapshot.save()
+
+        # The same resources in a new scan reuse the previous findings
+        snapshot = ScanSnapshot(snapshot_file)
+        reports = snapshot.run_check(
+            "s3_test",
+            get_check_module(Service(get_buckets())),
+            "context",
+            execute_check,
+        )
+        assert execute_check.call_count == 1
+        assert snapshot.reused == 1
+        assert reports[0].status == "PASS"
+        assert reports[0].resource["arn"] == "arn:aws:s3:::bucket-0"
+
+    def test_run_check_resources_changed(self, tmp_path):
+        snapshot_file = str(tmp_path / "scan.snapshot")
+        execute_check = MagicMock(return_value=[])
+
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot.run_check(
+            "s3_test",
+            get_check_module(Service(get_buckets())),
+            "context",
+            execute_check,
+        )
+        snapshot.save()
+
+        buckets = get_buckets()
+        buckets[1].tags = [{"Key": "Environment", "Value": "Production"}]
+        for service in [Service(buckets), Service(get_buckets(3))]:
+            snapshot = ScanSnapshot(snapshot_file)
+            snapshot.run_check(
+                "s3_test", get_check_module(service), "context", execute_check
+            )
+            assert snapshot.reused == 0
+        assert execute_check.call_count == 3
+
+    def test_run_check_context_changed(self, tmp_path):
+        snapshot_file = str(tmp_path / "scan.snapshot")
+        execute_check = MagicMock(return_value=[])
+
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot.run_check(
+            "s3_test",
+            get_check_module(Service(get_buckets())),
+            "mutelist",
+            execute_check,
+        )
+        snapshot.save()
+
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot.run_check(
+            "s3_test", get_check_module(Service(get_buckets())), "other", execute_check
+        )
+        assert execute_check.call_count == 2
+
+    def test_run_check_time_dependent(self, tmp_path):
+        snapshot_file = str(tmp_path / "scan.snapshot")
+        execute_check = MagicMock(return_value=[])
+        check_module = get_check_module(Service(get_buckets()))
+        check_module.datetime = datetime
+
+        for _ in range(2):
+            snapshot = ScanSnapshot(snapshot_file)
+            snapshot.run_check("s3_test", check_module, "context", execute_check)
+            snapshot.save()
+        assert execute_check.call_count == 2
+
+    def test_save_keeps_checks_not_executed(self, tmp_path):
+        snapshot_file = str(tmp_path / "scan.snapshot")
+        check_module = get_check_module(Service(get_buckets()))
+
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot.run_check("s3_test", check_module, "context", lambda: [])
+        snapshot.save()
+        snapshot = ScanSnapshot(snapshot_file)
+        snapshot.run_check("s3_other_test", check_module, "context", lambda: [])
+        snapshot.save()
+
+        with open(snapshot_file, "rb") as file:
+            assert set(pickle.load(file)["entries"]) == {"s3_test", "s3_other_test"}
+
+    def test_corrupted_snapshot_file(self, tmp_path):
+        snapshot_file = tmp_path / "scan.snapshot"
+        snapshot_file.write_bytes(b"not a snapshot")
+        execute_check = MagicMock(return_value=[])
+
+        snapshot = ScanSnapshot(str(snapshot_file))
+        snapshot.run_check(
+            "s3_test",
+            get_check_module(Service(get_buckets())),
+            "context",
+            execute_check,
+        )
+        execute_check.assert_called_once()
+        snapshot.save()
+        with open(snapshot_file, "rb") as file:
+            assert "s3_test" in pickle.load(file)["entries"]
+
+    def test_get_module_clients(self):
+        service = Service([])
+        check_module = get_check_module(service)
+        check_module.get_client = lambda: None
+        assert get_module_clients([check_module]) == {"s3_client": service}
+
+    def test_is_time_dependent(self):
+        check_module = get_check_module(Service([]))
+        assert not is_time_dependent(check_module)
+        check_module.datetime = datetime
+        assert is_time_dependent(check_module)
+
+    def test_canonicalize(self):
+        assert canonicalize({"b": {2, 1}, "a": datetime(2025, 1, 1)}) == [
+            ("'a'", "2025-01-01T00:00:00"),
+            ("'b'", ["1", "2"]),
+        ]
+        # Reference cycles are not followed
+        service = Service([])
+        service.parent = service
+        assert canonicalize(service)[0] == "Service"
@@ -1,4 +1,4 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import AuditResources, is_resource_filtered
 
 
 class Test_Scan_Filters:
@@ -15,3 +15,53 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_audit_resources(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+                "test_web_acl_id",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test", audit_resources
+        )
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert is_resource_filtered("web_acl", audit_resources)
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+
+    def test_audit_resources_is_filtered(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:s3:::test_bucket",
+                "prefix-arn:aws:s3:::other_bucket",
+                "arn:aws:ssm:eu-west-1:123456789012:document/arn:aws:s3:::bucket",
+            ]
+        )
+        assert audit_resources == [
+            "arn:aws:s3:::test_bucket",
+            "prefix-arn:aws:s3:::other_bucket",
+            "arn:aws:ssm:eu-west-1:123456789012:document/arn:aws:s3:::bucket",
+        ]
+        assert audit_resources.is_filtered("arn:aws:s3:::test")
+        assert audit_resources.is_filtered("arn:aws:s3:::other_bucket")
+        assert audit_resources.is_filtered("arn:aws:s3:::bucket")
+        assert not audit_resources.is_filtered("arn:aws:s3:::test_bucket2")
+
+        # The index follows the resources added to the list
+        audit_resources.append("arn:aws:s3:::test_bucket2")
+        assert audit_resources.is_filtered("arn:aws:s3:::test_bucket2")
+
+    def test_audit_resources_empty(self):
+        audit_resources = AuditResources()
+        assert not audit_resources
+        assert audit_resources == []
+        assert not audit_resources.is_filtered("arn:aws:s3:::test_bucket")
@@ -1,4 +1,5 @@
 import os
+import pickle
 import tempfile
 from datetime import datetime
 from time import mktime
@@ -7,9 +8,11 @@ import pytest
 from mock import patch
 
 from prowler.lib.utils.utils import (
+    SecretsScanner,
     detect_secrets_scan,
     file_exists,
     get_file_permissions,
+    get_secrets_scanner,
     hash_sha512,
     is_owned_by_root,
     open_file,
@@ -17,6 +20,7 @@ from prowler.lib.utils.utils import (
     parse_json_file,
     strip_ansi_codes,
     validate_ip_address,
+    write_pickle_file,
 )
 
 
@@ -102,6 +106,30 @@ class Test_file_exists:
         os.remove(temp_data_file.name)
 
 
+class Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("Unpicklable")
+
+
+class Test_write_pickle_file:
+    def test_write_pickle_file(self, tmp_path):
+        path = tmp_path / "cache" / "data.pickle"
+        write_pickle_file(str(path), {"key": "value"}, prefix=".data_")
+        with open(path, "rb") as file:
+            assert pickle.load(file) == {"key": "value"}
+        assert os.listdir(path.parent) == ["data.pickle"]
+
+    def test_write_pickle_file_error(self, tmp_path):
+        path = tmp_path / "data.pickle"
+        write_pickle_file(str(path), {"key": "value"})
+        # The previous file is kept and the temporary file is removed
+        with pytest.raises(pickle.PicklingError):
+            write_pickle_file(str(path), {"key": Unpicklable()})
+        with open(path, "rb") as file:
+            assert pickle.load(file) == {"key": "value"}
+        assert os.listdir(tmp_path) == ["data.pickle"]
+
+
 class Test_utils_validate_ip_address:
     def test_validate_ip_address(self):
         assert validate_ip_address("88.26.151.198")
@@ -179,6 +207,59 @@ class Test_detect_secrets_scan:
         assert secrets_detected[0]["type"] == "Secret Keyword"
 
 
+class Test_SecretsScanner:
+    def test_get_secrets_scanner_shared(self):
+        assert get_secrets_scanner() is get_secrets_scanner(None, None)
+        assert get_secrets_scanner() is not get_secrets_scanner([".*password"])
+
+    def test_scan_bytes(self):
+        secrets_detected = SecretsScanner().scan(b"user=admin\npassword=password")
+        assert len(secrets_detected) == 1
+        assert secrets_detected[0]["filename"] == "data"
+        assert secrets_detected[0]["line_number"] == 2
+        assert secrets_detected[0]["type"] == "Secret Keyword"
+
+    def test_scan_binary_data(self):
+        assert SecretsScanner().scan(b"\xff\xfepassword=password") is None
+
+    def test_scan_settings_configured_once(self):
+        secrets_scanner = SecretsScanner(excluded_secrets=["^NOT_A_SECRET$"])
+        with patch("prowler.lib.utils.utils.cache_bust") as cache_bust:
+            secrets_scanner.scan("password=password")
+            secrets_scanner.scan("no secrets")
+            assert cache_bust.call_count == 1
+            # Scanning with other settings configures them again
+            SecretsScanner().scan("password=password")
+            secrets_scanner.scan("password=password")
+            assert cache_bust.call_count == 3
+
+    def test_scan_does_not_write_files(self):
+        with patch("tempfile.NamedTemporaryFile") as named_temporary_file:
+            assert SecretsScanner().scan("password=password")
+            named_temporary_file.assert_not_called()
+
+    def test_scan_file_not_found(self):
+        assert SecretsScanner().scan_file("not/a/file.txt") is None
+
+    def test_scan_batch(self):
+        data = ["password=password", "no secrets", "MYSQL_PASSWORD=password"]
+        secrets_detected = SecretsScanner().scan_batch(data)
+        assert len(secrets_detected) == 3
+        assert secrets_detected[0][0]["type"] == "Secret Keyword"
+        assert secrets_detected[1] is None
+        assert secrets_detected[2][0]["type"] == "Secret Keyword"
+
+    def test_scan_batch_processes(self):
+        data = ["password=password", "no secrets", "MYSQL_PASSWORD=password"]
+        secrets_scanner = SecretsScanner()
+        try:
+            assert secrets_scanner.scan_batch(
+                data, processes=2
+            ) == secrets_scanner.scan_batch(data)
+        finally:
+            secrets_scanner.close()
+
+
 class Test_hash_sha512:
     def test_hash_sha512(self):
         assert hash_sha512("test") == "ee26b0dd4"
@@ -16,7 +16,13 @@ from moto import mock_aws
 from pytest import raises
 from tzlocal import get_localzone
 
-from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
+from prowler.lib.scan_filters.scan_filters import AuditResources
+from prowler.providers.aws.aws_provider import (
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    AwsProvider,
+    get_aws_region_for_sts,
+    read_aws_regions_file,
+)
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
@@ -31,6 +37,7 @@ from prowler.providers.aws.exceptions.exceptions import (
 )
 from prowler.providers.aws.lib.arn.models import ARN
 from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
+from prowler.providers.aws.lib.service.worker_pool import set_api_worker_pool
 from prowler.providers.aws.models import (
     AWSAssumeRoleInfo,
     AWSCallerIdentity,
@@ -890,6 +897,41 @@ aws:
 
         assert response == {}
 
+    @mock_aws
+    def test_get_client_shared(self):
+        aws_provider = AwsProvider(regions=[AWS_REGION_EU_WEST_1])
+
+        client = aws_provider.get_client("logs", AWS_REGION_EU_WEST_1)
+
+        assert client.region == AWS_REGION_EU_WEST_1
+        assert aws_provider.get_client("logs", AWS_REGION_EU_WEST_1) is client
+        assert (
+            aws_provider.generate_regional_clients("logs")[AWS_REGION_EU_WEST_1]
+            is client
+        )
+        assert aws_provider.get_client("logs", AWS_REGION_US_EAST_1) is not client
+
+    @mock_aws
+    def test_get_client_config_max_pool_connections(self):
+        aws_provider = AwsProvider(api_max_workers=50)
+
+        config = aws_provider.get_client_config()
+
+        assert config.max_pool_connections == 50
+        assert config.retries == {"max_attempts": 3, "mode": "standard"}
+
+        aws_provider = AwsProvider(api_max_workers=2)
+
+        assert (
+            aws_provider.get_client_config().max_pool_connections
+            == DEFAULT_MAX_POOL_CONNECTIONS
+        )
+        set_api_worker_pool()
+
+    def test_read_aws_regions_file_cached(self):
+        assert read_aws_regions_file() is read_aws_regions_file()
+        assert "ec2" in read_aws_regions_file()["services"]
+
     @mock_aws
     def test_get_default_region(self):
         region = [AWS_REGION_EU_WEST_1]
@@ -993,9 +1035,12 @@ aws:
                 }
             },
         ):
+            # The regions file is cached, so it must be parsed again with the patched data
+            read_aws_regions_file.cache_clear()
             assert aws_provider.get_available_aws_service_regions(
                 "ec2", "aws", {AWS_REGION_US_EAST_1}
             ) == {AWS_REGION_US_EAST_1}
+        read_aws_regions_file.cache_clear()
 
     @mock_aws
     def test_get_available_aws_service_regions_with_all_regions_audited(self):
@@ -1031,9 +1076,12 @@ aws:
                 }
             },
         ):
+            # The regions file is cached, so it must be parsed again with the patched data
+            read_aws_regions_file.cache_clear()
             assert (
                 len(aws_provider.get_available_aws_service_regions("ec2", "aws")) == 17
             )
+        read_aws_regions_file.cache_clear()
 
     @mock_aws
     def test_get_tagged_resources(self):
@@ -1077,6 +1125,7 @@ aws:
 
         tagged_resources = aws_provider.audit_resources
         assert len(tagged_resources) == 2
+        assert isinstance(tagged_resources, AuditResources)
         assert image_arn in tagged_resources
         assert instance_arn in tagged_resources
 
@@ -1094,6 +1143,7 @@ aws:
         )
 
         assert aws_provider.audit_resources == [AWS_ACCOUNT_ARN]
+        assert isinstance(aws_provider.audit_resources, AuditResources)
 
     @mock_aws
     def test_validate_credentials_commercial_partition_with_regions(self):
@@ -1955,3 +1955,68 @@ class TestAWSMutelist:
             "prowler",
             "",
         )
+
+    def test_mute_findings(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["^prowler"],
+                            "Tags": ["environment=dev"],
+                            "Exceptions": {"Resources": ["prowler-excepted"]},
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for region, resource_id, resource_tags in [
+            (AWS_REGION_US_EAST_1, "prowler", [{"Key": "environment", "Value": "dev"}]),
+            (AWS_REGION_US_EAST_1, "prowler", []),
+            (AWS_REGION_US_EAST_1, "test", [{"Key": "environment", "Value": "dev"}]),
+            (
+                AWS_REGION_US_EAST_1,
+                "prowler-excepted",
+                [{"Key": "environment", "Value": "dev"}],
+            ),
+            (AWS_REGION_EU_WEST_1, "prowler", [{"Key": "environment", "Value": "dev"}]),
+        ]:
+            finding = MagicMock()
+            finding.check_metadata.CheckID = "check_test"
+            finding.region = region
+            finding.resource_id = resource_id
+            finding.resource_tags = resource_tags
+            findings.append(finding)
+
+        assert (
+            mutelist.mute_findings(findings, aws_account_id=AWS_ACCOUNT_NUMBER)
+            == findings
+        )
+        assert [finding.muted for finding in findings] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert [finding.muted for finding in findings] == [
+            mutelist.is_finding_muted(finding, AWS_ACCOUNT_NUMBER)
+            for finding in findings
+        ]
+
+    def test_mute_findings_without_mutelist(self):
+        mutelist = AWSMutelist(mutelist_content={})
+
+        finding = MagicMock()
+        finding.check_metadata.CheckID = "check_test"
+        finding.region = AWS_REGION_US_EAST_1
+        finding.resource_id = "prowler"
+        finding.resource_tags = []
+
+        mutelist.mute_findings([finding], aws_account_id=AWS_ACCOUNT_NUMBER)
+
+        assert finding.muted is False
@@ -317,6 +317,9 @@ class TestS3:
     def test_generate_subfolder_name_by_extension_json_ocsf(self):
         assert S3.generate_subfolder_name_by_extension(".ocsf.json") == "json-ocsf"
 
+    def test_generate_subfolder_name_by_extension_ndjson_ocsf(self):
+        assert S3.generate_subfolder_name_by_extension(".ocsf.ndjson") == "ndjson-ocsf"
+
     @mock_aws
     def test_test_connection_S3(self):
         # Create a mock IAM user
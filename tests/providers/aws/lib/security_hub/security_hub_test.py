@@ -12,7 +12,10 @@ from prowler.providers.aws.lib.security_hub.exceptions.exceptions import (
     SecurityHubInvalidRegionError,
     SecurityHubNoEnabledRegionsError,
 )
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    SECURITY_HUB_MAX_BATCH,
+    SecurityHub,
+)
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -410,6 +413,157 @@ class TestSecurityHub:
 
         assert security_hub.batch_send_to_security_hub() == 2
 
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches(self):
+        security_hub = self.get_security_hub_with_regions(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        )
+        sent_findings = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                sent_findings.extend(finding["Id"] for finding in kwarg["Findings"])
+                assert len(kwarg["Findings"]) <= SECURITY_HUB_MAX_BATCH
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        findings = [{"Id": f"finding-{index}"} for index in range(1050)]
+        with patch(
+            "botocore.client.BaseClient._make_api_call", new=mock_batch_import_findings
+        ):
+            assert (
+                security_hub._send_findings_per_region(
+                    {
+                        AWS_REGION_EU_WEST_1: findings,
+                        AWS_REGION_EU_WEST_2: findings[:10],
+                    }
+                )
+                == len(findings) + 10
+            )
+
+        assert sorted(sent_findings) == sorted(
+            [finding["Id"] for finding in findings]
+            + [finding["Id"] for finding in findings[:10]]
+        )
+
+    @patch(
+        "prowler.providers.aws.lib.security_hub.security_hub.SECURITY_HUB_RETRY_DELAY",
+        new=0,
+    )
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches_retries_failed_findings(self, caplog):
+        security_hub = self.get_security_hub_with_regions([AWS_REGION_EU_WEST_1])
+        batches = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                findings_ids = [finding["Id"] for finding in kwarg["Findings"]]
+                batches.append(findings_ids)
+                failed_findings = []
+                if "throttled" in findings_ids and len(batches) == 1:
+                    failed_findings.append(
+                        {
+                            "Id": "throttled",
+                            "ErrorCode": "ThrottlingException",
+                            "ErrorMessage": "Rate exceeded",
+                        }
+                    )
+                if "invalid" in findings_ids:
+                    failed_findings.append(
+                        {
+                            "Id": "invalid",
+                            "ErrorCode": "InvalidInput",
+                            "ErrorMessage": "Finding is not valid",
+                        }
+                    )
+                if "always_throttled" in findings_ids:
+                    failed_findings.append(
+                        {
+                            "Id": "always_throttled",
+                            "ErrorCode": "ThrottlingException",
+                            "ErrorMessage": "Rate exceeded",
+                        }
+                    )
+                return {
+                    "FailedCount": len(failed_findings),
+                    "SuccessCount": len(findings_ids) - len(failed_findings),
+                    "FailedFindings": failed_findings,
+                }
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        findings = [
+            {"Id": "sent"},
+            {"Id": "throttled"},
+            {"Id": "invalid"},
+            {"Id": "always_throttled"},
+        ]
+        with patch(
+            "botocore.client.BaseClient._make_api_call", new=mock_batch_import_findings
+        ):
+            assert (
+                security_hub._send_findings_in_batches(findings, AWS_REGION_EU_WEST_1)
+                == 2
+            )
+
+        # Only the failed findings that can succeed are sent again
+        assert batches == [
+            ["sent", "throttled", "invalid", "always_throttled"],
+            ["throttled", "always_throttled"],
+            ["always_throttled"],
+        ]
+        assert (
+            f"Failed to send 1 findings to AWS Security Hub in region {AWS_REGION_EU_WEST_1} -- InvalidInput -- Finding is not valid"
+            in caplog.text
+        )
+        assert (
+            f"Failed to send 1 findings to AWS Security Hub in region {AWS_REGION_EU_WEST_1} -- ThrottlingException -- Rate exceeded"
+            in caplog.text
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_archive_previous_findings(self):
+        findings = [generate_finding_output(status="FAIL", region=AWS_REGION_EU_WEST_1)]
+        asff = ASFF(findings=findings)
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+            findings=asff.data,
+        )
+        archived_findings = []
+
+        def mock_get_findings(self, operation_name, kwarg):
+            if operation_name == "GetFindings":
+                return {
+                    "Findings": [
+                        {"Id": asff.data[0].Id, "RecordState": "ACTIVE"},
+                        {"Id": "previous-finding", "RecordState": "ACTIVE"},
+                    ]
+                }
+            if operation_name == "BatchImportFindings":
+                archived_findings.extend(kwarg["Findings"])
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_get_findings):
+            assert security_hub.archive_previous_findings() == 1
+
+        assert [finding["Id"] for finding in archived_findings] == ["previous-finding"]
+        assert archived_findings[0]["RecordState"] == "ARCHIVED"
+
+    def get_security_hub_with_regions(self, enabled_regions: list) -> SecurityHub:
+        return SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=enabled_regions,
+        )
+
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_security_hub_test_connection_success(self):
         session_mock = session.Session(region_name=AWS_REGION_EU_WEST_1)
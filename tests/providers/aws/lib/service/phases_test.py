@@ -0,0 +1,218 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from prowler.providers.aws.lib.service.phases import (
+    ServicePhase,
+    ServicePhaseScheduler,
+)
+from prowler.providers.aws.lib.service.worker_pool import APIWorkerPool
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+class RegionalClient:
+    def __init__(self, region):
+        self.region = region
+
+
+class Resource:
+    def __init__(self, name, region):
+        self.name = name
+        self.region = region
+
+
+class FakeService:
+    def __init__(self, regions):
+        self.service = "ec2"
+        self.regional_clients = {region: RegionalClient(region) for region in regions}
+        self.thread_pool = APIWorkerPool(max_workers=4)
+        self.rate_limiter = mock.MagicMock()
+        self.rate_limiter.get_throttles.return_value = 0
+        self.events = []
+        self.events_lock = threading.Lock()
+        self.resources = []
+
+    def record(self, event):
+        with self.events_lock:
+            self.events.append(event)
+
+    def _describe_resources(self, regional_client):
+        # The first region is slow, so the other regions must not wait for it
+        if regional_client.region == AWS_REGION_EU_WEST_1:
+            time.sleep(0.2)
+        self.resources.append(Resource("resource", regional_client.region))
+        self.record(("describe_resources", regional_client.region))
+
+    def _describe_resource_attributes(self, resource):
+        self.record(("describe_resource_attributes", resource.region))
+
+    def _describe_settings(self, regional_client):
+        self.record(("describe_settings", regional_client.region))
+
+
+class TestServicePhaseScheduler:
+    def test_run_phases(self):
+        service = FakeService([AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1])
+        # A resource of a non audited region is processed once every region is loaded
+        service.resources.append(Resource("global", None))
+        ServicePhaseScheduler(
+            service,
+            [
+                ServicePhase(service._describe_resources),
+                ServicePhase(
+                    service._describe_resource_attributes,
+                    service.resources,
+                    depends_on=[service._describe_resources],
+                ),
+                ServicePhase(service._describe_settings),
+            ],
+        ).run()
+        service.thread_pool.shutdown()
+
+        events = service.events
+        assert len(events) == 7
+        # Each region is processed after its own dependencies only
+        assert events.index(
+            ("describe_resources", AWS_REGION_US_EAST_1)
+        ) < events.index(("describe_resource_attributes", AWS_REGION_US_EAST_1))
+        assert events.index(
+            ("describe_resource_attributes", AWS_REGION_US_EAST_1)
+        ) < events.index(("describe_resources", AWS_REGION_EU_WEST_1))
+        assert events.index(
+            ("describe_resources", AWS_REGION_EU_WEST_1)
+        ) < events.index(("describe_resource_attributes", AWS_REGION_EU_WEST_1))
+        assert events.index(
+            ("describe_resources", AWS_REGION_EU_WEST_1)
+        ) < events.index(("describe_resource_attributes", None))
+
+    def test_run_phases_without_regional_clients(self):
+        service = FakeService([])
+        service.resources.append(Resource("global", None))
+        ServicePhaseScheduler(
+            service,
+            [
+                ServicePhase(service._describe_settings),
+                ServicePhase(service._describe_resource_attributes, service.resources),
+            ],
+        ).run()
+        service.thread_pool.shutdown()
+
+        assert service.events == [("describe_resource_attributes", None)]
+
+    def test_phase_named_after_its_call(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        phase = ServicePhase(
+            service._describe_resource_attributes,
+            service.resources,
+            depends_on=[service._describe_resources, "describe_settings"],
+        )
+        assert phase.name == "_describe_resource_attributes"
+        assert phase.depends_on == ["_describe_resources", "describe_settings"]
+
+    def test_duplicated_phase(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        with pytest.raises(ValueError):
+            ServicePhaseScheduler(
+                service,
+                [
+                    ServicePhase(service._describe_settings),
+                    ServicePhase(service._describe_settings),
+                ],
+            )
+
+    def test_unknown_dependency(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        with pytest.raises(ValueError):
+            ServicePhaseScheduler(
+                service,
+                [
+                    ServicePhase(
+                        service._describe_settings,
+                        depends_on=[service._describe_resources],
+                    )
+                ],
+            )
+
+    def test_circular_dependency(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        with pytest.raises(ValueError):
+            ServicePhaseScheduler(
+                service,
+                [
+                    ServicePhase(
+                        service._describe_resources,
+                        depends_on=[service._describe_settings],
+                    ),
+                    ServicePhase(
+                        service._describe_settings,
+                        depends_on=[service._describe_resources],
+                    ),
+                ],
+            )
+
+    def test_lazy_phases(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        scheduler = ServicePhaseScheduler(
+            service,
+            [
+                ServicePhase(service._describe_settings),
+                ServicePhase(
+                    service._describe_resources, attributes={"resources": list}
+                ),
+                ServicePhase(
+                    service._describe_resource_attributes,
+                    "resources",
+                    depends_on=[service._describe_resources],
+                    attributes={"resources": list},
+                ),
+            ],
+        )
+
+        assert scheduler.get_eager_phases() == ["_describe_settings"]
+        assert scheduler.get_lazy_attributes() == {"resources"}
+        assert scheduler.get_attribute_phases("resources") == [
+            "_describe_resources",
+            "_describe_resource_attributes",
+        ]
+
+        scheduler.run(scheduler.get_eager_phases())
+        assert service.events == [("describe_settings", AWS_REGION_US_EAST_1)]
+
+        scheduler.run(scheduler.get_attribute_phases("resources"))
+        service.thread_pool.shutdown()
+        assert service.events == [
+            ("describe_settings", AWS_REGION_US_EAST_1),
+            ("describe_resources", AWS_REGION_US_EAST_1),
+            ("describe_resource_attributes", AWS_REGION_US_EAST_1),
+        ]
+        assert scheduler.get_lazy_attributes() == set()
+
+    def test_lazy_phase_needed_by_eager_phase(self):
+        service = FakeService([AWS_REGION_US_EAST_1])
+        scheduler = ServicePhaseScheduler(
+            service,
+            [
+                ServicePhase(
+                    service._describe_resources, attributes={"resources": list}
+                ),
+                ServicePhase(
+                    service._describe_resource_attributes,
+                    "resources",
+                    depends_on=[service._describe_resources],
+                    attributes={"resources": list},
+                ),
+                ServicePhase(
+                    service._describe_settings, depends_on=[service._describe_resources]
+                ),
+            ],
+        )
+
+        # The phases completing an attribute are run along with the phase loading it
+        assert scheduler.get_eager_phases() == [
+            "_describe_resources",
+            "_describe_resource_attributes",
+            "_describe_settings",
+        ]
+        service.thread_pool.shutdown()
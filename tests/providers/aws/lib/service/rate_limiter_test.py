@@ -0,0 +1,143 @@
+from unittest import mock
+
+from boto3 import client
+from moto import mock_aws
+
+from prowler.providers.aws.lib.service.rate_limiter import (
+    MIN_API_RATE,
+    APIRateLimiter,
+    TokenBucket,
+    get_api_rate_limiter,
+    is_throttling_response,
+    set_api_rate_limiter,
+)
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+def http_response(status_code: int):
+    response = mock.MagicMock()
+    response.status_code = status_code
+    return response
+
+
+THROTTLED_RESPONSE = (
+    http_response(400),
+    {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+)
+SUCCESSFUL_RESPONSE = (http_response(200), {"Reservations": []})
+
+
+class TestTokenBucket:
+    def test_throttle_decreases_rate(self):
+        bucket = TokenBucket(max_rate=8)
+        bucket.on_throttle()
+        assert bucket.rate == 4
+        bucket.on_throttle()
+        assert bucket.rate == 2
+
+    def test_throttle_keeps_min_rate(self):
+        bucket = TokenBucket(max_rate=1)
+        for _ in range(10):
+            bucket.on_throttle()
+        assert bucket.rate == MIN_API_RATE
+
+    def test_success_increases_rate_up_to_max_rate(self):
+        bucket = TokenBucket(max_rate=4)
+        bucket.on_throttle()
+        assert bucket.rate == 2
+        bucket.on_success()
+        assert bucket.rate == 2.5
+        for _ in range(10):
+            bucket.on_success()
+        assert bucket.rate == 4
+
+    def test_acquire_waits_for_tokens(self):
+        bucket = TokenBucket(max_rate=2)
+        with mock.patch(
+            "prowler.providers.aws.lib.service.rate_limiter.time.sleep"
+        ) as sleep:
+            # The bucket starts with one second of tokens
+            bucket.acquire()
+            bucket.acquire()
+            sleep.assert_not_called()
+            with mock.patch(
+                "prowler.providers.aws.lib.service.rate_limiter.time.monotonic",
+                side_effect=[bucket._last_refill, bucket._last_refill + 0.5],
+            ):
+                bucket.acquire()
+            sleep.assert_called_once()
+
+
+class TestAPIRateLimiter:
+    def test_is_throttling_response(self):
+        assert is_throttling_response(THROTTLED_RESPONSE)
+        assert is_throttling_response((http_response(429), {}))
+        assert not is_throttling_response(SUCCESSFUL_RESPONSE)
+        assert not is_throttling_response(
+            (http_response(403), {"Error": {"Code": "AccessDenied"}})
+        )
+        assert not is_throttling_response(None)
+
+    def test_stats_and_adaptive_rate(self):
+        rate_limiter = APIRateLimiter(max_rate=10)
+        event_name = "needs-retry.ec2.DescribeInstances"
+        rate_limiter._after_send(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            event_name=event_name,
+            response=THROTTLED_RESPONSE,
+            attempts=1,
+        )
+        rate_limiter._after_send(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            event_name=event_name,
+            response=SUCCESSFUL_RESPONSE,
+            attempts=2,
+        )
+
+        stats = rate_limiter.get_stats()
+        assert list(stats) == [("ec2", AWS_REGION_US_EAST_1, "DescribeInstances")]
+        assert stats[("ec2", AWS_REGION_US_EAST_1, "DescribeInstances")].requests == 2
+        assert stats[("ec2", AWS_REGION_US_EAST_1, "DescribeInstances")].throttles == 1
+        assert stats[("ec2", AWS_REGION_US_EAST_1, "DescribeInstances")].retries == 1
+        assert rate_limiter.get_throttles("ec2") == 1
+        assert rate_limiter.get_throttles("s3") == 0
+        # Halved by the throttle and raised by the successful retry
+        assert rate_limiter.get_rate("ec2", AWS_REGION_US_EAST_1) == 5.2
+        assert rate_limiter.get_rate("ec2", AWS_REGION_EU_WEST_1) is None
+
+    def test_stats_without_rate_limit(self):
+        rate_limiter = APIRateLimiter()
+        rate_limiter._after_send(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            event_name="needs-retry.ec2.DescribeVpcs",
+            response=THROTTLED_RESPONSE,
+        )
+        assert rate_limiter.get_throttles("ec2") == 1
+        assert rate_limiter.get_rate("ec2", AWS_REGION_US_EAST_1) is None
+
+    @mock_aws
+    def test_register_client(self):
+        rate_limiter = APIRateLimiter(max_rate=100)
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        rate_limiter.register_client(ec2_client, "ec2", AWS_REGION_US_EAST_1)
+        # Registering the same client twice does not count the calls twice
+        rate_limiter.register_client(ec2_client, "ec2", AWS_REGION_US_EAST_1)
+
+        ec2_client.describe_instances()
+        ec2_client.describe_vpcs()
+
+        stats = rate_limiter.get_stats(service="ec2")
+        assert stats[("ec2", AWS_REGION_US_EAST_1, "DescribeInstances")].requests == 1
+        assert stats[("ec2", AWS_REGION_US_EAST_1, "DescribeVpcs")].requests == 1
+        assert rate_limiter.get_stats(service="s3") == {}
+
+    def test_get_and_set_api_rate_limiter(self):
+        new_rate_limiter = set_api_rate_limiter(max_rate=20)
+        assert get_api_rate_limiter() is new_rate_limiter
+        assert new_rate_limiter.max_rate == 20
+
+        # Restore the default rate limiter for the rest of the tests
+        assert set_api_rate_limiter().max_rate is None
@@ -0,0 +1,161 @@
+import os
+import stat
+from datetime import datetime, timezone
+from unittest import mock
+
+from boto3 import client
+from moto import mock_aws
+
+from prowler.providers.aws.lib.service.response_cache import (
+    APIResponseCache,
+    get_api_response_cache,
+    set_api_response_cache,
+)
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+RESPONSE = {
+    "Buckets": [
+        {
+            "Name": "bucket",
+            "CreationDate": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        }
+    ],
+    "Body": b"data",
+}
+
+
+class TestAPIResponseCache:
+    def test_put_and_get(self, tmp_path):
+        response_cache = APIResponseCache(path=str(tmp_path / "cache.db"), ttl=60)
+        response_cache.put(
+            "key",
+            AWS_ACCOUNT_NUMBER,
+            "s3",
+            AWS_REGION_US_EAST_1,
+            "ListBuckets",
+            RESPONSE,
+        )
+        assert response_cache.get("key") == RESPONSE
+        assert response_cache.get("unknown-key") is None
+        response_cache.close()
+
+    def test_persisted_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        response_cache = APIResponseCache(path=path, ttl=60)
+        response_cache.put(
+            "key",
+            AWS_ACCOUNT_NUMBER,
+            "s3",
+            AWS_REGION_US_EAST_1,
+            "ListBuckets",
+            RESPONSE,
+        )
+        response_cache.close()
+
+        response_cache = APIResponseCache(path=path, ttl=60)
+        assert response_cache.get("key") == RESPONSE
+        response_cache.close()
+
+    def test_only_readable_by_owner(self, tmp_path):
+        path = tmp_path / "prowler" / "cache.db"
+        response_cache = APIResponseCache(path=str(path), ttl=60)
+        response_cache.close()
+        assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        # A cache file created with broader permissions is restricted too
+        os.chmod(path, 0o644)
+        response_cache = APIResponseCache(path=str(path), ttl=60)
+        response_cache.close()
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_ttl(self, tmp_path):
+        response_cache = APIResponseCache(path=str(tmp_path / "cache.db"), ttl=60)
+        with mock.patch(
+            "prowler.providers.aws.lib.service.response_cache.time.time",
+            return_value=1000,
+        ):
+            response_cache.put(
+                "key",
+                AWS_ACCOUNT_NUMBER,
+                "s3",
+                AWS_REGION_US_EAST_1,
+                "ListBuckets",
+                RESPONSE,
+            )
+        with mock.patch(
+            "prowler.providers.aws.lib.service.response_cache.time.time",
+            return_value=1059,
+        ):
+            assert response_cache.get("key") == RESPONSE
+        with mock.patch(
+            "prowler.providers.aws.lib.service.response_cache.time.time",
+            return_value=1061,
+        ):
+            assert response_cache.get("key") is None
+        response_cache.close()
+
+    def test_size_eviction(self, tmp_path):
+        response = {"Data": "x" * 100}
+        # Room for two responses
+        response_cache = APIResponseCache(
+            path=str(tmp_path / "cache.db"), ttl=60, max_size=250
+        )
+        for index in range(3):
+            with mock.patch(
+                "prowler.providers.aws.lib.service.response_cache.time.time",
+                return_value=1000 + index,
+            ):
+                response_cache.put(
+                    f"key-{index}",
+                    AWS_ACCOUNT_NUMBER,
+                    "s3",
+                    AWS_REGION_US_EAST_1,
+                    "GetBucketPolicy",
+                    response,
+                )
+        with mock.patch(
+            "prowler.providers.aws.lib.service.response_cache.time.time",
+            return_value=1010,
+        ):
+            assert response_cache.get("key-0") is None
+            assert response_cache.get("key-1") == response
+            assert response_cache.get("key-2") == response
+        response_cache.close()
+
+    @mock_aws
+    def test_register_client(self, tmp_path):
+        response_cache = APIResponseCache(path=str(tmp_path / "cache.db"), ttl=60)
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        response_cache.register_client(
+            s3_client, AWS_ACCOUNT_NUMBER, "s3", AWS_REGION_US_EAST_1
+        )
+        s3_client.create_bucket(Bucket="bucket-1")
+
+        # The first call is sent to AWS and cached, the second one is served from the cache
+        assert [bucket["Name"] for bucket in s3_client.list_buckets()["Buckets"]] == [
+            "bucket-1"
+        ]
+        s3_client.create_bucket(Bucket="bucket-2")
+        assert [bucket["Name"] for bucket in s3_client.list_buckets()["Buckets"]] == [
+            "bucket-1"
+        ]
+        assert response_cache.misses == 1
+        assert response_cache.hits == 1
+
+        # Calls with different parameters are cached separately
+        s3_client.get_bucket_location(Bucket="bucket-2")
+        assert response_cache.misses == 2
+        response_cache.close()
+
+    def test_get_and_set_api_response_cache(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        response_cache = set_api_response_cache(ttl=120, max_size=1, path=path)
+        assert get_api_response_cache() is response_cache
+        assert response_cache.ttl == 120
+        assert response_cache.max_size == 1024 * 1024
+        assert os.path.exists(path)
+
+        # Disable the cache for the rest of the tests
+        assert set_api_response_cache() is None
+        assert get_api_response_cache() is None
@@ -1,5 +1,7 @@
+import pytest
 from mock import patch
 
+from prowler.providers.aws.lib.service.phases import ServicePhase
 from prowler.providers.aws.lib.service.service import AWSService
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
@@ -152,3 +154,88 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_lazy_attributes(self):
+        class LazyService(AWSService):
+            def __init__(self, provider):
+                super().__init__("ec2", provider)
+                self.calls = []
+                self.__threading_call_phases__(
+                    [
+                        ServicePhase(self._describe_instances),
+                        ServicePhase(
+                            self._describe_snapshots, attributes={"snapshots": list}
+                        ),
+                        ServicePhase(
+                            self._describe_snapshot_attributes,
+                            "snapshots",
+                            depends_on=[self._describe_snapshots],
+                            attributes={"snapshots": list},
+                        ),
+                    ]
+                )
+
+            def _describe_instances(self, regional_client):
+                self.calls.append("describe_instances")
+
+            def _describe_snapshots(self, regional_client):
+                self.calls.append("describe_snapshots")
+                self.snapshots.append({"region": regional_client.region})
+
+            def _describe_snapshot_attributes(self, snapshot):
+                self.calls.append("describe_snapshot_attributes")
+                snapshot["public"] = False
+
+        provider = set_mocked_aws_provider()
+        service = LazyService(provider)
+
+        assert service.calls == ["describe_instances"]
+        assert "snapshots" not in vars(service)
+
+        # Every phase loading the attribute runs before it is set
+        assert service.snapshots == [{"region": AWS_REGION_US_EAST_1, "public": False}]
+        loaded_calls = [
+            "describe_instances",
+            "describe_snapshots",
+            "describe_snapshot_attributes",
+        ]
+        assert service.calls == loaded_calls
+
+        service.load_all_attributes()
+        assert service.calls == loaded_calls
+        with pytest.raises(AttributeError):
+            service.unknown_attribute
+
+    def test_AWSService_lazy_attribute_read_by_phase_without_dependency(self):
+        class LazyService(AWSService):
+            def __init__(self, provider):
+                super().__init__("ec2", provider)
+                self.settings = []
+                self.__threading_call_phases__(
+                    [
+                        ServicePhase(
+                            self._describe_volumes, attributes={"volumes": list}
+                        ),
+                        ServicePhase(
+                            self._get_settings, attributes={"settings_read": list}
+                        ),
+                    ]
+                )
+
+            def _describe_volumes(self, regional_client):
+                self.volumes.append({"region": regional_client.region})
+
+            def _get_settings(self, regional_client):
+                try:
+                    self.settings_read.append(len(self.volumes))
+                except AttributeError as error:
+                    self.settings.append(error)
+
+        provider = set_mocked_aws_provider()
+        service = LazyService(provider)
+
+        # The phase fails right away instead of waiting for the attribute it does not depend on
+        assert service.settings_read == []
+        assert len(service.settings) == 1
+        assert "volumes" in str(service.settings[0])
+        assert service.volumes == [{"region": AWS_REGION_US_EAST_1}]
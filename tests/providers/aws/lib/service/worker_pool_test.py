@@ -0,0 +1,110 @@
+import threading
+import time
+
+from prowler.providers.aws.lib.service.worker_pool import (
+    DEFAULT_API_MAX_WORKERS,
+    APIWorkerPool,
+    get_api_worker_pool,
+    set_api_worker_pool,
+)
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def call(self, _):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+
+
+class TestAPIWorkerPool:
+    def test_submit(self):
+        pool = APIWorkerPool(max_workers=2)
+        assert pool.submit(sum, [1, 2, 3]).result() == 6
+        pool.shutdown()
+
+    def test_global_limit(self):
+        pool = APIWorkerPool(max_workers=3)
+        tracker = ConcurrencyTracker()
+        futures = [
+            pool.submit_api_call("ec2", "us-east-1", tracker.call, item)
+            for item in range(12)
+        ]
+        for future in futures:
+            future.result()
+        pool.shutdown()
+        assert tracker.max_running <= 3
+
+    def test_service_limit(self):
+        pool = APIWorkerPool(max_workers=10, max_workers_per_service=2)
+        tracker = ConcurrencyTracker()
+        futures = [
+            pool.submit_api_call("ec2", f"region-{item}", tracker.call, item)
+            for item in range(8)
+        ]
+        for future in futures:
+            future.result()
+        pool.shutdown()
+        assert tracker.max_running <= 2
+
+    def test_region_limit(self):
+        pool = APIWorkerPool(max_workers=10, max_workers_per_region=1)
+        tracker = ConcurrencyTracker()
+        futures = [
+            pool.submit_api_call(f"service-{item}", "us-east-1", tracker.call, item)
+            for item in range(5)
+        ]
+        for future in futures:
+            future.result()
+        pool.shutdown()
+        assert tracker.max_running == 1
+
+    def test_region_limit_unknown_region(self):
+        pool = APIWorkerPool(max_workers=4, max_workers_per_region=1)
+        tracker = ConcurrencyTracker()
+        futures = [
+            pool.submit_api_call("iam", None, tracker.call, item) for item in range(8)
+        ]
+        for future in futures:
+            future.result()
+        pool.shutdown()
+        assert 1 <= tracker.max_running <= 4
+
+    def test_exception_releases_slot(self):
+        pool = APIWorkerPool(max_workers=2, max_workers_per_service=1)
+
+        def fail(_):
+            raise ValueError("API error")
+
+        assert isinstance(
+            pool.submit_api_call("ec2", "us-east-1", fail, None).exception(),
+            ValueError,
+        )
+        # The slot was released so the next call is not blocked
+        assert pool.submit_api_call("ec2", "us-east-1", str, 1).result() == "1"
+        pool.shutdown()
+
+    def test_get_and_set_api_worker_pool(self):
+        default_pool = get_api_worker_pool()
+        assert get_api_worker_pool() is default_pool
+
+        new_pool = set_api_worker_pool(
+            max_workers=20, max_workers_per_service=5, max_workers_per_region=2
+        )
+        assert get_api_worker_pool() is new_pool
+        assert new_pool.max_workers == 20
+        assert new_pool.max_workers_per_service == 5
+        assert new_pool.max_workers_per_region == 2
+
+        # Restore the default pool for the rest of the tests
+        default_pool = set_api_worker_pool()
+        assert default_pool.max_workers == DEFAULT_API_MAX_WORKERS
+        assert not default_pool.max_workers_per_service
+        assert not default_pool.max_workers_per_region
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from boto3 import client
 from moto import mock_aws
 
@@ -216,3 +218,70 @@ class Test_CloudWatch_Service:
         assert logs.log_groups[arn].kms_id == "test_kms_id"
         assert logs.log_groups[arn].region == AWS_REGION_US_EAST_1
         assert logs.log_groups[arn].tags == [{}]
+
+    @mock_aws
+    def test_get_log_events(self):
+        logs_client = client("logs", region_name=AWS_REGION_US_EAST_1)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="clean-stream"
+        )
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream"
+        )
+        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="clean-stream",
+            logEvents=[{"timestamp": timestamp, "message": "non sensitive message"}],
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream",
+            logEvents=[
+                {"timestamp": timestamp + 1, "message": "password = password123"}
+            ],
+        )
+        aws_provider = set_mocked_aws_provider(
+            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"]
+        )
+        arn = f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:log-group:/log-group/test:*"
+        logs = Logs(aws_provider)
+        # Only the log events with secrets are kept
+        assert list(logs.log_groups[arn].log_streams) == ["test-stream"]
+        assert [
+            event["message"]
+            for event in logs.log_groups[arn].log_streams["test-stream"]
+        ] == ["password = password123"]
+
+    @mock_aws
+    def test_get_log_events_max_bytes(self):
+        logs_client = client("logs", region_name=AWS_REGION_US_EAST_1)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="clean-stream"
+        )
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream"
+        )
+        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="clean-stream",
+            logEvents=[{"timestamp": timestamp, "message": "non sensitive message"}],
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream",
+            logEvents=[
+                {"timestamp": timestamp + 1, "message": "password = password123"}
+            ],
+        )
+        aws_provider = set_mocked_aws_provider(
+            audit_config={"secrets_log_events_max_bytes": 30},
+            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+        )
+        arn = f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:log-group:/log-group/test:*"
+        logs = Logs(aws_provider)
+        # The event with the secret is beyond the bytes to scan
+        assert logs.log_groups[arn].log_streams == {}
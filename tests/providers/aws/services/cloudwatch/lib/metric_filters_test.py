@@ -0,0 +1,101 @@
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Trail
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
+    LogGroup,
+    MetricAlarm,
+    MetricFilter,
+)
+from prowler.providers.aws.services.cloudwatch.lib.metric_filters import (
+    MetricFilterIndex,
+    get_metric_filter_index,
+)
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+ROOT_USAGE_PATTERN = r"\$\.userIdentity\.type\s*=\s*.?Root.+\$\.userIdentity\.invokedBy NOT EXISTS.+\$\.eventType\s*!=\s*.?AwsServiceEvent.?"
+ROOT_USAGE_FILTER_PATTERN = '{ $.userIdentity.type = "Root" && $.userIdentity.invokedBy NOT EXISTS && $.eventType != "AwsServiceEvent" }'
+
+
+def log_group(name):
+    return LogGroup(
+        arn=f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:log-group:{name}",
+        name=name,
+        retention_days=1,
+        never_expire=False,
+        kms_id=None,
+        region=AWS_REGION_US_EAST_1,
+    )
+
+
+def metric_filter(name, group, pattern, metric):
+    return MetricFilter(
+        arn=f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:metric-filter/{name}",
+        name=name,
+        metric=metric,
+        pattern=pattern,
+        log_group=group,
+        region=AWS_REGION_US_EAST_1,
+    )
+
+
+class TestMetricFilterIndex:
+    def setup_method(self):
+        trail_log_group = log_group("trail-log-group")
+        self.trails = {
+            "trail": Trail(
+                name="trail",
+                region=AWS_REGION_US_EAST_1,
+                log_group_arn=f"{trail_log_group.arn}:*",
+            )
+        }
+        self.metric_filters = [
+            metric_filter(
+                "other-log-group",
+                log_group("other-log-group"),
+                ROOT_USAGE_FILTER_PATTERN,
+                "other-metric",
+            ),
+            metric_filter("no-log-group", None, ROOT_USAGE_FILTER_PATTERN, "metric"),
+            metric_filter(
+                "root-usage", trail_log_group, ROOT_USAGE_FILTER_PATTERN, "root-metric"
+            ),
+            metric_filter("other-pattern", trail_log_group, "pattern", "metric"),
+        ]
+        self.metric_alarms = [
+            MetricAlarm(
+                arn=f"arn:aws:cloudwatch:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:alarm:root-usage",
+                name="root-usage",
+                metric="root-metric",
+                region=AWS_REGION_US_EAST_1,
+                alarm_actions=[],
+                actions_enabled=True,
+            )
+        ]
+
+    def test_get_metric_filters(self):
+        index = MetricFilterIndex(self.trails, self.metric_filters, self.metric_alarms)
+
+        assert [
+            metric_filter.name
+            for metric_filter in index.get_metric_filters(ROOT_USAGE_PATTERN)
+        ] == ["root-usage"]
+        assert index.get_metric_filters("unknown") == []
+
+    def test_has_alarm(self):
+        index = MetricFilterIndex(self.trails, self.metric_filters, self.metric_alarms)
+
+        assert index.has_alarm(self.metric_filters[2])
+        assert not index.has_alarm(self.metric_filters[3])
+
+    def test_get_metric_filter_index_reused(self):
+        index = get_metric_filter_index(
+            self.trails, self.metric_filters, self.metric_alarms
+        )
+
+        assert (
+            get_metric_filter_index(
+                self.trails, self.metric_filters, self.metric_alarms
+            )
+            is index
+        )
+        assert (
+            get_metric_filter_index(self.trails, self.metric_filters, []) is not index
+        )
@@ -1,5 +1,6 @@
 import ipaddress
 import re
+import threading
 from base64 import b64decode, b64encode
 from datetime import datetime
 
@@ -58,6 +59,10 @@ def mock_make_api_call(self, operation_name, kwarg):
                 }
             ]
         }
+    if operation_name == "GetSnapshotBlockPublicAccessState":
+        return {"State": "block-all-sharing"}
+    if operation_name == "GetInstanceMetadataDefaults":
+        return {"AccountLevel": {"HttpTokens": "required"}}
     return make_api_call(self, operation_name, kwarg)
 
 
@@ -805,3 +810,33 @@ class Test_EC2_Service:
         )
         assert ec2.transit_gateways[transit_arn].auto_accept_shared_attachments
         assert ec2.transit_gateways[transit_arn].region == AWS_REGION_US_EAST_1
+
+    # Test EC2 lazy attributes are loaded on their first read
+    @mock_aws
+    @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_lazy_attributes(self):
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        lazy_attributes = sorted(EC2(aws_provider)._lazy_attributes)
+        assert "ebs_encryption_by_default" in lazy_attributes
+        assert "ebs_block_public_access_snapshots_states" in lazy_attributes
+        assert "instance_metadata_defaults" in lazy_attributes
+
+        for attribute in lazy_attributes:
+            # Each attribute is read first on a new service, in a thread so a deadlock fails the test
+            ec2 = EC2(aws_provider)
+            values = []
+            reader = threading.Thread(
+                target=lambda: values.append(getattr(ec2, attribute)), daemon=True
+            )
+            reader.start()
+            reader.join(timeout=30)
+            assert not reader.is_alive(), f"Reading {attribute} did not finish"
+            assert attribute in vars(ec2)
+            assert values == [vars(ec2)[attribute]]
+
+        # The account settings have one result per region
+        assert len(ec2.ebs_encryption_by_default) == 2
+        assert len(ec2.ebs_block_public_access_snapshots_states) == 2
+        assert len(ec2.instance_metadata_defaults) == 2
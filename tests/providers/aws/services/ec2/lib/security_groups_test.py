@@ -1,6 +1,7 @@
 import pytest
 
 from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupExposure,
     _is_cidr_public,
     check_security_group,
 )
@@ -390,3 +391,110 @@ class Test_check_security_group:
             port, port, TRANSPORT_PROTOCOL_ALL, [], [IP_V6_ALL_CIDRS]
         )
         assert check_security_group(ingress_rule, TRANSPORT_PROTOCOL_ALL, None, True)
+
+
+class Test_SecurityGroupExposure:
+    def ingress_rule_generator(
+        self,
+        from_port: int,
+        to_port: int,
+        ip_protocol: str,
+        input_ipv4_ranges: [str],
+        input_ipv6_ranges: [str],
+    ):
+        return {
+            "FromPort": from_port,
+            "ToPort": to_port,
+            "IpProtocol": ip_protocol,
+            "IpRanges": [{"CidrIp": ip} for ip in input_ipv4_ranges],
+            "Ipv6Ranges": [{"CidrIpv6": ip} for ip in input_ipv6_ranges],
+        }
+
+    def test_no_ingress_rules(self):
+        exposure = SecurityGroupExposure([])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_ALL, None)
+        assert not exposure.is_open_from_private(TRANSPORT_PROTOCOL_TCP, [22])
+
+    def test_port_ranges_merged(self):
+        exposure = SecurityGroupExposure(
+            [
+                self.ingress_rule_generator(
+                    20, 22, TRANSPORT_PROTOCOL_TCP, [IP_V4_ALL_CIDRS], []
+                ),
+                self.ingress_rule_generator(
+                    23, 25, TRANSPORT_PROTOCOL_TCP, [], [IP_V6_ALL_CIDRS]
+                ),
+                self.ingress_rule_generator(
+                    3306, 3306, TRANSPORT_PROTOCOL_TCP, [IP_V4_ALL_CIDRS], []
+                ),
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [24], any_address=True)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [80, 3306], any_address=True)
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [19, 26], any_address=True)
+        assert not exposure.is_open("udp", [22], any_address=True)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, None, any_address=True)
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [], any_address=True)
+
+    def test_public_and_private_sources(self):
+        exposure = SecurityGroupExposure(
+            [
+                self.ingress_rule_generator(
+                    22, 22, TRANSPORT_PROTOCOL_TCP, [IP_V4_PUBLIC_CIDR], []
+                ),
+                self.ingress_rule_generator(
+                    5432, 5432, TRANSPORT_PROTOCOL_TCP, [IP_V4_PRIVATE_CIDR], []
+                ),
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [5432])
+        assert exposure.is_open_from_private(TRANSPORT_PROTOCOL_TCP, [5432])
+        assert not exposure.is_open_from_private(TRANSPORT_PROTOCOL_TCP, [22])
+
+    def test_all_ports_open(self):
+        exposure = SecurityGroupExposure(
+            [
+                self.ingress_rule_generator(
+                    0, 65535, "udp", [IP_V4_ALL_CIDRS], [IP_V6_ALL_CIDRS]
+                )
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [], any_address=True)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+
+    def test_all_traffic_open(self):
+        exposure = SecurityGroupExposure(
+            [
+                {
+                    "IpProtocol": TRANSPORT_PROTOCOL_ALL,
+                    "IpRanges": [{"CidrIp": IP_V4_ALL_CIDRS}],
+                    "Ipv6Ranges": [],
+                }
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_ALL, any_address=True)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+
+    def test_same_result_as_check_security_group(self):
+        ingress_rules = [
+            self.ingress_rule_generator(
+                21, 23, TRANSPORT_PROTOCOL_TCP, [IP_V4_PUBLIC_CIDR], []
+            ),
+            self.ingress_rule_generator(
+                -1, -1, "icmp", [IP_V4_ALL_CIDRS], [IP_V6_PRIVATE_CIDR]
+            ),
+            self.ingress_rule_generator(
+                8080, 8088, TRANSPORT_PROTOCOL_TCP, [], [IP_V6_PUBLIC_CIDR]
+            ),
+        ]
+        exposure = SecurityGroupExposure(ingress_rules)
+        for protocol in [TRANSPORT_PROTOCOL_TCP, TRANSPORT_PROTOCOL_ALL, "icmp"]:
+            for ports in [None, [], [-1], [22], [8085, 9000], [24]]:
+                for any_address in [True, False]:
+                    assert exposure.is_open(protocol, ports, any_address) == any(
+                        check_security_group(ingress_rule, protocol, ports, any_address)
+                        for ingress_rule in ingress_rules
+                    )
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from py_iam_expand.actions import InvalidActionHandling, expand_actions
+
+from prowler.providers.aws.services.iam.lib.actions import (
+    ActionIndex,
+    get_action_index,
+)
+
+
+class Test_ActionIndex:
+    def test_get_action_index_built_once(self):
+        assert get_action_index() is get_action_index()
+
+    def test_all_actions(self):
+        action_index = get_action_index()
+        assert action_index.to_actions(action_index.all_actions) == set(
+            expand_actions("*", InvalidActionHandling.REMOVE)
+        )
+
+    def test_expand(self):
+        action_index = get_action_index()
+        assert action_index.to_actions(action_index.expand("s3:Get*")) == set(
+            expand_actions("s3:Get*", InvalidActionHandling.REMOVE)
+        )
+
+    def test_expand_invalid_pattern(self):
+        action_index = get_action_index()
+        assert action_index.expand("invalidservice:*") == 0
+
+    def test_expand_memoized(self):
+        action_index = ActionIndex()
+        with patch(
+            "prowler.providers.aws.services.iam.lib.actions.expand_actions",
+            return_value=["s3:GetObject"],
+        ) as expand_actions_mock:
+            assert action_index.expand("s3:GetObjec?") == action_index.expand(
+                "s3:GetObjec?"
+            )
+        expand_actions_mock.assert_called_once_with(
+            "s3:GetObjec?", InvalidActionHandling.REMOVE
+        )
+
+    def test_expand_patterns(self):
+        action_index = get_action_index()
+        bitset = action_index.expand_patterns(["s3:GetObject", "iam:PassRole"])
+        assert action_index.to_actions(bitset) == {"s3:GetObject", "iam:PassRole"}
+        assert action_index.expand_patterns([]) == 0
+
+    def test_bitwise_operations(self):
+        action_index = get_action_index()
+        s3_actions = action_index.expand("s3:*")
+        s3_get_actions = action_index.expand("s3:Get*")
+
+        assert not s3_get_actions & ~s3_actions
+        assert action_index.to_actions(s3_actions & ~s3_get_actions) == set(
+            expand_actions("s3:*", InvalidActionHandling.REMOVE)
+        ) - set(expand_actions("s3:Get*", InvalidActionHandling.REMOVE))
+
+    def test_from_actions_not_indexed(self):
+        action_index = ActionIndex()
+        bitset = action_index.from_actions(["s3:GetObject", "unknown:Action"])
+        assert bitset & ~action_index.all_actions
+        assert action_index.to_actions(bitset) == {"s3:GetObject", "unknown:Action"}
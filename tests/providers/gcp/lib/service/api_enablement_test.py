@@ -0,0 +1,124 @@
+from threading import Thread
+from unittest.mock import MagicMock, patch
+
+from prowler.providers.gcp.lib.service.api_enablement import (
+    APIEnablementCache,
+    get_api_enablement_cache,
+    get_service_usage_client,
+    reset_api_enablement_cache,
+)
+from tests.providers.gcp.gcp_fixtures import GCP_PROJECT_ID
+
+
+def mock_service_usage_client(pages: list) -> MagicMock:
+    client = MagicMock()
+    requests = [MagicMock() for _ in pages]
+    for request, page in zip(requests, pages):
+        request.execute.return_value = page
+    client.services().list.return_value = requests[0]
+    client.services().list_next.side_effect = requests[1:] + [None]
+    return client
+
+
+class TestAPIEnablementCache:
+    def test_get_api_state_listed_once(self):
+        client = mock_service_usage_client(
+            [
+                {
+                    "services": [
+                        {
+                            "name": f"projects/{GCP_PROJECT_ID}/services/compute.googleapis.com"
+                        }
+                    ]
+                },
+                {
+                    "services": [
+                        {
+                            "name": f"projects/{GCP_PROJECT_ID}/services/iam.googleapis.com"
+                        }
+                    ]
+                },
+            ]
+        )
+        api_enablement_cache = APIEnablementCache()
+        with patch(
+            "prowler.providers.gcp.lib.service.api_enablement.get_service_usage_client",
+            return_value=client,
+        ):
+            assert (
+                api_enablement_cache.get_api_state(None, GCP_PROJECT_ID, "compute")
+                == "ENABLED"
+            )
+            assert (
+                api_enablement_cache.get_api_state(None, GCP_PROJECT_ID, "iam")
+                == "ENABLED"
+            )
+            assert (
+                api_enablement_cache.get_api_state(None, GCP_PROJECT_ID, "dataproc")
+                == "DISABLED"
+            )
+        client.services().list.assert_called_once_with(
+            parent=f"projects/{GCP_PROJECT_ID}", filter="state:ENABLED", pageSize=200
+        )
+        client.services().get.assert_not_called()
+
+    def test_get_api_state_list_not_allowed(self):
+        client = MagicMock()
+        client.services().list().execute.side_effect = Exception("Permission denied")
+        client.services().get().execute.return_value = {"state": "DISABLED"}
+        api_enablement_cache = APIEnablementCache()
+        with patch(
+            "prowler.providers.gcp.lib.service.api_enablement.get_service_usage_client",
+            return_value=client,
+        ):
+            assert (
+                api_enablement_cache.get_api_state(None, GCP_PROJECT_ID, "compute")
+                == "DISABLED"
+            )
+        client.services().get.assert_called_with(
+            name=f"projects/{GCP_PROJECT_ID}/services/compute.googleapis.com"
+        )
+
+    def test_get_api_state_concurrent(self):
+        client = mock_service_usage_client([{"services": []}])
+        api_enablement_cache = APIEnablementCache()
+        with patch(
+            "prowler.providers.gcp.lib.service.api_enablement.get_service_usage_client",
+            return_value=client,
+        ):
+            threads = [
+                Thread(
+                    target=api_enablement_cache.get_api_state,
+                    args=(None, GCP_PROJECT_ID, "compute"),
+                )
+                for _ in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        client.services().list().execute.assert_called_once()
+
+    def test_reset_api_enablement_cache(self):
+        api_enablement_cache = get_api_enablement_cache()
+        assert reset_api_enablement_cache() is not api_enablement_cache
+        assert get_api_enablement_cache() is not api_enablement_cache
+
+    def test_get_service_usage_client_per_thread(self):
+        credentials = MagicMock()
+        with patch(
+            "prowler.providers.gcp.lib.service.api_enablement.discovery.build",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ) as build_mock:
+            client = get_service_usage_client(credentials)
+            assert get_service_usage_client(credentials) is client
+            clients = []
+            thread = Thread(
+                target=lambda: clients.append(get_service_usage_client(credentials))
+            )
+            thread.start()
+            thread.join()
+            assert clients[0] is not client
+            # Other credentials build another client
+            assert get_service_usage_client(MagicMock()) is not client
+        assert build_mock.call_count == 3
@@ -0,0 +1,76 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from prowler.providers.gcp.lib.service.service import GCPService
+from prowler.providers.gcp.lib.service.worker_pool import (
+    DEFAULT_API_MAX_WORKERS,
+    get_api_worker_pool,
+    set_api_worker_pool,
+)
+from tests.providers.gcp.gcp_fixtures import set_mocked_gcp_provider
+
+
+def get_gcp_service(project_ids: list) -> GCPService:
+    with patch(
+        "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+        return_value=MagicMock(),
+    ):
+        return GCPService("compute", set_mocked_gcp_provider(project_ids))
+
+
+class TestGCPService:
+    def test_is_api_active(self):
+        api_enablement_cache = MagicMock()
+        api_enablement_cache.get_api_state.side_effect = (
+            lambda credentials, project_id, service: (
+                "DISABLED" if project_id == "project-2" else "ENABLED"
+            )
+        )
+        with patch(
+            "prowler.providers.gcp.lib.service.service.get_api_enablement_cache",
+            return_value=api_enablement_cache,
+        ):
+            service = get_gcp_service(["project-1", "project-2", "project-3"])
+        assert service.project_ids == ["project-1", "project-3"]
+        assert api_enablement_cache.get_api_state.call_count == 3
+
+    def test_is_api_active_error(self):
+        api_enablement_cache = MagicMock()
+        api_enablement_cache.get_api_state.side_effect = Exception("Forbidden")
+        with patch(
+            "prowler.providers.gcp.lib.service.service.get_api_enablement_cache",
+            return_value=api_enablement_cache,
+        ):
+            service = get_gcp_service(["project-1"])
+        assert service.project_ids == []
+
+    def test_threading_call_bounded(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__is_api_active__",
+            side_effect=lambda project_ids: project_ids,
+        ):
+            service = get_gcp_service(["project-1"])
+        lock = threading.Lock()
+        calls = {"running": 0, "max_running": 0, "values": []}
+
+        def call(value):
+            with lock:
+                calls["running"] += 1
+                calls["max_running"] = max(calls["max_running"], calls["running"])
+                calls["values"].append(value)
+            time.sleep(0.01)
+            with lock:
+                calls["running"] -= 1
+
+        set_api_worker_pool(max_workers=3)
+        try:
+            service.__threading_call__(call, range(12))
+        finally:
+            set_api_worker_pool()
+        assert sorted(calls["values"]) == list(range(12))
+        assert calls["max_running"] <= 3
+
+    def test_get_api_worker_pool(self):
+        assert get_api_worker_pool() is get_api_worker_pool()
+        assert get_api_worker_pool()._max_workers == DEFAULT_API_MAX_WORKERS
@@ -0,0 +1,129 @@
+"""
+Benchmark of the Mutelist matcher against the previous evaluation, which walks every account
+and check of the Mutelist calling is_muted_in_check for every finding.
+
+Usage:
+    python -m util.benchmark_mutelist --findings 100000 --rules 5000 --legacy-findings 1000
+
+The previous evaluation is too slow to run over all the findings, so it is measured over the first
+--legacy-findings findings and extrapolated. Both evaluations are checked to return the same results.
+"""
+
+import argparse
+import random
+import time
+
+from prowler.lib.mutelist.mutelist import Mutelist
+
+ACCOUNTS = [f"{account:012d}" for account in range(1, 21)]
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-south-1"]
+SERVICES = ["ec2", "s3", "iam", "rds", "awslambda", "cloudtrail", "kms", "vpc"]
+CHECKS = [f"{service}_check_{index}" for service in SERVICES for index in range(60)]
+
+
+class BenchmarkMutelist(Mutelist):
+    def is_finding_muted(self) -> bool:
+        raise NotImplementedError
+
+
+def legacy_is_muted(mutelist, account, check, region, resource, tags) -> bool:
+    for muted_account in mutelist.mutelist.get("Accounts", []):
+        if muted_account == account or muted_account == "*":
+            if mutelist.is_muted_in_check(
+                mutelist.mutelist["Accounts"][muted_account]["Checks"],
+                account,
+                check,
+                region,
+                resource,
+                tags,
+            ):
+                return True
+    return False
+
+
+def generate_mutelist(randomizer: random.Random, rules: int) -> dict:
+    mutelist = {"Accounts": {}}
+    index = 0
+    while index < rules:
+        account = randomizer.choice(ACCOUNTS + ["*"])
+        service = randomizer.choice(SERVICES)
+        check = randomizer.choice(
+            CHECKS + [f"{service}_*", f"{service.replace('awslambda', 'lambda')}_.*"]
+        )
+        checks = mutelist["Accounts"].setdefault(account, {"Checks": {}})["Checks"]
+        if check in checks:
+            continue
+        rule = {
+            "Regions": randomizer.choice([["*"], randomizer.sample(REGIONS, 2)]),
+            "Resources": randomizer.choice(
+                [["*"]]
+                + [[f"resource-{index}-*", f"arn:aws:{service}:.*:{index}$"]] * 9
+            ),
+        }
+        if randomizer.random() < 0.2:
+            rule["Tags"] = [f"team=team-{randomizer.randint(1, 50)}"]
+        if randomizer.random() < 0.1:
+            rule["Exceptions"] = {"Regions": [randomizer.choice(REGIONS)]}
+        checks[check] = rule
+        index += 1
+    return mutelist
+
+
+def generate_findings(randomizer: random.Random, findings: int, rules: int) -> list:
+    return [
+        (
+            randomizer.choice(ACCOUNTS),
+            randomizer.choice(CHECKS),
+            randomizer.choice(REGIONS),
+            f"resource-{randomizer.randint(0, rules * 2)}-abc",
+            randomizer.choice(["", f"team=team-{randomizer.randint(1, 50)}"]),
+        )
+        for _ in range(findings)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Mutelist matcher")
+    parser.add_argument("--findings", type=int, default=100000)
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--legacy-findings", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    randomizer = random.Random(args.seed)
+    mutelist = BenchmarkMutelist(
+        mutelist_content=generate_mutelist(randomizer, args.rules)
+    )
+    findings = generate_findings(randomizer, args.findings, args.rules)
+
+    start = time.perf_counter()
+    mutelist.matcher
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [mutelist.is_muted(*finding) for finding in findings]
+    matcher_time = time.perf_counter() - start
+
+    legacy_findings = findings[: args.legacy_findings]
+    start = time.perf_counter()
+    legacy_results = [
+        legacy_is_muted(mutelist, *finding) for finding in legacy_findings
+    ]
+    legacy_time = time.perf_counter() - start
+    legacy_total_time = legacy_time * len(findings) / max(len(legacy_findings), 1)
+
+    assert results[: len(legacy_results)] == legacy_results, "Different results"
+
+    print(f"Mutelist rules: {args.rules}, findings: {len(findings)}")
+    print(f"Muted findings: {sum(results)}")
+    print(f"Matcher compilation: {compile_time:.2f}s")
+    print(f"Matcher: {matcher_time:.2f}s")
+    print(
+        f"Previous evaluation: {legacy_time:.2f}s for {len(legacy_findings)} findings, "
+        f"{legacy_total_time:.2f}s estimated for {len(findings)} findings"
+    )
+    print(f"Speedup: {legacy_total_time / max(matcher_time + compile_time, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()